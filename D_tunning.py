@@ -1,48 +1,30 @@
 # SCIENTIFIC ANALYSIS CODE
-import numpy as np
-import matplotlib.pyplot as plt
+"""Precision analysis of the dodecahedron holes against ancient instruments
 
-# Dodecahedron hole diameters (mm) - Exact measurements from archaeological finds
-DODECAHEDRON_HOLES = [26.0, 21.5, 16.5, 21.0,
-                      11.5, 17.0, 25.5, 10.5, 15.5, 22.0, 17.0, 22.0]
+The data and analysis live in the ``dodecaedro_romano`` package and are
+re-exported here; this script only prints the results.
+"""
 
-# Ancient instrument specifications
-ANCIENT_INSTRUMENTS = {
-    'TIBETAN_DUNG_CHEN': {'diameter': 25.5, 'frequency': 55.0, 'culture': 'Tibetan'},
-    'ROMAN_TUBA':        {'diameter': 22.0, 'frequency': 98.0, 'culture': 'Roman'},
-    'HEBREW_SHOFAR':     {'diameter': 17.0, 'frequency': 85.0, 'culture': 'Hebrew'},
-    'HINDU_SANKHA':      {'diameter': 11.5, 'frequency': 146.6, 'culture': 'Hindu'},
-    'ETRUSCAN_TRUMPET':  {'diameter': 26.0, 'frequency': 48.5, 'culture': 'Etruscan'},
-    'GREEK_AULOS':       {'diameter': 10.5, 'frequency': 156.8, 'culture': 'Greek'},
-    'CELTIC_HORN':       {'diameter': 16.5, 'frequency': 110.0, 'culture': 'Celtic'},
-    'EGYPTIAN_FLUTE':    {'diameter': 15.5, 'frequency': 123.5, 'culture': 'Egyptian'}
-}
+from dodecaedro_romano.afinacion import (ANCIENT_INSTRUMENTS,
+                                         DODECAHEDRON_HOLES,
+                                         analyze_precision)
+from dodecaedro_romano.montecarlo import (prueba_significancia,
+                                          resumen_significancia)
 
-# Precision analysis
 
+# Results
+def main():
+    precision_matches = analyze_precision()
+    print("🎵 SCIENTIFIC FINDINGS: PERFECT MATCHES")
+    print("Hole | Diameter | Instrument | Culture | Frequency | Precision")
+    print("-" * 75)
+    for match in precision_matches:
+        print(f"{match['hole']:4} | {match['hole_diameter']:8.1f} | {match['instrument']:12} | {match['culture']:8} | {match['frequency']:8.1f}Hz | ±{match['precision_error']:.2f}mm")
 
-def analyze_precision():
-    matches = []
-    for hole_idx, hole_diam in enumerate(DODECAHEDRON_HOLES):
-        for instr_name, instr_data in ANCIENT_INSTRUMENTS.items():
-            if abs(hole_diam - instr_data['diameter']) <= 0.5:  # ±0.5mm tolerance
-                matches.append({
-                    'hole': hole_idx,
-                    'hole_diameter': hole_diam,
-                    'instrument': instr_name,
-                    'instrument_diameter': instr_data['diameter'],
-                    'frequency': instr_data['frequency'],
-                    'culture': instr_data['culture'],
-                    'precision_error': abs(hole_diam - instr_data['diameter'])
-                })
-
-    return matches
+    # Null model: how many matches would random instrument sets give?
+    print()
+    resumen_significancia(prueba_significancia(num_permutaciones=1_000_000))
 
 
-# Results
-precision_matches = analyze_precision()
-print("🎵 SCIENTIFIC FINDINGS: PERFECT MATCHES")
-print("Hole | Diameter | Instrument | Culture | Frequency | Precision")
-print("-" * 75)
-for match in precision_matches:
-    print(f"{match['hole']:4} | {match['hole_diameter']:8.1f} | {match['instrument']:12} | {match['culture']:8} | {match['frequency']:8.1f}Hz | ±{match['precision_error']:.2f}mm")
+if __name__ == '__main__':
+    main()
@@ -1,283 +1,62 @@
-import numpy as np
-import matplotlib.pyplot as plt
+"""Sistemas de sonido prolongado y levitación acústica
 
-# --- INSTRUMENTOS DE SONIDO PROLONGADO ANTIGUOS ---
+Las funciones de cálculo viven en el paquete ``dodecaedro_romano`` y se
+reexportan aquí; este script solo ejecuta la demostración.
+"""
 
-
-def simular_instrumentos_antiguos():
-    """Simula instrumentos que podían producir sonidos prolongados"""
-
-    instrumentos = {
-        'trompeta_metal': {
-            'frecuencia_range': (80, 300),
-            'duracion': 30,  # segundos
-            'intensidad': 0.8,
-            'material': 'bronce/laton'
-        },
-        'cornu_romano': {
-            'frecuencia_range': (60, 200),
-            'duracion': 45,
-            'intensidad': 0.9,
-            'material': 'bronce',
-            'longitud': 3.3  # metros
-        },
-        'trompa_celta': {
-            'frecuencia_range': (40, 150),
-            'duracion': 60,
-            'intensidad': 0.7,
-            'material': 'bronce',
-            'carlos': 'espiral'
-        },
-        'sirena_hidraulica': {
-            'frecuencia_range': (20, 120),
-            'duracion': 999,  # continuo
-            'intensidad': 0.95,
-            'material': 'piedra/agua',
-            'principio': 'vortice_agua'
-        },
-        'rueda_fonica': {
-            'frecuencia_range': (10, 100),
-            'duracion': 999,
-            'intensidad': 0.6,
-            'material': 'madera/piedra',
-            'mecanismo': 'rotacion_engranajes'
-        },
-        'voz_humana_colectiva': {
-            'frecuencia_range': (80, 300),
-            'duracion': 120,
-            'intensidad': 0.75,
-            'tecnicas': 'canto_armonico_oom'
-        }
-    }
-
-    return instrumentos
-
-# --- SIMULACIÓN FRECUENCIAS DE LEVITACIÓN ---
-
-
-def simular_levitacion_acustica():
-    """Simula frecuencias óptimas para levitación acústica"""
-
-    # Investigación actual: levitación funciona mejor con frecuencias bajas
-    # y ultra-altas, pero los antiguos solo tenían acceso a bajas
-
-    frecuencias = np.array([10, 20, 30, 40, 50, 60, 70, 80, 90, 100,
-                            110, 120, 130, 140, 150, 160, 170, 180, 190, 200])
-
-    # Fuerza de levitación relativa (según estudios modernos)
-    # Máxima eficiencia alrededor de 20-40Hz para objetos grandes
-    fuerza_levitacion = np.zeros_like(frecuencias, dtype=float)
-
-    for i, freq in enumerate(frecuencias):
-        if freq < 25:
-            fuerza_levitacion[i] = 0.3 * (freq/25)
-        elif 25 <= freq <= 40:
-            fuerza_levitacion[i] = 0.8 + 0.2 * np.sin((freq-32.5)/5 * np.pi)
-        elif 40 < freq <= 100:
-            fuerza_levitacion[i] = 0.7 * (100-freq)/60
-        else:
-            fuerza_levitacion[i] = 0.2 * (200-freq)/100
-
-    return frecuencias, fuerza_levitacion
-
-# --- SISTEMAS DE AMPLIFICACIÓN ANTIGUOS ---
-
-
-def sistemas_amplificacion():
-    """Sistemas que podían amplificar sonidos bajos"""
-
-    sistemas = {
-        'camaras_resonantes': {
-            'amplificacion': 10,  # veces
-            'frecuencia_optima': (15, 50),
-            'ejemplos': ['hipogeo_malta', 'nuevo_grange', 'piramides']
-        },
-        'tubos_sonoros': {
-            'amplificacion': 8,
-            'frecuencia_optima': (20, 80),
-            'longitud': 'λ/4 para frecuencia deseada'
-        },
-        'reflectores_parabolicos': {
-            'amplificacion': 12,
-            'frecuencia_optima': (30, 120),
-            'materiales': ['piedra_pulida', 'bronce_pulido']
-        },
-        'concentradores_dodecaedricos': {
-            'amplificacion': 15,
-            'frecuencia_optima': 'multiple_bandas',
-            'mecanismo': 'interferencia_constructiva'
-        }
-    }
-
-    return sistemas
-
-# --- VISUALIZACIÓN ---
-
-
-def visualizar_sonido_antiguo():
-    """Visualiza capacidades de sonido antiguo"""
-
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
-
-    # 1. Instrumentos antiguos
-    instrumentos = simular_instrumentos_antiguos()
-    names = list(instrumentos.keys())
-    duraciones = [inst['duracion'] for inst in instrumentos.values()]
-    frec_medias = [np.mean(inst['frecuencia_range'])
-                   for inst in instrumentos.values()]
-
-    bars = ax1.bar(names, duraciones, color='skyblue')
-    ax1.set_title('DURACIÓN DE SONIDO POR INSTRUMENTO ANTIGUO')
-    ax1.set_ylabel('Duración (segundos)')
-    ax1.tick_params(axis='x', rotation=45)
-
-    # 2. Frecuencias de levitación
-    frecuencias, fuerza = simular_levitacion_acustica()
-    ax2.plot(frecuencias, fuerza, 'r-o', linewidth=2, markersize=8)
-    ax2.fill_between(frecuencias, fuerza, alpha=0.3, color='red')
-    ax2.set_title('EFICIENCIA LEVITACIÓN ACÚSTICA vs FRECUENCIA')
-    ax2.set_xlabel('Frecuencia (Hz)')
-    ax2.set_ylabel('Fuerza relativa de levitación')
-    ax2.grid(True, alpha=0.3)
-    ax2.axvspan(20, 40, alpha=0.2, color='green', label='Óptimo levitación')
-    ax2.legend()
-
-    # 3. Amplificación por sistemas
-    sistemas = sistemas_amplificacion()
-    sist_names = list(sistemas.keys())
-    amplificaciones = [sist['amplificacion'] for sist in sistemas.values()]
-
-    ax3.bar(sist_names, amplificaciones, color='lightgreen')
-    ax3.set_title('AMPLIFICACIÓN POR SISTEMAS ANTIGUOS')
-    ax3.set_ylabel('Factor de amplificación')
-    ax3.tick_params(axis='x', rotation=45)
-
-    # 4. Combinación óptima
-    # Mostrar cómo se podían combinar sistemas
-    frec_optimas = np.array([20, 25, 30, 35, 40, 45, 50])
-    fuerza_combinada = np.array([0.4, 0.7, 0.9, 0.95, 0.9, 0.7, 0.5])
-
-    ax4.plot(frec_optimas, fuerza_combinada, 's-', color='purple', linewidth=3)
-    ax4.set_title('EFECTO COMBINADO: INSTRUMENTO + AMPLIFICACIÓN + CÁMARA')
-    ax4.set_xlabel('Frecuencia (Hz)')
-    ax4.set_ylabel('Fuerza levitación efectiva')
-    ax4.grid(True, alpha=0.3)
-    ax4.axhline(0.8, linestyle='--', color='gray',
-                label='Umbral levitación práctica')
-    ax4.legend()
-
-    plt.tight_layout()
-    plt.show()
-
-    return instrumentos, sistemas
-
-# --- PROTOCOLO COMPLETO LEVITACIÓN MEGALÍTICA ---
-
-
-def protocolo_levitacion_megalitica():
-    """Protocolo completo hipotético para levitación de piedras"""
-
-    print("🧱 PROTOCOLO COMPLETO DE LEVITACIÓN MEGALÍTICA")
-    print("=" * 60)
-
-    pasos = [
-        ("1. SELECCIÓN FRECUENCIA",
-         "Identificar frecuencia resonante de la piedra (20-40Hz óptimo)"),
-        ("2. PREPARACIÓN INSTRUMENTO",
-         "Usar Cornu Romano o sirena hidráulica para bajas frecuencias"),
-        ("3. AMPLIFICACIÓN", "Dirigir sonido through dodecaedro + reflectores pétreos"),
-        ("4. RESONANCIA EN CÁMARA", "Usar cámara subterránea como amplificador natural"),
-        ("5. SINCRONIZACIÓN", "Múltiples operadores coordinados (ritmo ceremonial)"),
-        ("6. PATRÓN CIMÁTICO", "Verificar con arena que se forma patrón de levitación"),
-        ("7. APLICACIÓN CONTINUA", "Mantener sonido durante movimiento de piedra"),
-        ("8. AMORTIGUACIÓN", "Reducir intensidad gradualmente al posicionar")
-    ]
-
-    for paso, descripcion in pasos:
-        print(f"{paso:25} : {descripcion}")
-
-    # Parámetros estimados
-    print(f"\n📊 PARÁMETROS ESTIMADOS:")
-    print(f"• Frecuencia óptima: 20-40 Hz")
-    print(f"• Intensidad sonora requerida: 140-160 dB (con amplificación)")
-    print(f"• Número de operadores: 8-12 personas/instrumentos")
-    print(f"• Tiempo de activación: 10-30 minutos por piedra")
-    print(f"• Reducción peso efectiva: 60-80%")
+from dodecaedro_romano.levitacion import (protocolo_levitacion_megalitica,
+                                          simular_instrumentos_antiguos,
+                                          simular_levitacion_acustica,
+                                          simular_sistema_completo,
+                                          sistemas_amplificacion)
+from dodecaedro_romano.visualizacion import visualizar_sonido_antiguo
 
 
 # --- EJECUTAR ANÁLISIS ---
-print("🎵 SISTEMAS DE SONIDO PROLONGADO EN LA ANTIGÜEDAD")
-print("🔊 Frecuencias bajas para levitación acústica")
-
-# Visualizar capacidades
-instrumentos, sistemas = visualizar_sonido_antiguo()
-
-# Mostrar protocolo
-protocolo_levitacion_megalitica()
-
-# --- EVIDENCIA ARQUEOLÓGICA ---
-print("\n🔍 EVIDENCIA ARQUEOLÓGICA DE SONIDO DE BAJA FRECUENCIA:")
-evidencia = [
-    ("Cornus romanos encontrados", "Longitud: 3.3m → Frecuencia fundamental ~25Hz"),
-    ("Sirenas hidráulicas egipcias", "Textos describen 'sonidos que mueven montañas'"),
-    ("Cámaras resonantes", "Hipogeo de Malta resonando a 110Hz (armónicos de bajas)"),
-    ("Instrumentos largos celtas", "Lur nórdicos de 2.5m → ~35Hz"),
-    ("Tradiciones de canto drone",
-     "Canto armónico tibetano/mongol con bajas frecuencias"),
-    ("Ingeniería hidráulica", "Sistemas de agua podían generar vibraciones de 10-30Hz")
-]
-
-for item, desc in evidencia:
-    print(f"• {item}: {desc}")
-
-# --- SIMULACIÓN COMBINADA ---
-print("\n🌀 SIMULACIÓN COMBINADA INSTRUMENTO + DODECAEDRO + CÁMARA")
-
-
-def simular_sistema_completo():
-    """Simula el sistema completo de levitación"""
-
-    # Parámetros del sistema
-    frecuencia_base = 28  # Hz - óptimo para levitación
-    amplificacion_dodecaedro = 3.0  # veces
-    amplificacion_camara = 4.0     # veces
-    amplificacion_reflector = 2.5  # veces
-
-    amplificacion_total = amplificacion_dodecaedro * \
-        amplificacion_camara * amplificacion_reflector
+def main():
+    print("🎵 SISTEMAS DE SONIDO PROLONGADO EN LA ANTIGÜEDAD")
+    print("🔊 Frecuencias bajas para levitación acústica")
+
+    # Visualizar capacidades
+    instrumentos, sistemas = visualizar_sonido_antiguo()
+
+    # Mostrar protocolo
+    protocolo_levitacion_megalitica()
+
+    # --- EVIDENCIA ARQUEOLÓGICA ---
+    print("\n🔍 EVIDENCIA ARQUEOLÓGICA DE SONIDO DE BAJA FRECUENCIA:")
+    evidencia = [
+        ("Cornus romanos encontrados", "Longitud: 3.3m → Frecuencia fundamental ~25Hz"),
+        ("Sirenas hidráulicas egipcias", "Textos describen 'sonidos que mueven montañas'"),
+        ("Cámaras resonantes", "Hipogeo de Malta resonando a 110Hz (armónicos de bajas)"),
+        ("Instrumentos largos celtas", "Lur nórdicos de 2.5m → ~35Hz"),
+        ("Tradiciones de canto drone",
+         "Canto armónico tibetano/mongol con bajas frecuencias"),
+        ("Ingeniería hidráulica", "Sistemas de agua podían generar vibraciones de 10-30Hz")
+    ]
 
-    # Eficiencia de levitación
-    # Basado en: F ~ ρ * A * a² * ω² / (2c²)
-    frecuencia_angular = 2 * np.pi * frecuencia_base
-    fuerza_relativa = (frecuencia_angular**2) * amplificacion_total / 1e6
+    for item, desc in evidencia:
+        print(f"• {item}: {desc}")
 
-    print(f"• Frecuencia: {frecuencia_base} Hz")
-    print(f"• Amplificación dodecaedro: {amplificacion_dodecaedro}x")
-    print(f"• Amplificación cámara: {amplificacion_camara}x")
-    print(f"• Amplificación reflector: {amplificacion_reflector}x")
-    print(f"• Amplificación TOTAL: {amplificacion_total:.1f}x")
-    print(f"• Fuerza relativa de levitación: {fuerza_relativa:.3f}")
+    # --- SIMULACIÓN COMBINADA ---
+    print("\n🌀 SIMULACIÓN COMBINADA INSTRUMENTO + DODECAEDRO + CÁMARA")
 
-    if fuerza_relativa > 0.8:
-        print("🎯 SISTEMA EFECTIVO: Levitación posible")
-    elif fuerza_relativa > 0.5:
-        print("⚠️  SISTEMA PARCIAL: Reducción significativa de peso")
-    else:
-        print("❌ SISTEMA INSUFICIENTE: Solo efectos acústicos menores")
+    simular_sistema_completo()
 
+    # --- CONCLUSIÓN ---
+    print("\n" + "="*60)
+    print("CONCLUSIÓN: ¡SÍ ERA POSIBLE!")
+    print("="*60)
+    print("La combinación de:")
+    print("1. Instrumentos de baja frecuencia (cornu, sirena hidráulica)")
+    print("2. Amplificación con dodecaedros y reflectores")
+    print("3. Cámaras de resonancia naturales")
+    print("4. Sincronización humana precisa")
+    print("\nPodía generar suficiente energía acústica para:")
+    print("• Reducir el peso efectivo de piedras en 60-80%")
+    print("• Permitir movimiento con menos fuerza humana")
+    print("• Crear efectos de 'levitación' aparente")
 
-simular_sistema_completo()
 
-# --- CONCLUSIÓN ---
-print("\n" + "="*60)
-print("CONCLUSIÓN: ¡SÍ ERA POSIBLE!")
-print("="*60)
-print("La combinación de:")
-print("1. Instrumentos de baja frecuencia (cornu, sirena hidráulica)")
-print("2. Amplificación con dodecaedros y reflectores")
-print("3. Cámaras de resonancia naturales")
-print("4. Sincronización humana precisa")
-print("\nPodía generar suficiente energía acústica para:")
-print("• Reducir el peso efectivo de piedras en 60-80%")
-print("• Permitir movimiento con menos fuerza humana")
-print("• Crear efectos de 'levitación' aparente")
+if __name__ == '__main__':
+    main()
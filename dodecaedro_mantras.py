@@ -1,309 +1,74 @@
-import numpy as np
-import matplotlib.pyplot as plt
-from scipy import signal
-
-# --- FRECUENCIAS SAGRADAS Y SUS EFECTOS ---
-def analizar_frecuencias_mantricas():
-    """Analiza las frecuencias principales de mantras y sus efectos"""
-    
-    # Frecuencias fundamentales documentadas
-    frecuencias = {
-        'OM_AUM': {
-            'frecuencia_base': 136.1,  # Hz - Frecuencia del OM estándar
-            'armonicos': [272.2, 408.3, 544.4, 680.5],
-            'efectos': ['estado meditativo', 'sincronización cerebral', 'sanación'],
-            'chakra': 'coronilla y todos los chakras',
-            'color': 'violeta/blanco'
-        },
-        'OM_432Hz': {
-            'frecuencia_base': 432.0,
-            'armonicos': [864, 1296, 1728],
-            'efectos': ['armonización natural', 'sintonía con la naturaleza', 'peace'],
-            'chakra': 'corazón',
-            'color': 'verde'
-        },
-        'GAYATRI_MANTRA': {
-            'frecuencia_base': 144.0,
-            'armonicos': [288, 432, 576],
-            'efectos': ['iluminación', 'sabiduría', 'protección'],
-            'chakra': 'tercer ojo',
-            'color': 'índigo'
-        },
-        'MAHA_MRITYUNJAYA': {
-            'frecuencia_base': 128.0,
-            'armonicos': [256, 384, 512],
-            'efectos': ['sanación profunda', 'longevidad', 'transformación'],
-            'chakra': 'raíz y coronilla',
-            'color': 'rojo/dorado'
-        },
-        'SO_HAM': {
-            'frecuencia_base': 108.0,
-            'armonicos': [216, 324, 432],
-            'efectos': ['conexión respiratoria', 'balance interior', 'auto-realización'],
-            'chakra': 'corazón y garganta',
-            'color': 'azul/verde'
-        }
-    }
-    
-    return frecuencias
+"""Frecuencias de mantras y OM: análisis completo
 
-# --- ANÁLISIS ESPECTRAL DEL OM ---
-def analisis_espectral_om():
-    """Realiza análisis espectral detallado del sonido OM"""
-    
-    # Parámetros de grabaciones reales de OM
-    frecuencia_muestreo = 44100  # Hz
-    duracion = 5.0  # segundos
-    t = np.linspace(0, duracion, int(frecuencia_muestreo * duracion))
-    
-    # Crear sonido OM sintético (basado en análisis real)
-    # El OM real tiene múltiples componentes
-    frecuencia_fundamental = 136.1
-    om_sound = (
-        0.6 * np.sin(2 * np.pi * frecuencia_fundamental * t) +
-        0.4 * np.sin(2 * np.pi * 2 * frecuencia_fundamental * t) +
-        0.3 * np.sin(2 * np.pi * 3 * frecuencia_fundamental * t) +
-        0.2 * np.sin(2 * np.pi * 4 * frecuencia_fundamental * t) +
-        0.1 * np.sin(2 * np.pi * 5 * frecuencia_fundamental * t)
-    )
-    
-    # Añadir componente de "drone" característico
-    om_sound += 0.4 * np.sin(2 * np.pi * 108 * t)  # Frecuencia SO-HAM
-    
-    # Análisis espectral
-    fft_result = np.fft.fft(om_sound)
-    freqs = np.fft.fftfreq(len(om_sound), 1/frecuencia_muestreo)
-    
-    # Solo frecuencias positivas
-    positive_freq_idx = freqs > 0
-    freqs_positive = freqs[positive_freq_idx]
-    fft_positive = np.abs(fft_result[positive_freq_idx])
-    
-    return t, om_sound, freqs_positive, fft_positive
+Las funciones de cálculo viven en el paquete ``dodecaedro_romano`` y se
+reexportan aquí; este script solo ejecuta la demostración.
+"""
 
-# --- VISUALIZACIÓN FRECUENCIAS MANTRICAS ---
-def visualizar_frecuencias_mantricas():
-    """Visualiza las frecuencias de los mantras principales"""
-    
-    frecuencias = analizar_frecuencias_mantricas()
-    
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
-    
-    # 1. Frecuencias base comparativas
-    mantras = list(frecuencias.keys())
-    freq_bases = [f['frecuencia_base'] for f in frecuencias.values()]
-    colores = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#C9A0DC']
-    
-    bars = ax1.bar(mantras, freq_bases, color=colores)
-    ax1.set_title('FRECUENCIAS BASE DE MANTRAS PRINCIPALES')
-    ax1.set_ylabel('Frecuencia (Hz)')
-    ax1.tick_params(axis='x', rotation=45)
-    
-    for bar, mantra in zip(bars, mantras):
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height + 5,
-                f'{frecuencias[mantra]["frecuencia_base"]} Hz',
-                ha='center', va='bottom')
-    
-    # 2. Análisis espectral del OM
-    t, om_sound, freqs, fft = analisis_espectral_om()
-    
-    ax2.plot(freqs[:2000], fft[:2000], 'b-', linewidth=1)
-    ax2.set_title('ESPECTRO DEL SONIDO OM (AUM)')
-    ax2.set_xlabel('Frecuencia (Hz)')
-    ax2.set_ylabel('Amplitud')
-    ax2.set_xlim(0, 1000)
-    ax2.grid(True, alpha=0.3)
-    
-    # Marcar armónicos importantes
-    for harmonic in [136.1, 272.2, 408.3, 544.4]:
-        ax2.axvline(harmonic, color='red', linestyle='--', alpha=0.7)
-        ax2.text(harmonic, np.max(fft[:2000])*0.8, f'{harmonic} Hz', 
-                rotation=90, va='top', ha='right')
-    
-    # 3. Relación entre frecuencias mantricas
-    # Mostrar cómo se relacionan matemáticamente
-    frecuencias_especiales = [108, 136.1, 144, 432]
-    nombres = ['SO-HAM', 'OM', 'GAYATRI', 'OM 432Hz']
-    relaciones = []
-    
-    for i in range(len(frecuencias_especiales)):
-        for j in range(i+1, len(frecuencias_especiales)):
-            ratio = frecuencias_especiales[i] / frecuencias_especiales[j]
-            relaciones.append((nombres[i], nombres[j], ratio))
-    
-    ax3.axis('off')
-    ax3.set_title('RELACIONES MATEMÁTICAS ENTRE FRECUENCIAS')
-    y_pos = 0.9
-    for rel in relaciones:
-        ax3.text(0.1, y_pos, f"{rel[0]} / {rel[1]} = {rel[2]:.3f}", 
-                fontsize=10, transform=ax3.transAxes)
-        y_pos -= 0.1
-    
-    # 4. Efectos por chakra
-    chakras = ['Raíz', 'Sacral', 'Plexo', 'Corazón', 'Garganta', 'Tercer Ojo', 'Coronilla']
-    frecuencias_chakras = [256, 288, 320, 341.3, 384, 432, 480]
-    colores_chakras = ['red', 'orange', 'yellow', 'green', 'blue', 'indigo', 'violet']
-    
-    ax4.scatter(frecuencias_chakras, range(7), s=100, c=colores_chakras)
-    ax4.set_yticks(range(7))
-    ax4.set_yticklabels(chakras)
-    ax4.set_xlabel('Frecuencia (Hz)')
-    ax4.set_title('FRECUENCIAS ASOCIADAS A CHAKRAS')
-    ax4.grid(True, alpha=0.3)
-    
-    for i, (freq, chakra) in enumerate(zip(frecuencias_chakras, chakras)):
-        ax4.text(freq + 10, i, f'{freq} Hz', va='center')
-    
-    plt.tight_layout()
-    plt.show()
-    
-    return frecuencias
+import numpy as np
 
-# --- CONEXIÓN CON DODECAEDRO ---
-def analizar_conexion_dodecaedro_mantras():
-    """Analiza la conexión entre frecuencias mantricas y el dodecaedro"""
-    
-    frecuencias = analizar_frecuencias_mantricas()
-    diametros_agujeros = [26, 21.5, 16.5, 21, 11.5, 17, 25.5, 10.5, 15.5, 22, 17, 22]
-    
-    print("🔗 CONEXIÓN DODECAEDRO - FRECUENCIAS MANTRICAS")
-    print("=" * 60)
-    
-    resultados = []
-    
-    for mantra, datos in frecuencias.items():
-        freq_base = datos['frecuencia_base']
-        
-        # Calcular qué agujeros resonarían con esta frecuencia
-        for i, diametro in enumerate(diametros_agujeros):
-            # Frecuencia natural aproximada: f ≈ c / (2 * d)
-            freq_natural = 343000 / (2 * diametro)  # mm/s / mm = Hz
-            diferencia = abs(freq_natural - freq_base)
-            
-            if diferencia < 20:  # Tolerancia de ±20 Hz
-                resultados.append({
-                    'mantra': mantra,
-                    'frecuencia': freq_base,
-                    'agujero': i,
-                    'diametro': diametro,
-                    'frecuencia_natural': freq_natural,
-                    'diferencia': diferencia
-                })
-    
-    # Mostrar resultados
-    print("Agujeros que resonarían con mantras:")
-    print("Mantra       | Frecuencia | Agujero | Diámetro | Frec. Natural | Diferencia")
-    print("-" * 80)
-    
-    for res in resultados:
-        print(f"{res['mantra']:12} | {res['frecuencia']:9.1f} | {res['agujero']:7} | {res['diametro']:8.1f} | {res['frecuencia_natural']:13.1f} | {res['diferencia']:9.1f}")
-    
-    return resultados
+from dodecaedro_romano.mantras import (analisis_armonicos_om,
+                                       analisis_espectral_om,
+                                       analizar_conexion_dodecaedro_mantras,
+                                       analizar_frecuencias_mantricas,
+                                       efectos_neurofisiologicos)
+from dodecaedro_romano.visualizacion import (simular_estado_meditativo,
+                                             visualizar_frecuencias_mantricas)
 
-# --- EFECTOS NEUROFISIOLÓGICOS ---
-def efectos_neurofisiologicos():
-    """Analiza los efectos de las frecuencias mantricas en el cerebro"""
-    
-    efectos = {
-        '108_Hz': {
-            'ondas_cerebrales': 'Delta/Theta (0.5-8 Hz)',
-            'efecto': 'Meditación profunda, sueño, regeneración',
-            'estudio': 'Aumenta producción melatonina 25%'
-        },
-        '136.1_Hz': {
-            'ondas_cerebrales': 'Theta/Alpha (4-12 Hz)',
-            'efecto': 'Estado meditativo, sincronización hemisférica',
-            'estudio': 'Coherencia EEG aumentada 40%'
-        },
-        '144_Hz': {
-            'ondas_cerebrales': 'Alpha (8-12 Hz)',
-            'efecto': 'Relajación alerta, creatividad, intuición',
-            'estudio': 'Activación corteza prefrontal'
-        },
-        '432_Hz': {
-            'ondas_cerebrales': 'Alpha/Beta (12-30 Hz)',
-            'efecto': 'Armonización, peace interior, sanación',
-            'estudio': 'Reducción cortisol 18%'
-        }
-    }
-    
-    print("\n🧠 EFECTOS NEUROFISIOLÓGICOS DE FRECUENCIAS MANTRICAS")
-    print("=" * 60)
-    
-    for freq, datos in efectos.items():
-        print(f"{freq} Hz:")
-        print(f"  • Ondas cerebrales: {datos['ondas_cerebrales']}")
-        print(f"  • Efecto: {datos['efecto']}")
-        print(f"  • Estudio: {datos['estudio']}")
-        print()
 
 # --- EJECUTAR ANÁLISIS ---
-print("🎵 FRECUENCIAS DE MANTRAS Y OM - ANÁLISIS COMPLETO")
-print("🧘‍♂️ Conexión con estados alterados de conciencia")
+def main():
+    print("🎵 FRECUENCIAS DE MANTRAS Y OM - ANÁLISIS COMPLETO")
+    print("🧘‍♂️ Conexión con estados alterados de conciencia")
+
+    # Visualizar análisis
+    frecuencias = visualizar_frecuencias_mantricas()
+
+    # Picos en bandas estrechas alrededor de cada frecuencia sagrada
+    print("🔬 PICOS DE ALTA RESOLUCIÓN EN EL OM SINTÉTICO (±2 Hz, 0.01 Hz)")
+    bandas = analisis_armonicos_om()
+    referencia = max(magnitud.max() for _, magnitud in bandas.values())
+    for centro, (freqs, magnitud) in bandas.items():
+        nivel = 20 * np.log10(magnitud.max() / referencia)
+        print(f"• {centro:7.1f} Hz -> pico en {freqs[np.argmax(magnitud)]:8.2f} Hz ({nivel:6.1f} dB)")
 
-# Visualizar análisis
-frecuencias = visualizar_frecuencias_mantricas()
+    # Analizar conexión con dodecaedro
+    resultados = analizar_conexion_dodecaedro_mantras()
 
-# Analizar conexión con dodecaedro
-resultados = analizar_conexion_dodecaedro_mantras()
+    # Mostrar efectos neurofisiológicos
+    efectos_neurofisiologicos()
 
-# Mostrar efectos neurofisiológicos
-efectos_neurofisiologicos()
+    # --- APLICACIONES PRÁCTICAS ---
+    print("💡 APLICACIONES PRÁCTICAS EN LA ANTIGÜEDAD:")
+    aplicaciones = [
+        ("Terapia sonora", "Sanación mediante resonancia específica"),
+        ("Meditación guiada", "Inducción de estados alterados"),
+        ("Construcción sagrada", "Armonización de espacios rituales"),
+        ("Agricultura", "Estimulación crecimiento plantas con sonido"),
+        ("Metalurgia", "Armonización de metales durante fundición"),
+        ("Navegación", "Orientación acústica en cámaras resonantes")
+    ]
 
-# --- APLICACIONES PRÁCTICAS ---
-print("💡 APLICACIONES PRÁCTICAS EN LA ANTIGÜEDAD:")
-aplicaciones = [
-    ("Terapia sonora", "Sanación mediante resonancia específica"),
-    ("Meditación guiada", "Inducción de estados alterados"),
-    ("Construcción sagrada", "Armonización de espacios rituales"),
-    ("Agricultura", "Estimulación crecimiento plantas con sonido"),
-    ("Metalurgia", "Armonización de metales durante fundición"),
-    ("Navegación", "Orientación acústica en cámaras resonantes")
-]
+    for app, desc in aplicaciones:
+        print(f"• {app}: {desc}")
 
-for app, desc in aplicaciones:
-    print(f"• {app}: {desc}")
+    # Ejecutar simulación
+    simular_estado_meditativo()
 
-# --- SIMULACIÓN DE ESTADO MEDITATIVO ---
-def simular_estado_meditativo():
-    """Simula el efecto del OM en ondas cerebrales"""
-    
-    # Parámetros de ondas cerebrales
-    tiempo = np.linspace(0, 10, 1000)
-    
-    # Ondas normales (beta)
-    beta_waves = np.sin(2*np.pi*20*tiempo) + 0.5*np.sin(2*np.pi*40*tiempo)
-    
-    # Ondas bajo influencia del OM (alpha/theta)
-    alpha_theta = (np.sin(2*np.pi*10*tiempo) + 
-                  0.7*np.sin(2*np.pi*8*tiempo) + 
-                  0.3*np.sin(2*np.pi*136.1/10*tiempo))  # OM influye en frecuencias más bajas
-    
-    plt.figure(figsize=(12, 6))
-    plt.plot(tiempo, beta_waves, 'r-', alpha=0.7, label='Estado normal (Beta 20-40Hz)')
-    plt.plot(tiempo, alpha_theta, 'b-', alpha=0.7, label='Estado meditativo (Alpha/Theta 8-12Hz)')
-    plt.title('TRANSICIÓN DE ONDAS CEREBRALES POR EFECTO DEL OM')
-    plt.xlabel('Tiempo (segundos)')
-    plt.ylabel('Amplitud')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    plt.show()
+    # --- CONCLUSIÓN ---
+    print("\n" + "="*70)
+    print("CONCLUSIÓN: EL SONIDO COMO HERRAMIENTA DE TRANSFORMACIÓN")
+    print("="*70)
+    print("Las frecuencias mantricas operan en múltiples niveles:")
+    print("1. 🧠 NEUROLÓGICO: Sincronización de ondas cerebrales")
+    print("2. 💖 EMOCIONAL: Inducción de estados de peace y armonía")
+    print("3. 🌊 FÍSICO: Resonancia con estructuras moleculares")
+    print("4. 🏛️  ARQUITECTÓNICO: Armonización de espacios sagrados")
+    print("\nEl dodecaedro pudo ser el 'sintonizador cósmico' para:")
+    print("• Amplificar frecuencias específicas")
+    print("• Crear campos de resonancia coherentes")
+    print("• Inducir estados alterados de conciencia")
+    print("• Armonizar personas y espacios")
 
-# Ejecutar simulación
-simular_estado_meditativo()
 
-# --- CONCLUSIÓN ---
-print("\n" + "="*70)
-print("CONCLUSIÓN: EL SONIDO COMO HERRAMIENTA DE TRANSFORMACIÓN")
-print("="*70)
-print("Las frecuencias mantricas operan en múltiples niveles:")
-print("1. 🧠 NEUROLÓGICO: Sincronización de ondas cerebrales")
-print("2. 💖 EMOCIONAL: Inducción de estados de peace y armonía")
-print("3. 🌊 FÍSICO: Resonancia con estructuras moleculares")
-print("4. 🏛️  ARQUITECTÓNICO: Armonización de espacios sagrados")
-print("\nEl dodecaedro pudo ser el 'sintonizador cósmico' para:")
-print("• Amplificar frecuencias específicas")
-print("• Crear campos de resonancia coherentes")
-print("• Inducir estados alterados de conciencia")
-print("• Armonizar personas y espacios")
+if __name__ == '__main__':
+    main()
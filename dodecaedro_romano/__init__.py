@@ -0,0 +1,52 @@
+"""Simulaciones acústicas del dodecaedro romano como biblioteca importable
+
+Importar el paquete no ejecuta ninguna simulación ni carga matplotlib o
+scipy: ambos se importan dentro de las funciones que los necesitan. Las
+visualizaciones viven en ``dodecaedro_romano.visualizacion`` y las
+demostraciones en los scripts de la raíz del repositorio.
+"""
+
+from .afinacion import ANCIENT_INSTRUMENTS, DODECAHEDRON_HOLES, analyze_precision
+from .calibracion import (DIAMETROS_AGUJEROS, INSTRUMENTOS_ANTIGUOS,
+                          analizar_precision, encontrar_correspondencias)
+from .almacen import AlmacenResultados, EjecucionAlmacenada
+from .cache import CacheDisco, huella_parametros
+from .catalogo import (DTYPE_CATALOGO, cargar_catalogo, catalogo_referencia,
+                       crear_catalogo, diametros_por_artefacto,
+                       frecuencias_naturales)
+from .cimatica import (CamposCompartidos, analizar_compatibilidad_hipogeo,
+                       barrido_cimatico_fragmentado,
+                       calcular_tesela_cimatica, recalcular_tesela_cimatica,
+                       simular_construccion_megalitica,
+                       simular_patrones_cimaticos,
+                       simular_patrones_cimaticos_paralelo,
+                       simular_patrones_cimaticos_teselado)
+from .difraccion import (barrido_difraccion, matriz_transferencia_real,
+                         simular_difraccion_real)
+from .espectro import (analizar_bandas, centros_de_frecuencias, espectrograma,
+                       espectro_real, psd_welch)
+from .fdtd import (SimuladorFDTD, espectro_sondas, simular_fdtd_dodecaedro,
+                   voxelizar_dodecaedro)
+from .fragmentado import ArregloFragmentado
+from .geometria import (GeometriaDodecaedro, generar_geometria_real,
+                        generar_posiciones_agujeros, obtener_geometria)
+from .indice import (IndiceOrdenado, IndiceResonancias,
+                     obtener_indice_resonancias)
+from .levitacion import (protocolo_levitacion_megalitica,
+                         simular_instrumentos_antiguos,
+                         simular_levitacion_acustica, simular_sistema_completo,
+                         sistemas_amplificacion)
+from .mantras import (analisis_armonicos_om, analisis_espectral_om,
+                      analizar_conexion_dodecaedro_mantras,
+                      analizar_frecuencias_mantricas,
+                      efectos_neurofisiologicos)
+from .modal import (ModosCavidad, calcular_modos, mallar_cavidad,
+                    obtener_modos)
+from .montecarlo import (prueba_significancia, resumen_montecarlo,
+                         resumen_significancia, simular_tolerancias)
+from .propagacion import barrido_propagacion_onda, simular_propagacion_onda
+from .registro import RegistroInstrumentos, obtener_registro
+from .tibetano import (FRECUENCIAS_TIBETANAS, BancoFiltrosAgujeros,
+                       ProcesadorAgujerosTiempoReal, benchmark_tiempo_real,
+                       filtrar_agujeros, generar_sonido_tibetano,
+                       generar_sonido_tibetano_bloques)
@@ -0,0 +1,62 @@
+"""Precision analysis of dodecahedron holes against ancient instruments"""
+
+import numpy as np
+
+from .indice import IndiceOrdenado
+from .registro import obtener_registro
+
+# Dodecahedron hole diameters (mm) - Exact measurements from archaeological finds
+DODECAHEDRON_HOLES = [26.0, 21.5, 16.5, 21.0,
+                      11.5, 17.0, 25.5, 10.5, 15.5, 22.0, 17.0, 22.0]
+
+
+# Ancient instrument specifications
+ANCIENT_INSTRUMENTS = {
+    'TIBETAN_DUNG_CHEN': {'diameter': 25.5, 'frequency': 55.0, 'culture': 'Tibetan'},
+    'ROMAN_TUBA':        {'diameter': 22.0, 'frequency': 98.0, 'culture': 'Roman'},
+    'HEBREW_SHOFAR':     {'diameter': 17.0, 'frequency': 85.0, 'culture': 'Hebrew'},
+    'HINDU_SANKHA':      {'diameter': 11.5, 'frequency': 146.6, 'culture': 'Hindu'},
+    'ETRUSCAN_TRUMPET':  {'diameter': 26.0, 'frequency': 48.5, 'culture': 'Etruscan'},
+    'GREEK_AULOS':       {'diameter': 10.5, 'frequency': 156.8, 'culture': 'Greek'},
+    'CELTIC_HORN':       {'diameter': 16.5, 'frequency': 110.0, 'culture': 'Celtic'},
+    'EGYPTIAN_FLUTE':    {'diameter': 15.5, 'frequency': 123.5, 'culture': 'Egyptian'}
+}
+
+
+# Precision analysis
+
+
+def analyze_precision(holes=None, instruments=None, tolerance=0.5):
+    """Matches every hole against every instrument within ``tolerance`` mm
+
+    Instrument diameters are indexed once and all holes are queried in bulk.
+    Matches keep the original order: by hole, then by instrument order.
+    """
+    holes = DODECAHEDRON_HOLES if holes is None else holes
+    if instruments is None:
+        # Default table: reuse the index built once in the shared registry
+        registry = obtener_registro()
+        instruments = ANCIENT_INSTRUMENTS
+        names = registry.nombres[registry.filas('afinacion')].tolist()
+        index = registry.indice_diametros('afinacion')
+    else:
+        names = list(instruments)
+        index = IndiceOrdenado([instruments[name]['diameter'] for name in names])
+    offsets, found, _ = index.consultar_lote(holes, tolerance)  # ±0.5mm tolerance
+
+    matches = []
+    for hole_idx, hole_diam in enumerate(holes):
+        for instr_idx in np.sort(found[offsets[hole_idx]:offsets[hole_idx + 1]]):
+            instr_name = names[instr_idx]
+            instr_data = instruments[instr_name]
+            matches.append({
+                'hole': hole_idx,
+                'hole_diameter': hole_diam,
+                'instrument': instr_name,
+                'instrument_diameter': instr_data['diameter'],
+                'frequency': instr_data['frequency'],
+                'culture': instr_data['culture'],
+                'precision_error': abs(hole_diam - instr_data['diameter'])
+            })
+
+    return matches
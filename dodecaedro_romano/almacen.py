@@ -0,0 +1,214 @@
+"""Almacén de resultados de simulación direccionado por contenido
+
+Cada ejecución se guarda en ``<directorio>/<hh>/<huella>/``, donde ``huella``
+es ``huella_parametros`` de sus parámetros de entrada. Contiene un ``.npy``
+sin comprimir por array (se abren con ``mmap_mode='r'`` sin copiar datos) y
+un ``meta.json``. ``indice.jsonl`` en la raíz tiene una línea por ejecución
+para localizar miles de ellas sin abrir sus carpetas.
+"""
+
+import errno
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from .cache import _normalizar, huella_parametros
+
+_INDICE = 'indice.jsonl'
+_META = 'meta.json'
+
+
+class EjecucionAlmacenada:
+    """Una ejecución del almacén; los arrays se cargan al pedirlos"""
+
+    def __init__(self, directorio, entrada):
+        self.directorio = directorio
+        self.huella = entrada['huella']
+        self.parametros = entrada['parametros']
+        self.miembros = entrada['miembros']
+        self.creado = entrada.get('creado')
+
+    def __repr__(self):
+        return f"EjecucionAlmacenada({self.huella[:12]}, {sorted(self.miembros)})"
+
+    def __contains__(self, nombre):
+        return nombre in self.miembros
+
+    def keys(self):
+        return self.miembros.keys()
+
+    def __getitem__(self, nombre):
+        """Array ``nombre`` mapeado en memoria de solo lectura"""
+        return self.cargar(nombre)
+
+    def cargar(self, nombre, mmap_mode='r'):
+        """Array ``nombre``; con ``mmap_mode=None`` se lee entero a memoria"""
+        if nombre not in self.miembros:
+            raise KeyError(nombre)
+        return np.load(os.path.join(self.directorio, nombre + '.npy'),
+                       mmap_mode=mmap_mode)
+
+
+class AlmacenResultados:
+    """Guarda y busca ejecuciones por la huella de sus parámetros"""
+
+    def __init__(self, directorio='resultados'):
+        self.directorio = directorio
+        os.makedirs(directorio, exist_ok=True)
+        self._entradas = {}
+        self._leido = 0  # bytes del índice ya leídos
+        self._inodo = None  # para detectar un índice reconstruido
+
+    def ruta(self, huella):
+        """Carpeta de una ejecución"""
+        return os.path.join(self.directorio, huella[:2], huella)
+
+    def guardar(self, parametros, sobrescribir=False, **arrays):
+        """Guarda los arrays de una ejecución y devuelve su huella
+
+        Si ya existe una ejecución con los mismos parámetros no se vuelve a
+        escribir, salvo con ``sobrescribir=True``. Los archivos se escriben en
+        una carpeta temporal que luego se renombra, así que una ejecución
+        interrumpida nunca queda a medias en el almacén. Al sobrescribir, la
+        ejecución anterior se aparta con otro nombre antes de sustituirla; si
+        otro proceso publica la misma huella a la vez, gana el primero.
+        """
+        huella = huella_parametros(parametros)
+        destino = self.ruta(huella)
+        if os.path.exists(destino) and not sobrescribir:
+            return huella
+
+        entrada = {
+            'huella': huella,
+            'parametros': _normalizar(parametros),
+            'miembros': {nombre: {'forma': list(np.shape(array)),
+                                  'dtype': np.asarray(array).dtype.str}
+                         for nombre, array in arrays.items()},
+            'creado': time.time(),
+        }
+
+        os.makedirs(os.path.dirname(destino), exist_ok=True)
+        temporal = tempfile.mkdtemp(dir=os.path.dirname(destino),
+                                    suffix='.tmp')
+        try:
+            for nombre, array in arrays.items():
+                np.save(os.path.join(temporal, nombre + '.npy'),
+                        np.asarray(array))
+            with open(os.path.join(temporal, _META), 'w',
+                      encoding='utf-8') as archivo:
+                json.dump(entrada, archivo)
+        except BaseException:
+            shutil.rmtree(temporal, ignore_errors=True)
+            raise
+
+        apartado = None
+        if os.path.exists(destino):
+            # os.replace solo sustituye carpetas vacías: apartar la anterior
+            apartado = tempfile.mkdtemp(dir=os.path.dirname(destino),
+                                        suffix='.old')
+            try:
+                os.replace(destino, apartado)
+            except FileNotFoundError:
+                pass  # otro escritor la apartó antes
+        try:
+            os.replace(temporal, destino)
+        except OSError as error:
+            shutil.rmtree(temporal, ignore_errors=True)
+            if error.errno in (errno.ENOTEMPTY, errno.EEXIST):
+                # Otro proceso publicó la misma huella a la vez: se queda
+                # la suya
+                return huella
+            raise
+        finally:
+            if apartado is not None:
+                shutil.rmtree(apartado, ignore_errors=True)
+
+        # Una línea por ejecución; la última gana si una huella se repite
+        with open(os.path.join(self.directorio, _INDICE), 'a',
+                  encoding='utf-8') as indice:
+            indice.write(json.dumps(entrada) + '\n')
+        return huella
+
+    def _actualizar(self):
+        """Lee solo las líneas del índice añadidas desde la última lectura"""
+        ruta = os.path.join(self.directorio, _INDICE)
+        if not os.path.exists(ruta):
+            return
+        estado = os.stat(ruta)
+        if estado.st_ino != self._inodo or estado.st_size < self._leido:
+            # Índice nuevo o reconstruido por otro proceso: leerlo entero
+            self._entradas, self._leido = {}, 0
+            self._inodo = estado.st_ino
+        if estado.st_size == self._leido:
+            return
+        with open(ruta, 'rb') as indice:
+            indice.seek(self._leido)
+            for linea in indice:
+                if not linea.endswith(b'\n'):
+                    break  # línea a medio escribir por otro proceso
+                entrada = json.loads(linea)
+                self._entradas[entrada['huella']] = entrada
+                self._leido += len(linea)
+
+    def __len__(self):
+        self._actualizar()
+        return len(self._entradas)
+
+    def __contains__(self, parametros_o_huella):
+        self._actualizar()
+        if not isinstance(parametros_o_huella, str):
+            parametros_o_huella = huella_parametros(parametros_o_huella)
+        return parametros_o_huella in self._entradas
+
+    def __iter__(self):
+        self._actualizar()
+        for huella in list(self._entradas):
+            yield self.cargar(huella)
+
+    def cargar(self, parametros_o_huella):
+        """Ejecución por huella o por parámetros; ``KeyError`` si no existe"""
+        self._actualizar()
+        huella = parametros_o_huella
+        if not isinstance(huella, str):
+            huella = huella_parametros(huella)
+        return EjecucionAlmacenada(self.ruta(huella), self._entradas[huella])
+
+    def buscar(self, **filtros):
+        """Ejecuciones cuyos parámetros coinciden con todos los ``filtros``
+
+        Solo consulta el índice; no abre ninguna carpeta ni array.
+        """
+        self._actualizar()
+        filtros = _normalizar(filtros)
+        return [EjecucionAlmacenada(self.ruta(huella), entrada)
+                for huella, entrada in self._entradas.items()
+                if all(entrada['parametros'].get(clave) == valor
+                       for clave, valor in filtros.items())]
+
+    def reconstruir_indice(self):
+        """Vuelve a escribir ``indice.jsonl`` a partir de los ``meta.json``"""
+        entradas = []
+        for subcarpeta in sorted(os.listdir(self.directorio)):
+            ruta_sub = os.path.join(self.directorio, subcarpeta)
+            if len(subcarpeta) != 2 or not os.path.isdir(ruta_sub):
+                continue
+            for huella in sorted(os.listdir(ruta_sub)):
+                if huella.endswith(('.tmp', '.old')):
+                    continue  # escritura interrumpida o versión apartada
+                meta = os.path.join(ruta_sub, huella, _META)
+                if os.path.exists(meta):
+                    with open(meta, encoding='utf-8') as archivo:
+                        entradas.append(json.load(archivo))
+
+        entradas.sort(key=lambda entrada: entrada.get('creado') or 0)
+        ruta = os.path.join(self.directorio, _INDICE)
+        with open(ruta + '.tmp', 'w', encoding='utf-8') as indice:
+            for entrada in entradas:
+                indice.write(json.dumps(entrada) + '\n')
+        os.replace(ruta + '.tmp', ruta)
+        self._entradas, self._leido = {}, 0
+        return len(entradas)
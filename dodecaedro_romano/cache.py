@@ -0,0 +1,72 @@
+"""Caché en disco de resultados, indexada por una huella de los parámetros"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+
+
+def _normalizar(valor):
+    """Convierte parámetros a tipos JSON con una representación única
+
+    Los números pasan a ``float`` (110 y 110.0 dan la misma huella), las
+    tuplas y arrays a listas y los diccionarios se ordenan al serializar.
+    """
+    if isinstance(valor, dict):
+        return {str(clave): _normalizar(v) for clave, v in valor.items()}
+    if isinstance(valor, (list, tuple, np.ndarray)):
+        return [_normalizar(v) for v in valor]
+    if isinstance(valor, (bool, np.bool_)) or valor is None:
+        return None if valor is None else bool(valor)
+    if isinstance(valor, (int, float, np.integer, np.floating)):
+        return float(valor)
+    return str(valor)
+
+
+def huella_parametros(parametros):
+    """SHA-256 (hexadecimal) del JSON canónico de un diccionario de parámetros"""
+    texto = json.dumps(_normalizar(parametros), sort_keys=True,
+                       separators=(',', ':'))
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+
+class CacheDisco:
+    """Un ``.npy`` por clave en ``directorio``, repartidos en subcarpetas
+
+    La escritura va a un archivo temporal que luego se renombra, así que un
+    proceso interrumpido nunca deja una entrada a medias.
+    """
+
+    def __init__(self, directorio):
+        self.directorio = directorio
+        os.makedirs(directorio, exist_ok=True)
+
+    def ruta(self, clave):
+        """Ruta del archivo de una clave"""
+        return os.path.join(self.directorio, clave[:2], clave + '.npy')
+
+    def __contains__(self, clave):
+        return os.path.exists(self.ruta(clave))
+
+    def cargar(self, clave, mmap_mode=None):
+        """Array guardado con ``clave``; ``KeyError`` si no existe"""
+        try:
+            return np.load(self.ruta(clave), mmap_mode=mmap_mode)
+        except FileNotFoundError:
+            raise KeyError(clave) from None
+
+    def guardar(self, clave, array):
+        """Guarda ``array`` con ``clave`` de forma atómica"""
+        ruta = self.ruta(clave)
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        descriptor, temporal = tempfile.mkstemp(
+            dir=os.path.dirname(ruta), suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as archivo:
+                np.save(archivo, np.asarray(array))
+            os.replace(temporal, ruta)
+        except BaseException:
+            os.unlink(temporal)
+            raise
@@ -0,0 +1,137 @@
+"""Correspondencias entre agujeros del dodecaedro e instrumentos antiguos"""
+
+from .catalogo import es_catalogo
+from .indice import IndiceOrdenado
+from .registro import obtener_registro
+
+# --- DIÁMETROS DE AGUJEROS vs INSTRUMENTOS ---
+DIAMETROS_AGUJEROS = [26, 21.5, 16.5, 21, 11.5, 17, 25.5, 10.5, 15.5, 22, 17, 22]  # mm
+
+
+# --- INSTRUMENTOS ANTIGUOS Y SUS DIÁMETROS ---
+INSTRUMENTOS_ANTIGUOS = {
+    'DUNG_CHEN_LARGO': {
+        'diametro_tubo': 25.5,  # mm - Casi exacto al agujero 6
+        'frecuencia': 55.0,
+        'longitud': 3.5,
+        'cultura': 'Tibet',
+        'uso': 'ceremonias exteriores'
+    },
+    'DUNG_CHEN_MEDIO': {
+        'diametro_tubo': 21.5,  # mm - Exacto al agujero 1
+        'frecuencia': 73.3,
+        'longitud': 2.2,
+        'cultura': 'Tibet',
+        'uso': 'templos'
+    },
+    'SHOFAR_CARNERO': {
+        'diametro_tubo': 17.0,  # mm - Coincide con agujeros 5 y 10
+        'frecuencia': 85.0,
+        'longitud': 1.2,
+        'cultura': 'Hebreo',
+        'uso': 'rituales religiosos'
+    },
+    'TROMPETA_ROMANA': {
+        'diametro_tubo': 22.0,  # mm - Agujeros 3 y 11
+        'frecuencia': 98.0,
+        'longitud': 1.8,
+        'cultura': 'Romana',
+        'uso': 'militar/ceremonial'
+    },
+    'CUERNO_CELTA': {
+        'diametro_tubo': 16.5,  # mm - Agujero 2
+        'frecuencia': 110.0,
+        'longitud': 1.5,
+        'cultura': 'Celta',
+        'uso': 'rituales druídicos'
+    },
+    'SANKHA_HINDU': {
+        'diametro_tubo': 11.5,  # mm - Agujero 4
+        'frecuencia': 146.6,
+        'longitud': 0.9,
+        'cultura': 'Hindú',
+        'uso': 'ritos védicos'
+    },
+    'TROMPETA_ETRUSCA': {
+        'diametro_tubo': 26.0,  # mm - Agujero 0
+        'frecuencia': 48.5,
+        'longitud': 2.5,
+        'cultura': 'Etrusca',
+        'uso': 'funerario'
+    },
+    'AULOS_GRIEGO': {
+        'diametro_tubo': 10.5,  # mm - Agujero 7
+        'frecuencia': 156.8,
+        'longitud': 0.7,
+        'cultura': 'Griega',
+        'uso': 'teatro/misterios'
+    },
+    'FLAUTA_EGIPCIA': {
+        'diametro_tubo': 15.5,  # mm - Agujero 8
+        'frecuencia': 123.5,
+        'longitud': 1.1,
+        'cultura': 'Egipcia',
+        'uso': 'templos'
+    }
+}
+
+
+# --- CALCULAR CORRESPONDENCIAS ---
+def encontrar_correspondencias(diametros=None, instrumentos=None, tolerancia=0.5):
+    """Encuentra las correspondencias entre agujeros e instrumentos
+
+    Por defecto usa ``DIAMETROS_AGUJEROS`` e ``INSTRUMENTOS_ANTIGUOS``. Los
+    diámetros de los instrumentos se indexan una vez y todos los agujeros se
+    consultan en bloque, así que sirve para miles de agujeros contra catálogos
+    de cientos de miles de instrumentos. ``diametros`` también puede ser un
+    catálogo de ``cargar_catalogo``: entonces ``i`` es la fila del catálogo y
+    la incertidumbre de cada medida se suma a ``tolerancia``.
+    """
+    diametros = DIAMETROS_AGUJEROS if diametros is None else diametros
+    if es_catalogo(diametros):
+        tolerancia = tolerancia + diametros['incertidumbre']
+        diametros = diametros['diametro'].tolist()
+
+    if instrumentos is None:
+        # Tabla por defecto: índice ya construido en el registro compartido
+        registro = obtener_registro()
+        instrumentos = INSTRUMENTOS_ANTIGUOS
+        nombres = registro.nombres[registro.filas('calibracion')].tolist()
+        indice = registro.indice_diametros('calibracion')
+    else:
+        nombres = list(instrumentos)
+        indice = IndiceOrdenado([instrumentos[nombre]['diametro_tubo']
+                                 for nombre in nombres])
+    # Tolerancia de ±0.5mm (precisión antigua), ordenado por mejor ajuste
+    desplazamientos, indices, _ = indice.consultar_lote(diametros, tolerancia)
+
+    correspondencias = []
+    for i, diametro_agujero in enumerate(diametros):
+        instrumentos_compatibles = []
+        for j in indices[desplazamientos[i]:desplazamientos[i + 1]]:
+            datos_instr = instrumentos[nombres[j]]
+            diferencia = abs(diametro_agujero - datos_instr['diametro_tubo'])
+            instrumentos_compatibles.append((nombres[j], datos_instr, diferencia))
+        correspondencias.append((i, diametro_agujero, instrumentos_compatibles))
+
+    return correspondencias
+
+
+# --- ANÁLISIS DE PRECISIÓN ---
+def analizar_precision(correspondencias):
+    """Analiza la precisión de las correspondencias"""
+
+    print("🎯 PRECISIÓN DE CORRESPONDENCIAS:")
+    print("Agujero | Diámetro | Instrumento        | Cultura   | Diferencia | Frecuencia")
+    print("-" * 80)
+
+    for agujero_idx, diametro, instrumentos in correspondencias:
+        if instrumentos:
+            mejor_instr = instrumentos[0]
+            nombre = mejor_instr[0]
+            datos = mejor_instr[1]
+            diff = mejor_instr[2]
+
+            print(f"{agujero_idx:6} | {diametro:8.1f} | {nombre:18} | {datos['cultura']:9} | {diff:9.2f}mm | {datos['frecuencia']:8.1f}Hz")
+        else:
+            print(f"{agujero_idx:6} | {diametro:8.1f} | {'Sin correspondencia':18} | {'-':9} | {'-':9} | {'-':8}")
@@ -0,0 +1,186 @@
+"""Catálogo de dodecaedros medidos en un único array estructurado
+
+Cada fila es un agujero de un artefacto: ``artefacto`` (identificador),
+``agujero`` (0-11, mismo orden que ``DIAMETROS_AGUJEROS``), ``diametro`` en mm
+e ``incertidumbre`` de la medida en mm. Las correspondencias, las frecuencias
+naturales y la matriz de difracción aceptan el catálogo directamente, y un
+catálogo se guarda con ``np.save`` sin pasos extra.
+"""
+
+import csv
+import os
+
+import numpy as np
+
+from .geometria import (DIAMETROS_AGUJEROS_INFERIOR,
+                        DIAMETROS_AGUJEROS_SUPERIOR, NUM_AGUJEROS)
+
+DTYPE_CATALOGO = np.dtype([
+    ('artefacto', 'U24'),
+    ('agujero', np.int16),
+    ('diametro', np.float64),
+    ('incertidumbre', np.float64),
+])
+
+_CAMPOS = DTYPE_CATALOGO.names
+_LONGITUD_ARTEFACTO = DTYPE_CATALOGO['artefacto'].itemsize // np.dtype('U1').itemsize
+
+
+def crear_catalogo(artefactos, agujeros, diametros, incertidumbres=0.0):
+    """Construye el array del catálogo a partir de columnas (o escalares)"""
+    artefactos = np.asarray(artefactos, dtype=str)
+    if artefactos.dtype.itemsize > DTYPE_CATALOGO['artefacto'].itemsize:
+        largos = [str(a) for a in artefactos.ravel()
+                  if len(a) > _LONGITUD_ARTEFACTO]
+        if largos:
+            raise ValueError(f"Identificador de artefacto de más de "
+                             f"{_LONGITUD_ARTEFACTO} caracteres: {largos[0]!r}")
+    columnas = np.broadcast_arrays(artefactos,
+                                   np.asarray(agujeros),
+                                   np.asarray(diametros, dtype=float),
+                                   np.asarray(incertidumbres, dtype=float))
+    catalogo = np.empty(columnas[2].size, dtype=DTYPE_CATALOGO)
+    for campo, columna in zip(_CAMPOS, columnas):
+        catalogo[campo] = columna.ravel()
+
+    if np.any((catalogo['agujero'] < 0) | (catalogo['agujero'] >= NUM_AGUJEROS)):
+        raise ValueError(f"Los índices de agujero deben estar entre 0 y {NUM_AGUJEROS - 1}")
+    return catalogo
+
+
+def catalogo_referencia(artefacto='SCAD', incertidumbre=0.0):
+    """Catálogo de un solo artefacto con los diámetros del modelo SCAD"""
+    diametros = DIAMETROS_AGUJEROS_SUPERIOR + DIAMETROS_AGUJEROS_INFERIOR
+    return crear_catalogo(artefacto, np.arange(NUM_AGUJEROS), diametros,
+                          incertidumbre)
+
+
+def _desde_matriz(diametros, incertidumbre=0.0):
+    """Catálogo desde una matriz (artefactos, 12); los NaN son agujeros sin medir"""
+    diametros = np.atleast_2d(np.asarray(diametros, dtype=float))
+    if diametros.shape[-1] != NUM_AGUJEROS:
+        raise ValueError(f"Se esperaban {NUM_AGUJEROS} columnas de diámetros")
+    filas, agujeros = np.nonzero(~np.isnan(diametros))
+    return crear_catalogo(filas, agujeros, diametros[filas, agujeros],
+                          incertidumbre)
+
+
+def _celda_numerica(celda, vacia):
+    """Número de una celda de CSV; ``vacia`` si la celda está en blanco"""
+    celda = (celda or '').strip()
+    return float(celda) if celda else vacia
+
+
+def _leer_csv(ruta):
+    """Columnas de un catálogo en CSV, convertidas fila a fila
+
+    Una celda de ``diametro`` vacía es un agujero sin medir y no entra en el
+    catálogo, como un NaN en la matriz ``.npy``; una de ``incertidumbre``
+    vacía vale 0. Cualquier otra celda inválida da un ``ValueError`` con el
+    archivo y la línea.
+    """
+    with open(ruta, newline='', encoding='utf-8') as archivo:
+        lector = csv.DictReader(archivo, skipinitialspace=True)
+        presentes = [campo for campo in _CAMPOS
+                     if campo in (lector.fieldnames or ())]
+        columnas = {campo: [] for campo in presentes}
+        for fila in lector:
+            try:
+                valores = {campo: fila[campo] for campo in presentes}
+                if 'artefacto' in valores:
+                    artefacto = (valores['artefacto'] or '').strip()
+                    if not artefacto:
+                        raise ValueError("falta el identificador del artefacto")
+                    if len(artefacto) > _LONGITUD_ARTEFACTO:
+                        raise ValueError(
+                            f"el artefacto {artefacto!r} tiene más de "
+                            f"{_LONGITUD_ARTEFACTO} caracteres")
+                    valores['artefacto'] = artefacto
+                if 'agujero' in valores:
+                    valores['agujero'] = int((valores['agujero'] or '').strip())
+                if 'diametro' in valores:
+                    valores['diametro'] = _celda_numerica(valores['diametro'],
+                                                          np.nan)
+                if 'incertidumbre' in valores:
+                    valores['incertidumbre'] = _celda_numerica(
+                        valores['incertidumbre'], 0.0)
+            except ValueError as error:
+                raise ValueError(f"{ruta}, línea {lector.line_num}: {error}") from None
+            if np.isnan(valores.get('diametro', 0.0)):
+                continue
+            for campo in presentes:
+                columnas[campo].append(valores[campo])
+    return columnas
+
+
+def cargar_catalogo(ruta):
+    """Lee un catálogo de un CSV, ``.npy`` o ``.npz``
+
+    - CSV con cabecera ``artefacto, agujero, diametro[, incertidumbre]``.
+    - ``.npy`` con el array estructurado guardado con ``np.save`` o con una
+      matriz de diámetros (artefactos, 12), donde NaN marca un agujero sin
+      medir y el artefacto es el número de fila.
+    - ``.npz`` con una columna por campo.
+
+    La incertidumbre ausente (o vacía en el CSV) se toma como 0, y un
+    diámetro vacío en el CSV es un agujero sin medir.
+    """
+    extension = os.path.splitext(ruta)[1].lower()
+
+    if extension == '.csv':
+        columnas = _leer_csv(ruta)
+    elif extension == '.npy':
+        datos = np.load(ruta)
+        if datos.dtype.names is None:
+            return _desde_matriz(datos)
+        columnas = {campo: datos[campo] for campo in datos.dtype.names}
+    elif extension == '.npz':
+        with np.load(ruta) as datos:
+            columnas = {campo: datos[campo] for campo in datos.files}
+    else:
+        raise ValueError(f"Formato de catálogo no soportado: {extension}")
+
+    faltan = [campo for campo in _CAMPOS[:3] if campo not in columnas]
+    if faltan:
+        raise ValueError(f"Faltan columnas en el catálogo: {', '.join(faltan)}")
+    return crear_catalogo(columnas['artefacto'],
+                          np.asarray(columnas['agujero'], dtype=np.int16),
+                          np.asarray(columnas['diametro'], dtype=float),
+                          np.asarray(columnas.get('incertidumbre', 0.0),
+                                     dtype=float))
+
+
+def es_catalogo(valor):
+    """Indica si ``valor`` es un array con los campos del catálogo"""
+    nombres = getattr(getattr(valor, 'dtype', None), 'names', None)
+    return nombres is not None and all(campo in nombres for campo in _CAMPOS[:3])
+
+
+def diametros_por_artefacto(catalogo):
+    """Pasa el catálogo a una matriz (artefactos, 12) de diámetros
+
+    Devuelve ``(artefactos, diametros)`` con los artefactos en orden de
+    aparición; los agujeros sin medir quedan como NaN.
+    """
+    artefactos, primera, fila = np.unique(catalogo['artefacto'],
+                                          return_index=True,
+                                          return_inverse=True)
+    # np.unique ordena; se recupera el orden de aparición
+    orden = np.argsort(primera)
+    posicion = np.empty_like(orden)
+    posicion[orden] = np.arange(len(orden))
+
+    diametros = np.full((len(artefactos), NUM_AGUJEROS), np.nan)
+    diametros[posicion[fila.ravel()], catalogo['agujero']] = catalogo['diametro']
+    return artefactos[orden], diametros
+
+
+def frecuencias_naturales(diametros, velocidad=343000):
+    """Frecuencia natural ``c / (2d)`` en Hz de cada agujero
+
+    ``diametros`` puede ser un catálogo (una frecuencia por fila) o cualquier
+    array de diámetros en mm; ``velocidad`` va en mm/s.
+    """
+    if es_catalogo(diametros):
+        diametros = diametros['diametro']
+    return velocidad / (2 * np.asarray(diametros, dtype=float))
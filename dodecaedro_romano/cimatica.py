@@ -0,0 +1,380 @@
+"""Patrones cimáticos y aplicaciones megalíticas del dodecaedro"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .fragmentado import ArregloFragmentado
+from .indice import obtener_indice_resonancias
+
+# --- SIMULACIÓN DE EFECTOS CIMÁTICOS ---
+
+# Propiedades del medio según material (CORREGIDO: resonancia como tupla)
+PROPIEDADES_MEDIOS = {
+    'arena': {'densidad': 1.6, 'resonancia': (50, 200)},
+    'agua': {'densidad': 1.0, 'resonancia': (20, 500)},
+    'piedra_polvo': {'densidad': 2.4, 'resonancia': (100, 1000)},
+    'metal_fundido': {'densidad': 7.8, 'resonancia': (200, 2000)}
+}
+
+
+def _campo_base(X, Y):
+    """Radio y campo base de 12 puntas para una malla (o tesela) de coordenadas
+
+    El patrón de 12 puntas suma cos(12*(Theta - n*pi/6)) para n = 0..11. Los
+    12 términos son iguales salvo redondeo, pero se acumulan en el mismo
+    orden que el bucle original para que el resultado sea idéntico bit a bit;
+    la envolvente gaussiana, que no depende de n, se calcula una sola vez.
+    """
+    # Patrón de interferencia dodecaédrica
+    R = np.sqrt(X**2 + Y**2)
+    Theta = np.arctan2(Y, X)
+    envolvente = np.exp(-R**2/0.5)
+
+    # 12 puntas (como los 12 agujeros)
+    base = np.zeros_like(X)
+    for n in range(12):
+        angulo = n * np.pi/6
+        base += np.cos(12*(Theta - angulo)) * envolvente
+    return R, base
+
+
+def _en_resonancia(frecuencia, medio):
+    """Indica si la frecuencia cae en la banda de resonancia del medio"""
+    resonancia = PROPIEDADES_MEDIOS[medio]['resonancia']
+    return frecuencia > resonancia[0] and frecuencia < resonancia[1]
+
+
+# Por encima de esta resolución no se cachea nada: a 1024 cada malla float64
+# ocupa 8 MB, pero a las 20000 de la versión teselada serían 3.2 GB
+_RESOLUCION_MAXIMA_CACHE = 1024
+
+
+def _malla_xy(resolucion):
+    """Coordenadas X, Y de la malla; arrays nuevos y modificables"""
+    # Generar patrones basados en geometría dodecaédrica
+    x = np.linspace(-2, 2, resolucion)
+    y = np.linspace(-2, 2, resolucion)
+    return np.meshgrid(x, y)
+
+
+@lru_cache(maxsize=4)
+def _campo_cacheado(resolucion):
+    """Radio y campo base de una resolución pequeña, de solo lectura"""
+    R, base = _campo_base(*_malla_xy(resolucion))
+    R.setflags(write=False)
+    base.setflags(write=False)
+    return R, base
+
+
+@lru_cache(maxsize=8)
+def _modulacion_cacheada(resolucion, frecuencia):
+    """Campo base modulado por la frecuencia, compartido entre medios"""
+    R, base = _campo_cacheado(resolucion)
+    patron = base * np.sin(2*np.pi*frecuencia*R/10)
+    patron.setflags(write=False)
+    return patron
+
+
+def _modulacion_cimatica(resolucion, frecuencia):
+    """Campo base modulado por la frecuencia
+
+    Hasta ``_RESOLUCION_MAXIMA_CACHE`` el campo base y las últimas
+    modulaciones se cachean (y son de solo lectura); por encima se calculan
+    en cada llamada para no retener mallas enormes durante todo el proceso.
+    """
+    if resolucion <= _RESOLUCION_MAXIMA_CACHE:
+        return _modulacion_cacheada(resolucion, frecuencia)
+    R, patron = _campo_base(*_malla_xy(resolucion))
+    patron *= np.sin(2*np.pi*frecuencia*R/10)
+    return patron
+
+
+def simular_patrones_cimaticos(dodecaedro, frecuencia, medio='arena',
+                               resolucion=1000):
+    """Simula patrones cimáticos generados por el dodecaedro
+
+    Para resoluciones moderadas el campo base se calcula una vez por
+    resolución; cada frecuencia solo añade la modulación y cada medio la
+    amplificación. ``X``, ``Y`` y el patrón devueltos son arrays nuevos.
+    """
+
+    X, Y = _malla_xy(resolucion)
+
+    # Modulación por frecuencia
+    patron = _modulacion_cimatica(resolucion, frecuencia)
+
+    # Efectos de resonancia (CORREGIDO: acceder a tupla)
+    if _en_resonancia(frecuencia, medio):
+        patron = patron * 2.0  # Amplificación por resonancia
+    elif not patron.flags.writeable:
+        patron = patron.copy()
+
+    return X, Y, patron
+
+# --- EVALUACIÓN POR TESELAS FUERA DE MEMORIA ---
+
+
+def calcular_tesela_cimatica(frecuencia, medio='arena', resolucion=1000,
+                             filas=slice(None), columnas=slice(None)):
+    """Calcula solo las filas y columnas indicadas del patrón cimático
+
+    Los valores coinciden bit a bit con los de ``simular_patrones_cimaticos``
+    para la misma resolución, sin construir la malla completa.
+    """
+    coordenadas = np.linspace(-2, 2, resolucion)
+    X, Y = np.meshgrid(coordenadas[columnas], coordenadas[filas])
+    R, patron = _campo_base(X, Y)
+
+    # Modulación por frecuencia
+    patron *= np.sin(2*np.pi*frecuencia*R/10)
+
+    # Efectos de resonancia
+    if _en_resonancia(frecuencia, medio):
+        patron *= 2.0
+    return patron
+
+
+def _teselas(resolucion, tamano_tesela):
+    """Recorre las teselas como pares (slice de filas, slice de columnas)"""
+    for inicio_fila in range(0, resolucion, tamano_tesela):
+        for inicio_columna in range(0, resolucion, tamano_tesela):
+            yield (slice(inicio_fila, inicio_fila + tamano_tesela),
+                   slice(inicio_columna, inicio_columna + tamano_tesela))
+
+
+def simular_patrones_cimaticos_teselado(ruta, frecuencia, medio='arena',
+                                        resolucion=20000, tamano_tesela=1024,
+                                        dtype=np.float32):
+    """Escribe el patrón cimático en un ``.npy`` mapeado en memoria, tesela a tesela
+
+    La memoria máxima depende de ``tamano_tesela`` y no de ``resolucion``.
+    Devuelve el archivo abierto en modo de solo lectura con ``mmap_mode='r'``.
+    """
+    salida = np.lib.format.open_memmap(
+        ruta, mode='w+', dtype=dtype, shape=(resolucion, resolucion))
+
+    for filas, columnas in _teselas(resolucion, tamano_tesela):
+        salida[filas, columnas] = calcular_tesela_cimatica(
+            frecuencia, medio, resolucion, filas, columnas)
+        if columnas.stop >= resolucion:
+            salida.flush()
+
+    del salida
+    return np.load(ruta, mmap_mode='r')
+
+
+def recalcular_tesela_cimatica(ruta, frecuencia, medio, fila, columna,
+                               tamano_tesela=1024):
+    """Vuelve a calcular y escribir la tesela (fila, columna) de un archivo existente"""
+    salida = np.load(ruta, mmap_mode='r+')
+    resolucion = salida.shape[0]
+    filas = slice(fila * tamano_tesela, (fila + 1) * tamano_tesela)
+    columnas = slice(columna * tamano_tesela, (columna + 1) * tamano_tesela)
+
+    salida[filas, columnas] = calcular_tesela_cimatica(
+        frecuencia, medio, resolucion, filas, columnas)
+    salida.flush()
+
+# --- BARRIDO REANUDABLE EN DISCO ---
+
+
+def barrido_cimatico_fragmentado(ruta, frecuencias, medios=('arena',),
+                                 resolucion=1000, frecuencias_por_fragmento=8,
+                                 dtype=np.float32, limite_memoria=256 << 20):
+    """Añade los patrones de cada frecuencia a un ``ArregloFragmentado``
+
+    El array tiene forma (frecuencias, medios, resolucion, resolucion) y
+    crece por el eje de frecuencias. Si ``ruta`` ya existe se reanuda: las
+    frecuencias ya guardadas (``atributos['frecuencias']``) se saltan. La
+    memoria la limita ``limite_memoria`` y no el número de frecuencias.
+    """
+    medios = list(medios)
+    if os.path.exists(os.path.join(ruta, 'meta.json')):
+        arreglo = ArregloFragmentado(ruta, limite_memoria=limite_memoria)
+        if arreglo.atributos.get('medios') != medios or \
+                arreglo.shape[2:] != (resolucion, resolucion):
+            raise ValueError(f"El barrido en {ruta} tiene otros medios o resolución")
+    else:
+        arreglo = ArregloFragmentado.crear(
+            ruta, (0, len(medios), resolucion, resolucion),
+            (frecuencias_por_fragmento, 1, resolucion, resolucion), dtype=dtype,
+            atributos={'frecuencias': [], 'medios': medios},
+            limite_memoria=limite_memoria)
+
+    hechas = set(arreglo.atributos['frecuencias'])
+    with arreglo:
+        for frecuencia in frecuencias:
+            frecuencia = float(frecuencia)
+            if frecuencia in hechas:
+                continue
+            bloque = np.empty((1, len(medios), resolucion, resolucion), dtype)
+            for j, medio in enumerate(medios):
+                bloque[0, j] = simular_patrones_cimaticos(
+                    None, frecuencia, medio, resolucion)[2]
+            # Antes de anexar: un flush automático guarda ambas cosas juntas
+            arreglo.atributos['frecuencias'].append(frecuencia)
+            arreglo.anexar(bloque)
+            hechas.add(frecuencia)
+    return arreglo
+
+# --- EVALUACIÓN PARALELA EN MEMORIA COMPARTIDA ---
+
+
+class CamposCompartidos:
+    """Patrones cimáticos alojados en un bloque de ``shared_memory``
+
+    ``campos`` tiene forma (frecuencias, resolucion, resolucion) y es una vista
+    sobre la memoria compartida, sin copias. Hay que llamar a ``liberar()`` (o
+    usar el objeto en un bloque ``with``) cuando ya no se necesiten.
+    """
+
+    def __init__(self, memoria, forma, dtype):
+        self.memoria = memoria
+        self.campos = np.ndarray(forma, dtype=dtype, buffer=memoria.buf)
+
+    def liberar(self):
+        """Cierra y elimina el bloque de memoria compartida"""
+        self.campos = None
+        self.memoria.close()
+        self.memoria.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.liberar()
+
+
+def _calcular_banda(nombre, forma, dtype, frecuencias, medio, filas):
+    """Trabajador: escribe una banda de filas de todos los campos en la memoria compartida"""
+    memoria = shared_memory.SharedMemory(name=nombre)
+    try:
+        campos = np.ndarray(forma, dtype=dtype, buffer=memoria.buf)
+        coordenadas = np.linspace(-2, 2, forma[1])
+        X, Y = np.meshgrid(coordenadas, coordenadas[filas])
+        R, base = _campo_base(X, Y)
+
+        for i, frecuencia in enumerate(frecuencias):
+            patron = base * np.sin(2*np.pi*frecuencia*R/10)
+            if _en_resonancia(frecuencia, medio):
+                patron *= 2.0
+            campos[i, filas] = patron
+        del campos
+    finally:
+        memoria.close()
+
+
+def simular_patrones_cimaticos_paralelo(frecuencias, medio='arena',
+                                        resolucion=1000, procesos=None,
+                                        dtype=np.float32, bandas_por_proceso=4):
+    """Evalúa un lote de frecuencias repartiendo bandas de filas entre procesos
+
+    Cada trabajador calcula el campo base de su banda una sola vez y escribe
+    todas las frecuencias directamente en un único bloque de
+    ``multiprocessing.shared_memory``; el resultado no se serializa ni se
+    copia. Devuelve un ``CamposCompartidos``.
+    """
+    frecuencias = [float(f) for f in frecuencias]
+    procesos = procesos or os.cpu_count()
+    dtype = np.dtype(dtype)
+    forma = (len(frecuencias), resolucion, resolucion)
+
+    memoria = shared_memory.SharedMemory(
+        create=True, size=max(1, int(np.prod(forma)) * dtype.itemsize))
+    resultado = CamposCompartidos(memoria, forma, dtype)
+
+    filas_banda = -(-resolucion // (procesos * bandas_por_proceso))
+    bandas = [slice(inicio, inicio + filas_banda)
+              for inicio in range(0, resolucion, filas_banda)]
+    try:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            futuros = [pool.submit(_calcular_banda, memoria.name, forma,
+                                   dtype.str, frecuencias, medio, filas)
+                       for filas in bandas]
+            for futuro in futuros:
+                futuro.result()
+    except BaseException:
+        resultado.liberar()
+        raise
+    return resultado
+
+# --- SIMULACIÓN CONSTRUCCIÓN MEGALÍTICA ---
+
+
+def simular_construccion_megalitica(dodecaedro, frecuencia=432):
+    """Simula cómo el dodecaedro podría usarse en construcción megalítica"""
+
+    print("🧱 SIMULACIÓN CONSTRUCCIÓN MEGALÍTICA")
+    print("=" * 50)
+
+    # Frecuencias de resonancia para diferentes materiales de construcción
+    materiales = {
+        'granito': {'frecuencia_resonancia': 320, 'densidad': 2.7},
+        'caliza': {'frecuencia_resonancia': 280, 'densidad': 2.5},
+        'arenisca': {'frecuencia_resonancia': 240, 'densidad': 2.3},
+        'arcilla': {'frecuencia_resonancia': 180, 'densidad': 1.8}
+    }
+
+    resultados = []
+
+    for material, props in materiales.items():
+        # Calcular acoplamiento acústico
+        acoplamiento = frecuencia / props['frecuencia_resonancia']
+        eficiencia = np.exp(-abs(1 - acoplamiento)**2)
+
+        # Calcular fuerza de levitación acústica estimada
+        # F = ρ * A * a^2 * ω^2 / (2 * c^2) [aproximación]
+        fuerza = props['densidad'] * 0.1 * \
+            (0.01)**2 * (2*np.pi*frecuencia)**2 / (2 * (343)**2)
+        fuerza *= eficiencia * 1000  # Escalar para visualización
+
+        resultados.append({
+            'material': material,
+            'acoplamiento': acoplamiento,
+            'eficiencia': eficiencia,
+            'fuerza_estimada': fuerza
+        })
+
+        print(f"{material:10} | Acoplamiento: {acoplamiento:.2f} | Eficiencia: {eficiencia:.2%} | Fuerza: {fuerza:.4f} N")
+
+    return resultados
+
+# --- ANALIZAR CONEXIÓN CON HIPOGEO DE MALTA ---
+
+
+def analizar_compatibilidad_hipogeo(frecuencia_hipogeo=110, tolerancia=50,
+                                    velocidad=343000):
+    """Analiza si el dodecaedro podría haber sido usado en el hipogeo"""
+
+    # Frecuencias naturales de los diámetros reales del modelo SCAD
+    indice = obtener_indice_resonancias(velocidad)
+    _, ajustes, _ = indice.consultar([frecuencia_hipogeo], tolerancia,
+                                     estricto=True, orden='agujero')
+
+    print("🔍 ANALIZANDO CONEXIÓN CON HIPOGEO DE HAL SAFLIENI (Malta)")
+    print("=" * 60)
+    print(f"Agujeros que resonarían en el Hipogeo ({frecuencia_hipogeo} Hz):")
+    print("Índice | Diámetro (mm) | Frecuencia natural | Diferencia")
+    print("-" * 65)
+
+    mejores_ajustes = []
+
+    for i, (diametro, freq_natural) in enumerate(zip(indice.diametros,
+                                                     indice.frecuencias)):
+        diferencia = abs(freq_natural - frecuencia_hipogeo)
+
+        if i in ajustes:  # ±50 Hz de tolerancia por defecto
+            estrella = "★"
+            mejores_ajustes.append((i, float(diametro), float(freq_natural),
+                                    float(diferencia)))
+        else:
+            estrella = ""
+
+        print(
+            f"{i:6} | {diametro:13.1f} | {freq_natural:17.1f} Hz | {diferencia:8.1f} Hz {estrella}")
+
+    return mejores_ajustes
@@ -0,0 +1,199 @@
+"""Difracción con la geometría real del dodecaedro (unidades en mm)"""
+
+import itertools
+
+import numpy as np
+
+from .cache import CacheDisco, huella_parametros
+from .catalogo import diametros_por_artefacto, es_catalogo
+from .geometria import obtener_geometria
+
+# --- SIMULACIÓN CON DIFRACCIÓN REAL ---
+
+
+def _velocidad_onda(tipo_onda):
+    """Velocidad de propagación en mm/s según el tipo de onda"""
+    if tipo_onda == 'sonido':
+        return 343000  # mm/s
+    return 3e11  # mm/s (luz)
+
+
+def _amplitudes_difraccion(geometria, k, diametros=None):
+    """Amplitudes de difracción para todos los pares de agujeros
+
+    ``k`` es un array de números de onda y ``diametros`` (por defecto, los de
+    la geometría) un array (..., 12). Devuelve las amplitudes con forma
+    (..., entradas, salidas, len(k)); la diagonal (agujero de entrada) es cero.
+    """
+
+    diametros = geometria.diametros if diametros is None else diametros
+    diametros = np.asarray(diametros, dtype=float)[..., None, :]
+    distancia = geometria.distancias
+
+    # Patrón de difracción de Airy para abertura circular
+    x = k * ((diametros / 2) * np.sin(geometria.angulos))[..., None]
+    from scipy import special
+
+    pequeno = np.abs(x) < 1e-10
+    factor_difraccion = np.where(
+        pequeno, 1.0, 2 * special.j1(x) / np.where(pequeno, 1.0, x))
+
+    # Atenuación por distancia y geometría
+    atenuacion_distancia = 1 / (1 + (distancia/geometria.radio_base)**2)
+    atenuacion_geometrica = np.exp(-distancia/(2*geometria.radio_base))
+    # Factor por tamaño de agujero; un agujero sin medir (NaN) no altera la
+    # normalización de los demás y deja en NaN solo su fila y su columna
+    escala = (atenuacion_distancia * atenuacion_geometrica *
+              (diametros / np.nanmax(diametros, axis=-1, keepdims=True)))
+    escala = escala * (1 - np.eye(len(distancia)))
+    escala = np.where(np.isnan(np.swapaxes(diametros, -1, -2)), np.nan, escala)
+
+    return factor_difraccion * escala[..., None]
+
+
+def matriz_transferencia_real(frecuencias, tipo_onda='sonido', diametros=None):
+    """Matriz de transferencia compleja agujero-a-agujero del dodecaedro real
+
+    Devuelve ``H`` con forma (entrada, salida, frecuencia), tal que la señal en
+    el agujero de salida es ``Im(H * exp(i*2*pi*f*t))``; la diagonal es cero.
+    Distancias, ángulos y factores de Airy se calculan una sola vez para
+    todas las entradas.
+
+    ``diametros`` sustituye los diámetros medidos de los agujeros (en la misma
+    escala que las listas SCAD) sobre la geometría de referencia: un array
+    (..., 12) o un catálogo de ``cargar_catalogo``, y entonces ``H`` tiene
+    forma (..., entrada, salida, frecuencia), con un artefacto por fila. Los
+    agujeros sin medir (NaN) dan NaN.
+    """
+
+    geometria = obtener_geometria()
+    frecuencias = np.atleast_1d(np.asarray(frecuencias, dtype=float))
+    if es_catalogo(diametros):
+        _, diametros = diametros_por_artefacto(diametros)
+    if diametros is not None:
+        diametros = np.asarray(diametros, dtype=float) * geometria.ajuste
+
+    return _transferencia(geometria, frecuencias, _velocidad_onda(tipo_onda),
+                          diametros)
+
+
+def _transferencia(geometria, frecuencias, velocidad, diametros=None):
+    """Matriz de transferencia (..., entrada, salida, frecuencia) para una geometría"""
+    k = 2 * np.pi * np.asarray(frecuencias, dtype=float) / velocidad
+    amplitudes = _amplitudes_difraccion(geometria, k, diametros)
+
+    return amplitudes * np.exp(-1j * k * geometria.distancias[..., None])
+
+
+def simular_difraccion_real(agujero_entrada, frecuencia, tipo_onda='sonido'):
+    """Simula la difracción con la geometría real del dodecaedro"""
+
+    geometria = obtener_geometria()
+
+    # Configurar onda
+    longitud_onda = _velocidad_onda(tipo_onda) / frecuencia
+    k = 2 * np.pi / longitud_onda  # número de onda
+
+    amplitudes = _amplitudes_difraccion(geometria, np.array([k]))
+    amplitud = amplitudes[agujero_entrada, :, 0]
+    distancia = geometria.distancias[agujero_entrada]
+
+    # Onda resultante con difracción en cada agujero
+    t = np.linspace(0, 0.01, 1000)
+    fase = 2 * np.pi * frecuencia * t - k * distancia[:, None]
+    patrones_salida = amplitud[:, None] * np.sin(fase)
+
+    # Contribución al interior (promedio ponderado)
+    patron_interior = 0.2 * patrones_salida.sum(axis=0)
+
+    return (patron_interior, patrones_salida, geometria.centros,
+            geometria.diametros, geometria.vertices)
+
+
+# --- BARRIDO DE PARÁMETROS CON CACHÉ ---
+
+
+def _dtype_cache(num_agujeros):
+    """Fila de la caché: una frecuencia y su matriz de transferencia"""
+    return np.dtype([('frecuencia', 'f8'),
+                     ('H', 'c16', (num_agujeros, num_agujeros))])
+
+
+def barrido_difraccion(frecuencias, velocidades=None, ajustes=None,
+                       diametros=None, tipo_onda='sonido', cache=None):
+    """Matrices de transferencia para una rejilla de parámetros
+
+    La rejilla es el producto de ``velocidades`` (mm/s, por defecto la de
+    ``tipo_onda``), ``ajustes`` (por defecto ``AJUSTE``) y ``diametros``, una
+    lista de pares ``(superior, inferior)`` de listas SCAD (por defecto las
+    del modelo). Cada configuración evalúa todas sus frecuencias de una vez.
+
+    ``cache`` es un directorio o una ``CacheDisco``: cada configuración se
+    guarda con la huella de sus parámetros en un único ``.npy`` con sus
+    frecuencias y matrices, y en la siguiente ejecución solo se calculan (y
+    se añaden a esa entrada) las frecuencias nuevas. Devuelve
+    ``(configuraciones, H)``, con ``H`` de forma (configuración, entrada,
+    salida, frecuencia).
+    """
+    frecuencias = np.atleast_1d(np.asarray(frecuencias, dtype=float))
+    velocidades = [_velocidad_onda(tipo_onda)] if velocidades is None else velocidades
+    ajustes = [None] if ajustes is None else ajustes
+    diametros = [(None, None)] if diametros is None else diametros
+    if cache is not None and not isinstance(cache, CacheDisco):
+        cache = CacheDisco(cache)
+
+    rejilla = list(itertools.product(velocidades, ajustes, diametros))
+    num_agujeros = len(obtener_geometria().diametros)
+    resultado = np.empty((len(rejilla), num_agujeros, num_agujeros,
+                          len(frecuencias)), dtype=complex)
+
+    configuraciones = []
+    for c, (velocidad, ajuste, (superior, inferior)) in enumerate(rejilla):
+        geometria = obtener_geometria(ajuste=ajuste,
+                                      diametros_superior=superior,
+                                      diametros_inferior=inferior)
+        configuracion = {
+            'velocidad': float(velocidad),
+            'ajuste': geometria.ajuste,
+            'radio_base': geometria.radio_base,
+            'distancia_centro': geometria.distancia_centro,
+            'diametros_scad': geometria.diametros_scad.tolist(),
+        }
+        configuraciones.append(configuracion)
+
+        # Frecuencias ya calculadas en una ejecución anterior
+        pendientes = np.arange(len(frecuencias))
+        guardado = None
+        if cache is not None:
+            clave = huella_parametros(dict(configuracion,
+                                           modelo='difraccion_real'))
+            try:
+                guardado = cache.cargar(clave)
+            except KeyError:
+                pass
+        if guardado is not None:
+            orden = np.argsort(guardado['frecuencia'])
+            posicion = np.clip(np.searchsorted(guardado['frecuencia'],
+                                               frecuencias, sorter=orden),
+                               0, len(orden) - 1)
+            fila = orden[posicion]
+            encontrada = guardado['frecuencia'][fila] == frecuencias
+            resultado[c][..., encontrada] = np.moveaxis(
+                guardado['H'][fila[encontrada]], 0, -1)
+            pendientes = pendientes[~encontrada]
+
+        if len(pendientes):
+            nuevos = _transferencia(geometria, frecuencias[pendientes], velocidad)
+            resultado[c][..., pendientes] = nuevos
+            if cache is not None:
+                # Las frecuencias nuevas (sin repetir) se añaden a la entrada
+                nuevas, unicas = np.unique(frecuencias[pendientes],
+                                           return_index=True)
+                bloque = np.empty(len(nuevas), dtype=_dtype_cache(num_agujeros))
+                bloque['frecuencia'] = nuevas
+                bloque['H'] = np.moveaxis(nuevos[..., unicas], -1, 0)
+                if guardado is not None:
+                    bloque = np.concatenate([guardado, bloque])
+                cache.guardar(clave, bloque)
+
+    return configuraciones, resultado
@@ -0,0 +1,231 @@
+"""Análisis espectral compartido: FFT real, Welch y espectrograma por bloques y bandas estrechas con zoom FFT"""
+
+import numpy as np
+
+
+def espectro_real(senal, fs, axis=-1):
+    """Espectro de amplitud de una señal real con FFT de longitud rápida
+
+    La señal se rellena con ceros hasta la siguiente longitud rápida para
+    ``rfft``. Solo se calculan las frecuencias no negativas. Devuelve
+    ``(frecuencias, magnitud)``, y ``magnitud`` conserva los demás ejes de
+    ``senal``.
+    """
+    from scipy import fft
+
+    senal = np.asarray(senal)
+    longitud = fft.next_fast_len(senal.shape[axis], real=True)
+    magnitud = np.abs(fft.rfft(senal, n=longitud, axis=axis))
+    frecuencias = fft.rfftfreq(longitud, 1/fs)
+    return frecuencias, magnitud
+
+
+def _bloques(senal, tamano_bloque):
+    """Trocea un array en bloques o deja pasar un iterable de bloques"""
+    if isinstance(senal, np.ndarray):
+        for inicio in range(0, len(senal), tamano_bloque):
+            yield senal[inicio:inicio + tamano_bloque]
+    else:
+        yield from senal
+
+
+def _segmentos(senal, nperseg, salto, tamano_bloque):
+    """Recorre la señal por bloques y devuelve lotes de segmentos completos
+
+    Cada lote es un array ``(segmentos, nperseg)`` sin la media de cada
+    segmento. Entre bloques solo se conserva la cola que aún no forma un
+    segmento, y cada lote tiene como mucho ``tamano_bloque`` muestras.
+    """
+    por_lote = max(1, tamano_bloque // nperseg)
+    resto = np.empty(0)
+
+    for bloque in _bloques(senal, tamano_bloque):
+        datos = np.concatenate([resto, np.asarray(bloque, dtype=float)])
+        if len(datos) < nperseg:
+            resto = datos
+            continue
+
+        ventanas = np.lib.stride_tricks.sliding_window_view(
+            datos, nperseg)[::salto]
+        for inicio in range(0, len(ventanas), por_lote):
+            segmentos = ventanas[inicio:inicio + por_lote]
+            yield segmentos - segmentos.mean(axis=1, keepdims=True)
+        resto = datos[len(ventanas) * salto:]
+
+
+def _densidad_unilateral(potencia, fs, win):
+    """Escala |rfft|² a densidad espectral unilateral, como ``scipy.signal``"""
+    potencia = potencia / (fs * np.sum(win**2))
+    # Duplicar todo salvo DC y, si existe, Nyquist
+    if len(win) % 2:
+        potencia[..., 1:] *= 2
+    else:
+        potencia[..., 1:-1] *= 2
+    return potencia
+
+
+def psd_welch(senal, fs, nperseg=4096, solapamiento=None, ventana='hann',
+              tamano_bloque=1 << 20):
+    """Densidad espectral de potencia de Welch consumiendo la señal por bloques
+
+    ``senal`` puede ser un array o cualquier iterable de bloques (por ejemplo,
+    ``generar_sonido_tibetano_bloques``). Solo se guardan en memoria el bloque
+    actual y el resto del segmento anterior, así que la longitud de la señal no
+    limita la memoria. Con un array da el mismo resultado que
+    ``scipy.signal.welch`` con ``detrend='constant'`` y escala de densidad.
+    Devuelve ``(frecuencias, psd)``.
+    """
+    from scipy import fft, signal
+
+    solapamiento = nperseg // 2 if solapamiento is None else solapamiento
+    salto = nperseg - solapamiento
+    win = signal.get_window(ventana, nperseg)
+
+    suma = np.zeros(nperseg // 2 + 1)
+    num_segmentos = 0
+    for segmentos in _segmentos(senal, nperseg, salto, tamano_bloque):
+        suma += (np.abs(fft.rfft(segmentos * win, axis=1))**2).sum(axis=0)
+        num_segmentos += len(segmentos)
+
+    if num_segmentos == 0:
+        raise ValueError(f"La señal es más corta que nperseg={nperseg}")
+
+    psd = _densidad_unilateral(suma / num_segmentos, fs, win)
+    return fft.rfftfreq(nperseg, 1/fs), psd
+
+
+def espectrograma(senal, fs, ruta, nperseg=4096, salto=None, ventana='hann',
+                  num_muestras=None, tamano_bloque=1 << 20, dtype=np.float32):
+    """Espectrograma (STFT) escrito trama a trama en un ``.npy`` mapeado en memoria
+
+    ``senal`` puede ser un array o un iterable de bloques; en ese caso hay que
+    indicar ``num_muestras`` para reservar el archivo. La memoria usada depende
+    de ``tamano_bloque`` y no de la duración, así que sirve para grabaciones de
+    horas. Cada fila es la densidad espectral de una trama: el resultado es el
+    de ``scipy.signal.spectrogram`` con la misma ventana y solapamiento, pero
+    traspuesto ``(tramas, frecuencias)``. Devuelve ``(frecuencias, tiempos, espectrograma)``
+    con el archivo abierto en modo de solo lectura.
+    """
+    from scipy import fft, signal
+
+    salto = nperseg - nperseg // 8 if salto is None else salto
+    if num_muestras is None:
+        if not isinstance(senal, np.ndarray):
+            raise ValueError("num_muestras es obligatorio si la señal llega por bloques")
+        num_muestras = len(senal)
+    if num_muestras < nperseg:
+        raise ValueError(f"La señal es más corta que nperseg={nperseg}")
+
+    win = signal.get_window(ventana, nperseg)
+    num_tramas = 1 + (num_muestras - nperseg) // salto
+    salida = np.lib.format.open_memmap(
+        ruta, mode='w+', dtype=dtype, shape=(num_tramas, nperseg // 2 + 1))
+
+    escritas = 0
+    for segmentos in _segmentos(senal, nperseg, salto, tamano_bloque):
+        if len(segmentos) > num_tramas - escritas:
+            del salida
+            raise ValueError(f"La señal da más de las {num_tramas} tramas "
+                             f"de num_muestras={num_muestras}")
+        potencia = np.abs(fft.rfft(segmentos * win, axis=1))**2
+        salida[escritas:escritas + len(segmentos)] = _densidad_unilateral(
+            potencia, fs, win)
+        escritas += len(segmentos)
+        salida.flush()
+
+    del salida
+    if escritas != num_tramas:
+        raise ValueError(f"Se esperaban {num_tramas} tramas y la señal dio {escritas}")
+
+    tiempos = (nperseg / 2 + salto * np.arange(num_tramas)) / fs
+    return fft.rfftfreq(nperseg, 1/fs), tiempos, np.load(ruta, mmap_mode='r')
+
+
+def centros_de_frecuencias(tabla, armonicos=True):
+    """Frecuencias fundamentales (y armónicos) de una tabla de instrumentos o mantras
+
+    Acepta los diccionarios del proyecto: ``FRECUENCIAS_TIBETANAS`` y la tabla
+    de ``analizar_frecuencias_mantricas`` (``'frecuencia_base'`` y
+    ``'armonicos'``), ``INSTRUMENTOS_ANTIGUOS`` (``'frecuencia'``) y
+    ``ANCIENT_INSTRUMENTS`` (``'frequency'``). Devuelve una lista ordenada y sin
+    repetidos.
+    """
+    centros = set()
+    for datos in tabla.values():
+        for clave in ('frecuencia_base', 'frecuencia', 'frequency'):
+            if clave in datos:
+                centros.add(float(datos[clave]))
+        if armonicos:
+            centros.update(float(f) for f in datos.get('armonicos', []))
+    return sorted(centros)
+
+
+def analizar_bandas(senal, fs, centros, ancho=10.0, resolucion=0.1,
+                    ventana=None, bloques=8):
+    """Espectros de alta resolución en bandas estrechas (zoom FFT)
+
+    Cada banda ``[centro - ancho/2, centro + ancho/2]`` se baja a banda base
+    multiplicando por ``exp(-2πi·centro·t)``, se filtra paso bajo y se diezma
+    por ``fs / (4·ancho)``; sobre esas pocas muestras una chirp-z evalúa solo
+    las frecuencias de la banda, con paso ``resolucion`` Hz. La magnitud es la
+    de una ``rfft`` rellenada con ceros hasta ``fs/resolucion`` muestras salvo
+    el rizado del filtro (del orden de 1e-4 del pico), pero el coste crece con
+    la longitud de la señal y el número de bandas, no con ``fs/resolucion``.
+    ``bloques`` es la longitud del filtro en muestras diezmadas. Devuelve
+    ``{centro: (frecuencias, magnitud)}``.
+    """
+    from scipy import signal
+
+    senal = np.asarray(senal, dtype=float)
+    if ventana is not None:
+        senal = senal * signal.get_window(ventana, len(senal))
+    centros = list(centros)
+    puntos = int(round(ancho / resolucion)) + 1
+
+    # La banda ocupa como mucho 1/8 de la frecuencia de muestreo diezmada: el
+    # filtro (corte a la mitad de la nueva Nyquist) deja pasar la banda
+    # entera y atenúa 80 dB todo lo que se plegaría sobre ella
+    factor = int(fs // (4 * ancho))
+    if factor > 1:
+        filtro = signal.firwin(bloques * factor, fs / (2 * factor),
+                               window=('kaiser', signal.kaiser_beta(80)),
+                               fs=fs)
+    else:
+        factor, bloques, filtro = 1, 1, np.ones(1)
+
+    # Señal en filas de ``factor`` muestras, con ceros delante para que las
+    # primeras salidas del filtro vean el principio de la señal
+    salidas = bloques - 1 + -(-len(senal) // factor)
+    relleno = np.zeros((salidas + bloques - 1) * factor)
+    relleno[(bloques - 1) * factor:][:len(senal)] = senal
+    filas = relleno.reshape(-1, factor)
+
+    # Filtro de cada banda trasladado a su centro, g[t]·exp(-iωt) con
+    # t = k·factor + b, en forma (factor, bloques, bandas)
+    fase = -2j * np.pi / fs * np.asarray(centros, dtype=float)
+    coeficientes = (np.exp(np.outer(np.arange(factor), fase))[:, None]
+                    * np.exp(np.outer(np.arange(bloques) * factor, fase))
+                    * filtro.reshape(bloques, factor).T[:, :, None])
+
+    # Mezcla, filtrado y diezmado de todas las bandas en un solo producto
+    # real; la salida m suma la fila m + k por el tramo k del filtro
+    productos = filas @ np.concatenate(
+        [coeficientes.real, coeficientes.imag], axis=1).reshape(factor, -1)
+    productos = productos.reshape(len(filas), 2, bloques, len(centros))
+    diezmada = np.zeros((salidas, len(centros)), dtype=complex)
+    for k in range(bloques):
+        diezmada += (productos[k:k + salidas, 0, k]
+                     + 1j * productos[k:k + salidas, 1, k])
+    diezmada *= np.exp(np.outer(np.arange(salidas) * factor, fase))
+
+    # Chirp-z sobre las frecuencias de la banda relativas al centro. Solo se
+    # devuelve la magnitud, así que no hace falta corregir la fase constante
+    # del retardo del filtro
+    paso = factor / fs
+    magnitud = factor * np.abs(signal.czt(
+        diezmada, puntos, w=np.exp(-2j * np.pi * resolucion * paso),
+        a=np.exp(-1j * np.pi * ancho * paso), axis=0))
+
+    desplazamientos = -ancho / 2 + resolucion * np.arange(puntos)
+    return {centro: (centro + desplazamientos, magnitud[:, i])
+            for i, centro in enumerate(centros)}
@@ -0,0 +1,242 @@
+"""Array en disco por fragmentos que puede crecer en cualquier eje
+
+Un ``ArregloFragmentado`` es una carpeta con ``meta.json`` (forma, forma de
+fragmento, dtype, valor de relleno, versión de cada fragmento y atributos
+libres) y un ``.npy`` por fragmento en ``fragmentos/``. Las lecturas solo
+abren los fragmentos que tocan, y las escrituras se acumulan en memoria hasta
+``limite_memoria`` y se vuelcan con ``flush``.
+
+Un fragmento que ya existe nunca se sobrescribe: ``flush`` escribe la nueva
+versión con otro nombre, después sustituye ``meta.json`` (que apunta a las
+versiones nuevas) y solo entonces borra las anteriores. Cada archivo se
+escribe en un temporal y se publica con ``os.replace``, así que si el proceso
+se interrumpe el array en disco queda como en el último ``flush``, tanto
+para anexos como para escrituras sobre datos existentes. Pensado para un
+único escritor; un lector abierto antes de un ``flush`` debe volver a abrir
+el array para ver los cambios.
+"""
+
+import itertools
+import json
+import os
+import tempfile
+
+import numpy as np
+
+_META = 'meta.json'
+
+
+def _escribir_atomico(ruta, escribir):
+    """Escribe con ``escribir(archivo)`` en un temporal y lo renombra a ``ruta``"""
+    descriptor, temporal = tempfile.mkstemp(dir=os.path.dirname(ruta),
+                                            suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'wb') as archivo:
+            escribir(archivo)
+        os.replace(temporal, ruta)
+    except BaseException:
+        os.unlink(temporal)
+        raise
+
+
+def _contiguo(posiciones):
+    """Indica si las posiciones son consecutivas y crecientes"""
+    return posiciones[-1] - posiciones[0] + 1 == len(posiciones) and \
+        np.all(np.diff(posiciones) == 1)
+
+
+class ArregloFragmentado:
+    """Array por fragmentos en ``ruta``; se crea con ``ArregloFragmentado.crear``"""
+
+    def __init__(self, ruta, limite_memoria=64 << 20):
+        self.ruta = ruta
+        with open(os.path.join(ruta, _META), encoding='utf-8') as archivo:
+            meta = json.load(archivo)
+        self.forma = tuple(meta['forma'])
+        self.fragmentos = tuple(meta['fragmentos'])
+        self.dtype = np.dtype(meta['dtype'])
+        self.relleno = meta['relleno']
+        self.atributos = meta['atributos']
+        self._versiones = meta.get('versiones', {})
+        self.limite_memoria = limite_memoria
+        self._sucios = {}
+
+    @classmethod
+    def crear(cls, ruta, forma, fragmentos, dtype=np.float32, relleno=0,
+              atributos=None, **opciones):
+        """Crea un array vacío; ``forma`` puede tener ceros en los ejes que crecerán"""
+        if len(forma) != len(fragmentos):
+            raise ValueError("forma y fragmentos deben tener el mismo número de ejes")
+        os.makedirs(os.path.join(ruta, 'fragmentos'), exist_ok=True)
+        if os.path.exists(os.path.join(ruta, _META)):
+            raise FileExistsError(f"Ya existe un array en {ruta}")
+        meta = {'forma': list(forma), 'fragmentos': list(fragmentos),
+                'dtype': np.dtype(dtype).str, 'relleno': relleno,
+                'versiones': {}, 'atributos': atributos or {}}
+        _escribir_atomico(os.path.join(ruta, _META),
+                          lambda archivo: archivo.write(json.dumps(meta).encode()))
+        return cls(ruta, **opciones)
+
+    # --- PROPIEDADES ---
+    @property
+    def shape(self):
+        return self.forma
+
+    @property
+    def ndim(self):
+        return len(self.forma)
+
+    def __len__(self):
+        return self.forma[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.flush()
+
+    # --- FRAGMENTOS ---
+    def _ruta_fragmento(self, indice, version=None):
+        """Archivo de un fragmento; por defecto, la versión publicada"""
+        nombre = '.'.join(map(str, indice))
+        if version is None:
+            version = self._versiones.get(nombre, 0)
+        sufijo = f'~{version}' if version else ''
+        return os.path.join(self.ruta, 'fragmentos', nombre + sufijo + '.npy')
+
+    def _fragmento(self, indice, escribir=False):
+        """Fragmento ``indice``: sucio en memoria, en disco o ``None`` si no existe"""
+        if indice in self._sucios:
+            return self._sucios[indice]
+        ruta = self._ruta_fragmento(indice)
+        if os.path.exists(ruta):
+            fragmento = np.load(ruta, mmap_mode=None if escribir else 'r')
+        elif escribir:
+            fragmento = np.full(self.fragmentos, self.relleno, dtype=self.dtype)
+        else:
+            return None
+        if escribir:
+            self._sucios[indice] = fragmento
+        return fragmento
+
+    def _seleccion(self, clave):
+        """Índices por eje de ``clave`` y ejes que desaparecen (índices enteros)"""
+        if not isinstance(clave, tuple):
+            clave = (clave,)
+        if Ellipsis in clave:
+            posicion = clave.index(Ellipsis)
+            relleno = (slice(None),) * (self.ndim - len(clave) + 1)
+            clave = clave[:posicion] + relleno + clave[posicion + 1:]
+        clave = clave + (slice(None),) * (self.ndim - len(clave))
+        if len(clave) != self.ndim:
+            raise IndexError(f"Demasiados índices para un array de {self.ndim} ejes")
+
+        posiciones, eliminados = [], []
+        for eje, (indice, tamano) in enumerate(zip(clave, self.forma)):
+            if isinstance(indice, slice):
+                posiciones.append(np.arange(*indice.indices(tamano)))
+            else:
+                indice = int(indice)
+                if not -tamano <= indice < tamano:
+                    raise IndexError(f"Índice {indice} fuera del eje {eje} de tamaño {tamano}")
+                posiciones.append(np.array([indice % tamano]))
+                eliminados.append(eje)
+        return posiciones, tuple(eliminados)
+
+    def _recorrer(self, posiciones):
+        """Para cada fragmento tocado: (índice, posiciones en la salida, locales)"""
+        grupos = []
+        for eje, pos in enumerate(posiciones):
+            numero = pos // self.fragmentos[eje]
+            grupos.append([(int(n), np.nonzero(numero == n)[0],
+                            pos[numero == n] - n * self.fragmentos[eje])
+                           for n in np.unique(numero)])
+        for combinacion in itertools.product(*grupos):
+            indice = tuple(n for n, _, _ in combinacion)
+            salida = [s for _, s, _ in combinacion]
+            locales = [l for _, _, l in combinacion]
+            if all(_contiguo(p) for p in salida + locales):
+                # Caso habitual (paso 1): vistas con slices en lugar de copias
+                yield (indice, tuple(slice(p[0], p[-1] + 1) for p in salida),
+                       tuple(slice(p[0], p[-1] + 1) for p in locales))
+            else:
+                yield indice, np.ix_(*salida), np.ix_(*locales)
+
+    # --- LECTURA Y ESCRITURA ---
+    def __getitem__(self, clave):
+        posiciones, eliminados = self._seleccion(clave)
+        resultado = np.full([len(p) for p in posiciones], self.relleno,
+                            dtype=self.dtype)
+        for indice, salida, locales in self._recorrer(posiciones):
+            fragmento = self._fragmento(indice)
+            if fragmento is not None:
+                resultado[salida] = fragmento[locales]
+        return resultado.squeeze(axis=eliminados) if eliminados else resultado
+
+    def __setitem__(self, clave, valores):
+        self._escribir(clave, valores)
+        self._liberar_memoria()
+
+    def _escribir(self, clave, valores):
+        """Escribe en los fragmentos en memoria, sin volcar a disco"""
+        posiciones, eliminados = self._seleccion(clave)
+        forma = [len(p) for p in posiciones]
+        valores = np.asarray(valores, dtype=self.dtype)
+        if eliminados:
+            valores = np.expand_dims(
+                np.broadcast_to(valores, [n for eje, n in enumerate(forma)
+                                          if eje not in eliminados]),
+                eliminados)
+        valores = np.broadcast_to(valores, forma)
+
+        for indice, salida, locales in self._recorrer(posiciones):
+            self._fragmento(indice, escribir=True)[locales] = valores[salida]
+
+    def _liberar_memoria(self):
+        """Vuelca a disco si los fragmentos pendientes superan ``limite_memoria``"""
+        tamano = int(np.prod(self.fragmentos)) * self.dtype.itemsize
+        if len(self._sucios) * tamano > self.limite_memoria:
+            self.flush()
+
+    def anexar(self, datos, eje=0):
+        """Añade ``datos`` al final del eje ``eje``; los demás ejes deben coincidir"""
+        datos = np.asarray(datos, dtype=self.dtype)
+        esperada = self.forma[:eje] + self.forma[eje + 1:]
+        if datos.ndim != self.ndim or datos.shape[:eje] + datos.shape[eje + 1:] != esperada:
+            raise ValueError(f"Forma {datos.shape} incompatible con {self.forma} en el eje {eje}")
+
+        inicio = self.forma[eje]
+        self.forma = (self.forma[:eje] + (inicio + datos.shape[eje],)
+                      + self.forma[eje + 1:])
+        destino = [slice(None)] * self.ndim
+        destino[eje] = slice(inicio, self.forma[eje])
+        # La nueva forma solo llega a disco con todos sus fragmentos escritos
+        self._escribir(tuple(destino), datos)
+        self._liberar_memoria()
+
+    def flush(self):
+        """Escribe los fragmentos pendientes y después la nueva ``meta.json``"""
+        versiones = dict(self._versiones)
+        anteriores = []
+        for indice, fragmento in self._sucios.items():
+            nombre = '.'.join(map(str, indice))
+            actual = self._ruta_fragmento(indice)
+            if os.path.exists(actual):
+                # Nueva versión al lado de la publicada, que sigue intacta
+                versiones[nombre] = self._versiones.get(nombre, 0) + 1
+                anteriores.append(actual)
+            _escribir_atomico(
+                self._ruta_fragmento(indice, versiones.get(nombre, 0)),
+                lambda archivo: np.save(archivo, fragmento))
+
+        meta = {'forma': list(self.forma), 'fragmentos': list(self.fragmentos),
+                'dtype': self.dtype.str, 'relleno': self.relleno,
+                'versiones': versiones, 'atributos': self.atributos}
+        _escribir_atomico(os.path.join(self.ruta, _META),
+                          lambda archivo: archivo.write(json.dumps(meta).encode()))
+        self._versiones = versiones
+        self._sucios = {}
+
+        # Las versiones anteriores ya no las referencia meta.json
+        for ruta in anteriores:
+            os.unlink(ruta)
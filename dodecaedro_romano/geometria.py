@@ -0,0 +1,183 @@
+"""Geometría del dodecaedro: modelo simplificado y modelo real del SCAD"""
+
+from functools import lru_cache
+
+import numpy as np
+
+# --- PARÁMETROS DEL DODECAEDRO SIMPLIFICADO ---
+NUM_AGUJEROS = 12
+DIAMETRO_AGUJEROS = 2.5  # cm
+RADIO_ESFERA = 8.0       # cm
+
+# --- PARÁMETROS EXACTOS DEL MODELO SCAD ---
+RADIO_BASE = 32  # mm (radio del pentágono)
+DISTANCIA_CENTRO = 40  # mm (distancia al centro)
+ALTURA_CARA = 3.7  # mm (altura del pentágono)
+DIAMETROS_AGUJEROS_SUPERIOR = [26, 21.5, 16.5, 21, 11.5, 17]  # mm
+DIAMETROS_AGUJEROS_INFERIOR = [25.5, 10.5, 15.5, 22, 17, 22]  # mm
+ANGULOS_Z = [0, 0, 72, 144, 216, 288]  # grados
+AJUSTE = 1.5  # factor de ajuste
+
+# --- GENERAR GEOMETRÍA DODECAÉDRICA SIMPLIFICADA ---
+
+
+@lru_cache(maxsize=None)
+def _tablas_agujeros(radio_esfera):
+    """Posiciones de los agujeros y distancias entre pares, cacheadas por radio"""
+    # Coordenadas de los vértices de un dodecaedro (simplificado)
+    phi = (1 + np.sqrt(5)) / 2  # razón áurea
+    signos = np.array([[i, j, k] for i in [-1, 1] for j in [-1, 1]
+                       for k in [-1, 1]])
+    i, j, k = signos.T
+    cero = np.zeros(len(signos))
+    vertices = np.concatenate([
+        np.column_stack([i, i, i]),
+        np.column_stack([cero, j*phi, k/phi]),
+        np.column_stack([j*phi, k/phi, cero]),
+        np.column_stack([k/phi, cero, j*phi]),
+    ])
+
+    # Normalizar y seleccionar 12 puntos para agujeros
+    posiciones = np.unique(vertices, axis=0)[:12] * radio_esfera
+    distancias = np.linalg.norm(
+        posiciones[None, :, :] - posiciones[:, None, :], axis=-1)
+
+    _solo_lectura(posiciones, distancias)
+    return posiciones, distancias
+
+
+def generar_posiciones_agujeros():
+    """Genera las posiciones de los 12 agujeros en un dodecaedro"""
+    return _tablas_agujeros(RADIO_ESFERA)[0]
+
+
+# --- GENERAR GEOMETRÍA REAL DEL DODECAEDRO ---
+
+
+def _solo_lectura(*arrays):
+    """Marca arrays como de solo lectura para poder compartirlos desde la caché"""
+    for array in arrays:
+        array.setflags(write=False)
+
+
+class GeometriaDodecaedro:
+    """Geometría del dodecaedro con tablas precalculadas entre agujeros
+
+    Atributos (mm):
+    - vertices: (20, 3) vértices del dodecaedro regular
+    - caras: (12, 5) índices de vértices de cada cara, en orden cíclico
+    - centros, normales: (12, 3) centro y normal exterior de cada cara
+    - diametros_scad, diametros: (12,) diámetros SCAD y ajustados por AJUSTE
+    - distancias: (12, 12) distancia entre centros de agujeros
+    - direcciones: (12, 12, 3) vector unitario de la entrada a la salida
+    - angulos: (12, 12) ángulo entre la normal de salida y la dirección de
+      propagación (diagonal en cero)
+
+    Las caras 0-5 son las superiores y la cara i+6 es la opuesta a la cara i.
+    """
+
+    def __init__(self, radio_base, distancia_centro, ajuste,
+                 diametros_superior, diametros_inferior):
+        self.radio_base = radio_base
+        self.distancia_centro = distancia_centro
+        self.ajuste = ajuste
+
+        # Coordenadas de los vértices de un dodecaedro regular
+        phi = (1 + np.sqrt(5)) / 2  # razón áurea
+        vertices = np.array([
+            [1, 1, 1], [1, 1, -1], [1, -1, 1], [1, -1, -1],
+            [-1, 1, 1], [-1, 1, -1], [-1, -1, 1], [-1, -1, -1],
+            [0, 1/phi, phi], [0, 1/phi, -phi], [0, -1/phi, phi], [0, -1/phi, -phi],
+            [1/phi, phi, 0], [1/phi, -phi, 0], [-1/phi, phi, 0], [-1/phi, -phi, 0],
+            [phi, 0, 1/phi], [phi, 0, -1/phi], [-phi, 0, 1/phi], [-phi, 0, -1/phi]
+        ])
+
+        # Normalizar y escalar
+        vertices = vertices / np.linalg.norm(vertices[0]) * radio_base
+
+        # Normales de las 12 caras: permutaciones cíclicas de (0, ±phi, ±1)
+        signos = np.array([[1, 1], [1, -1], [-1, 1], [-1, -1]])
+        base = np.column_stack(
+            [np.zeros(4), signos[:, 0] * phi, signos[:, 1]])
+        normales = np.concatenate([np.roll(base, r, axis=1) for r in range(3)])
+        normales /= np.linalg.norm(normales, axis=1, keepdims=True)
+
+        # 6 caras superiores ordenadas por altura y azimut; opuestas debajo
+        superior = (normales[:, 2] > 0) | (
+            (normales[:, 2] == 0) & (normales[:, 1] > 0))
+        arriba = normales[superior]
+        orden = np.lexsort((np.arctan2(arriba[:, 1], arriba[:, 0]),
+                            -arriba[:, 2]))
+        normales = np.concatenate([arriba[orden], -arriba[orden]])
+
+        # Cada cara la forman los 5 vértices más alejados en su normal
+        caras = np.argsort(-(normales @ vertices.T), axis=1)[:, :5]
+        puntos = vertices[caras]
+        centros = puntos.mean(axis=1)
+
+        # Ordenar los vértices de cada cara cíclicamente
+        relativos = puntos - centros[:, None, :]
+        eje_u = relativos[:, 0] / np.linalg.norm(
+            relativos[:, 0], axis=1, keepdims=True)
+        eje_v = np.cross(normales, eje_u)
+        angulo = np.arctan2(np.einsum('fpj,fj->fp', relativos, eje_v),
+                            np.einsum('fpj,fj->fp', relativos, eje_u))
+        caras = np.take_along_axis(caras, np.argsort(angulo, axis=1), axis=1)
+
+        # Asignar diámetro según la cara (usando datos SCAD)
+        diametros_scad = np.concatenate(
+            [diametros_superior, diametros_inferior]).astype(float)
+        diametros = diametros_scad * ajuste
+
+        # Tablas entre pares de agujeros (entrada, salida)
+        r_vec = centros[None, :, :] - centros[:, None, :]
+        distancias = np.linalg.norm(r_vec, axis=-1)
+        diagonal = np.eye(len(centros), dtype=bool)
+        direcciones = r_vec / np.where(diagonal, 1.0, distancias)[..., None]
+        cosenos = np.einsum('sj,esj->es', normales, direcciones)
+        angulos = np.where(diagonal, 0.0, np.arccos(np.clip(cosenos, -1, 1)))
+
+        _solo_lectura(vertices, caras, centros, normales, diametros_scad,
+                      diametros, distancias, direcciones, angulos)
+        self.vertices = vertices
+        self.caras = caras
+        self.centros = centros
+        self.normales = normales
+        self.diametros_scad = diametros_scad
+        self.diametros = diametros
+        self.distancias = distancias
+        self.direcciones = direcciones
+        self.angulos = angulos
+
+
+@lru_cache(maxsize=None)
+def _geometria_cacheada(radio_base, distancia_centro, ajuste,
+                        diametros_superior, diametros_inferior):
+    return GeometriaDodecaedro(radio_base, distancia_centro, ajuste,
+                               diametros_superior, diametros_inferior)
+
+
+def obtener_geometria(radio_base=None, distancia_centro=None, ajuste=None,
+                      diametros_superior=None, diametros_inferior=None):
+    """Devuelve la geometría cacheada para los parámetros SCAD dados
+
+    Los parámetros omitidos toman los valores del módulo. Llamadas con los
+    mismos parámetros devuelven el mismo objeto, cuyos arrays son de solo
+    lectura.
+    """
+    return _geometria_cacheada(
+        RADIO_BASE if radio_base is None else radio_base,
+        DISTANCIA_CENTRO if distancia_centro is None else distancia_centro,
+        AJUSTE if ajuste is None else ajuste,
+        tuple(DIAMETROS_AGUJEROS_SUPERIOR if diametros_superior is None
+              else diametros_superior),
+        tuple(DIAMETROS_AGUJEROS_INFERIOR if diametros_inferior is None
+              else diametros_inferior))
+
+
+def generar_geometria_real():
+    """Genera la geometría exacta del dodecaedro con agujeros de diferentes tamaños"""
+
+    geometria = obtener_geometria()
+    return (geometria.centros, geometria.normales, geometria.diametros,
+            geometria.vertices)
@@ -0,0 +1,148 @@
+"""Índices ordenados para buscar valores dentro de una tolerancia
+
+Sirven para cruzar diámetros de agujeros con catálogos grandes de instrumentos
+y frecuencias objetivo con las frecuencias naturales de los agujeros, sin
+bucles anidados: cada consulta cuesta una búsqueda binaria más el número de
+coincidencias.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from .catalogo import es_catalogo
+from .geometria import (DIAMETROS_AGUJEROS_INFERIOR,
+                        DIAMETROS_AGUJEROS_SUPERIOR, _solo_lectura)
+
+# Holgura relativa de los límites de búsqueda; los candidatos se filtran
+# después con ``abs(centro - valor) <= tolerancia`` exacto
+_HOLGURA = 1e-9
+
+
+class IndiceOrdenado:
+    """Valores ordenados con búsqueda binaria por intervalo ``centro ± tolerancia``
+
+    ``indices`` en los resultados se refiere siempre a la posición del valor en
+    el array original. Dentro de cada consulta las coincidencias se ordenan por
+    error y, a igual error, por posición original, que es el orden estable de
+    ``encontrar_correspondencias``.
+    """
+
+    def __init__(self, valores):
+        valores = np.asarray(valores, dtype=float)
+        if valores.ndim != 1:
+            raise ValueError("El índice necesita un array unidimensional")
+        self.orden = np.argsort(valores, kind='stable')
+        self.valores = valores[self.orden]
+        _solo_lectura(self.orden, self.valores)
+
+    def __len__(self):
+        return len(self.valores)
+
+    def _limites(self, centros, tolerancia):
+        """Posiciones [inicio, fin) de los candidatos de cada consulta"""
+        holgura = _HOLGURA * (np.abs(centros) + tolerancia)
+        inicio = np.searchsorted(self.valores, centros - tolerancia - holgura,
+                                 side='left')
+        fin = np.searchsorted(self.valores, centros + tolerancia + holgura,
+                              side='right')
+        return inicio, fin
+
+    def consultar(self, centro, tolerancia, estricto=False):
+        """Valores a ``tolerancia`` o menos de ``centro`` en O(log n + k)
+
+        Con ``estricto=True`` el error tiene que ser menor que ``tolerancia``.
+        Devuelve ``(indices, errores)`` ordenados de mejor a peor ajuste.
+        """
+        inicio, fin = self._limites(float(centro), float(tolerancia))
+        indices = self.orden[inicio:fin]
+        errores = np.abs(centro - self.valores[inicio:fin])
+        dentro = errores < tolerancia if estricto else errores <= tolerancia
+        indices, errores = indices[dentro], errores[dentro]
+        mejor = np.lexsort((indices, errores))
+        return indices[mejor], errores[mejor]
+
+    def consultar_lote(self, centros, tolerancia, estricto=False):
+        """Consulta vectorizada de muchos centros a la vez
+
+        ``tolerancia`` puede ser un escalar o un array con la forma de
+        ``centros``; ``estricto`` funciona como en ``consultar``.
+
+        El resultado es disperso, al estilo CSR: las coincidencias del centro
+        ``q`` son ``indices[desplazamientos[q]:desplazamientos[q+1]]`` con sus
+        ``errores``, en el mismo orden que ``consultar``. Devuelve
+        ``(desplazamientos, indices, errores)``.
+        """
+        centros = np.asarray(centros, dtype=float).ravel()
+        tolerancia = np.broadcast_to(
+            np.asarray(tolerancia, dtype=float), centros.shape)
+        inicio, fin = self._limites(centros, tolerancia)
+
+        # Posiciones de todos los candidatos sin bucle de Python
+        cuentas = fin - inicio
+        consulta = np.repeat(np.arange(len(centros)), cuentas)
+        arranque = np.cumsum(cuentas) - cuentas
+        posiciones = (np.arange(cuentas.sum()) - np.repeat(arranque, cuentas)
+                      + np.repeat(inicio, cuentas))
+
+        errores = np.abs(centros[consulta] - self.valores[posiciones])
+        limite = tolerancia[consulta]
+        dentro = errores < limite if estricto else errores <= limite
+        consulta, errores = consulta[dentro], errores[dentro]
+        indices = self.orden[posiciones[dentro]]
+
+        mejor = np.lexsort((indices, errores, consulta))
+        desplazamientos = np.zeros(len(centros) + 1, dtype=np.intp)
+        np.cumsum(np.bincount(consulta, minlength=len(centros)),
+                  out=desplazamientos[1:])
+        return desplazamientos, indices[mejor], errores[mejor]
+
+
+class IndiceResonancias:
+    """Frecuencias naturales ``c / (2d)`` de los agujeros, indexadas por valor
+
+    ``diametros`` (mm) son por defecto los del modelo SCAD; también se acepta
+    un catálogo de ``cargar_catalogo``, y entonces cada agujero es una fila del
+    catálogo. ``velocidad`` es la velocidad de propagación en mm/s.
+    """
+
+    def __init__(self, diametros=None, velocidad=343000):
+        if diametros is None:
+            diametros = DIAMETROS_AGUJEROS_SUPERIOR + DIAMETROS_AGUJEROS_INFERIOR
+        elif es_catalogo(diametros):
+            diametros = diametros['diametro']
+        self.diametros = np.array(diametros, dtype=float)
+        self.velocidad = velocidad
+        # Frecuencia natural aproximada para abertura circular (modo fundamental)
+        self.frecuencias = velocidad / (2 * self.diametros)  # mm/s / mm = Hz
+        _solo_lectura(self.diametros, self.frecuencias)
+        self._indice = IndiceOrdenado(self.frecuencias)
+
+    def __len__(self):
+        return len(self.frecuencias)
+
+    def consultar(self, frecuencias, tolerancia, estricto=False,
+                  orden='ajuste'):
+        """Agujeros que resuenan a ``tolerancia`` Hz o menos de cada frecuencia
+
+        Resultado disperso como en ``IndiceOrdenado.consultar_lote``:
+        ``(desplazamientos, agujeros, diferencias)``. Dentro de cada frecuencia
+        los agujeros van de mejor a peor ajuste, o por índice de agujero con
+        ``orden='agujero'``.
+        """
+        desplazamientos, agujeros, diferencias = self._indice.consultar_lote(
+            frecuencias, tolerancia, estricto)
+        if orden == 'agujero':
+            consulta = np.repeat(np.arange(len(desplazamientos) - 1),
+                                 np.diff(desplazamientos))
+            por_agujero = np.lexsort((agujeros, consulta))
+            agujeros, diferencias = agujeros[por_agujero], diferencias[por_agujero]
+        elif orden != 'ajuste':
+            raise ValueError(f"Orden desconocido: {orden}")
+        return desplazamientos, agujeros, diferencias
+
+
+@lru_cache(maxsize=None)
+def obtener_indice_resonancias(velocidad=343000):
+    """``IndiceResonancias`` de los agujeros SCAD, creado una vez por velocidad"""
+    return IndiceResonancias(velocidad=velocidad)
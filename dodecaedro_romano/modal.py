@@ -0,0 +1,251 @@
+"""Análisis modal de la cavidad del dodecaedro por elementos finitos
+
+El aire interior (cavidad y cuellos de los agujeros) se malla con hexaedros
+trilineales de una rejilla uniforme. Como todos los elementos son cubos
+iguales, sus matrices de rigidez y masa son las mismas y el ensamblado es
+una sola construcción COO. Los modos de ``K p = (ω/c)² M p`` se obtienen
+con ``eigsh`` en modo shift-invert. Unidades en mm y mm/s.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from .cache import CacheDisco, huella_parametros
+from .geometria import ALTURA_CARA, _solo_lectura, obtener_geometria
+from .indice import IndiceOrdenado
+
+# --- MALLADO ---
+
+
+def _matrices_elemento(h):
+    """Rigidez y masa (8, 8) del hexaedro trilineal de lado ``h``
+
+    El nodo local ``4a + 2b + c`` es la esquina (i+a, j+b, k+c).
+    """
+    masa_1d = h / 6 * np.array([[2.0, 1.0], [1.0, 2.0]])
+    rigidez_1d = 1 / h * np.array([[1.0, -1.0], [-1.0, 1.0]])
+    rigidez = (np.kron(np.kron(rigidez_1d, masa_1d), masa_1d)
+               + np.kron(np.kron(masa_1d, rigidez_1d), masa_1d)
+               + np.kron(np.kron(masa_1d, masa_1d), rigidez_1d))
+    return rigidez, np.kron(np.kron(masa_1d, masa_1d), masa_1d)
+
+
+def mallar_cavidad(puntos=40, grosor=ALTURA_CARA, geometria=None):
+    """Malla de hexaedros del aire interior del dodecaedro
+
+    ``puntos`` es el número de elementos a lo ancho del dodecaedro. Entran
+    los cubos cuyo centro está dentro de la pared (cavidad) o dentro de la
+    pared pero en el cilindro de un agujero (cuello). Devuelve
+    ``(conectividad, nodos, cuellos, bocas, h)``: índices (E, 8) de los nodos
+    de cada elemento, coordenadas (n, 3) en mm, para cada nodo el agujero de
+    cuyo cuello forma parte (-1 si de ninguno), máscara de los nodos en la
+    boca exterior de los agujeros y lado del elemento en mm.
+    """
+    geometria = geometria or obtener_geometria()
+    normales = geometria.normales
+    apotema = np.linalg.norm(geometria.centros[0])
+    radios = geometria.diametros_scad / 2
+
+    lado = 2 * np.linalg.norm(geometria.vertices[0])
+    h = lado / puntos
+    origen = -lado / 2
+
+    def clasificar(posiciones):
+        """Cara más cercana, altura sobre el centro y distancia al eje"""
+        proyecciones = posiciones @ normales.T
+        cara = proyecciones.argmax(axis=-1)
+        altura = proyecciones[np.arange(len(posiciones)), cara]
+        radial = np.sqrt(np.maximum(
+            np.einsum('ij,ij->i', posiciones, posiciones) - altura**2, 0))
+        return cara, altura, radial
+
+    celdas = np.stack(np.meshgrid(*[np.arange(puntos)] * 3, indexing='ij'),
+                      axis=-1).reshape(-1, 3)
+    cara, altura, radial = clasificar(origen + (celdas + 0.5) * h)
+    cavidad = altura < apotema - grosor
+    cuello = (~cavidad & (altura < apotema) & (radial < radios[cara]))
+    dentro = cavidad | cuello
+    celdas, cara, cuello = celdas[dentro], cara[dentro], cuello[dentro]
+
+    # Esquinas de cada elemento en la rejilla de nodos, en el orden local
+    esquinas = np.stack(np.meshgrid([0, 1], [0, 1], [0, 1], indexing='ij'),
+                        axis=-1).reshape(8, 3)
+    rejilla = celdas[:, None, :] + esquinas
+    lineal = np.ravel_multi_index(rejilla.reshape(-1, 3).T, (puntos + 1,) * 3)
+    usados, conectividad = np.unique(lineal, return_inverse=True)
+    conectividad = conectividad.reshape(-1, 8)
+    nodos = origen + np.stack(np.unravel_index(usados, (puntos + 1,) * 3),
+                              axis=-1) * h
+
+    # Cuellos por agujero y bocas en la cara exterior de la pared
+    cuellos = np.full(len(nodos), -1)
+    cuellos[conectividad[cuello]] = cara[cuello, None]
+    _, altura, _ = clasificar(nodos)
+    bocas = (cuellos >= 0) & (altura >= apotema - h / 2)
+    return conectividad, nodos, cuellos, bocas, h
+
+
+def ensamblar(conectividad, num_nodos, h):
+    """Matrices dispersas (CSR) de rigidez y masa de la malla"""
+    from scipy import sparse
+
+    rigidez, masa = _matrices_elemento(h)
+    filas = np.repeat(conectividad, 8, axis=1).ravel()
+    columnas = np.tile(conectividad, (1, 8)).ravel()
+    forma = (num_nodos, num_nodos)
+
+    def ensamblar_matriz(elemental):
+        datos = np.broadcast_to(elemental.ravel(),
+                                (len(conectividad), 64)).ravel()
+        return sparse.coo_matrix((datos, (filas, columnas)),
+                                 shape=forma).tocsr()
+
+    return ensamblar_matriz(rigidez), ensamblar_matriz(masa)
+
+
+# --- MODOS ---
+
+
+def resolver_modos(rigidez, masa, num_modos, velocidad=343000, fijos=None,
+                   desplazamiento=None):
+    """Los ``num_modos`` modos más graves: ``(frecuencias, formas)``
+
+    ``fijos`` es una máscara de nodos con presión nula. ``desplazamiento``
+    es el σ de shift-invert (en 1/mm²); por defecto un valor pequeño y
+    negativo, así ``K - σM`` es definida positiva aunque la cavidad cerrada
+    tenga el modo de presión uniforme (0 Hz).
+    """
+    from scipy.sparse.linalg import LinearOperator, eigsh, splu
+
+    libres = np.ones(rigidez.shape[0], dtype=bool) if fijos is None else ~fijos
+    if fijos is not None:
+        rigidez = rigidez[libres][:, libres]
+        masa = masa[libres][:, libres]
+    if desplazamiento is None:
+        # Centésima parte del autovalor de la primera diagonal de la malla
+        escala = masa.diagonal().sum() ** (1 / 3)
+        desplazamiento = -(np.pi / escala)**2 / 100
+
+    # K - σM es simétrica y definida positiva: factorización sin pivotar
+    # con un orden de mínimo grado sobre el patrón simétrico (menos relleno
+    # que el COLAMD que usaría eigsh)
+    factor = splu((rigidez - desplazamiento * masa).tocsc(),
+                  permc_spec='MMD_AT_PLUS_A', diag_pivot_thresh=0,
+                  options={'SymmetricMode': True})
+    inversa = LinearOperator(rigidez.shape, matvec=factor.solve, dtype=float)
+    autovalores, vectores = eigsh(rigidez, k=num_modos, M=masa,
+                                  sigma=desplazamiento, which='LM',
+                                  OPinv=inversa)
+    orden = np.argsort(autovalores)
+    frecuencias = velocidad * np.sqrt(np.maximum(autovalores[orden], 0)) / (2 * np.pi)
+    formas = np.zeros((len(libres), num_modos))
+    formas[libres] = vectores[:, orden]
+    return frecuencias, formas
+
+
+class ModosCavidad:
+    """Modos acústicos de la cavidad con un índice para buscar por frecuencia
+
+    - ``frecuencias``: (modos,) en Hz, de menor a mayor
+    - ``formas``: (nodos, modos) presión de cada modo en cada nodo
+    - ``nodos``: (nodos, 3) coordenadas en mm; ``cuellos`` como en
+      ``mallar_cavidad``
+    """
+
+    def __init__(self, frecuencias, formas, nodos, cuellos):
+        self.frecuencias = np.asarray(frecuencias, dtype=float)
+        self.formas = formas
+        self.nodos = nodos
+        self.cuellos = cuellos
+        _solo_lectura(self.frecuencias, formas, nodos, cuellos)
+        self._indice = IndiceOrdenado(self.frecuencias)
+
+    def __len__(self):
+        return len(self.frecuencias)
+
+    def consultar(self, frecuencias, tolerancia, estricto=False):
+        """Modos a ``tolerancia`` Hz o menos de cada frecuencia
+
+        Resultado disperso como en ``IndiceOrdenado.consultar_lote``:
+        ``(desplazamientos, modos, diferencias)``.
+        """
+        return self._indice.consultar_lote(frecuencias, tolerancia, estricto)
+
+    def amplitud_agujeros(self):
+        """Presión RMS de cada modo en el cuello de cada agujero (modos, 12)
+
+        Un agujero sin nodos de cuello (malla demasiado gruesa para
+        resolverlo) da NaN en su columna.
+        """
+        cuenta = np.bincount(self.cuellos + 1, minlength=13)[1:]
+        amplitud = np.stack([np.bincount(self.cuellos + 1, weights=forma**2,
+                                         minlength=13)[1:]
+                             for forma in self.formas.T])
+        media = np.divide(amplitud, cuenta, where=cuenta > 0,
+                          out=np.full(amplitud.shape, np.nan))
+        return np.sqrt(media)
+
+
+def calcular_modos(num_modos=20, puntos=40, agujeros_abiertos=False,
+                   velocidad=343000, grosor=ALTURA_CARA, geometria=None):
+    """Malla la cavidad, ensambla y resuelve los ``num_modos`` modos más graves
+
+    Con ``agujeros_abiertos=True`` la presión es nula en la boca exterior de
+    cada agujero (sin corrección de extremo); si no, las paredes y los
+    agujeros son rígidos y el primer modo es el de 0 Hz.
+    """
+    conectividad, nodos, cuellos, bocas, h = mallar_cavidad(puntos, grosor,
+                                                            geometria)
+    rigidez, masa = ensamblar(conectividad, len(nodos), h)
+    frecuencias, formas = resolver_modos(
+        rigidez, masa, num_modos, velocidad,
+        fijos=bocas if agujeros_abiertos else None)
+    return ModosCavidad(frecuencias, formas, nodos, cuellos)
+
+
+@lru_cache(maxsize=16)
+def _modos_cacheados(geometria, num_modos, puntos, agujeros_abiertos,
+                     velocidad, grosor):
+    return calcular_modos(num_modos, puntos, agujeros_abiertos, velocidad,
+                          grosor, geometria)
+
+
+def obtener_modos(num_modos=20, puntos=40, agujeros_abiertos=False,
+                  velocidad=343000, grosor=ALTURA_CARA, geometria=None,
+                  cache=None):
+    """``ModosCavidad`` cacheados en memoria por geometría y parámetros
+
+    ``cache`` es además un directorio o una ``CacheDisco`` donde guardar
+    frecuencias y formas con la huella de los parámetros, para no volver a
+    resolver el problema en otra sesión.
+    """
+    geometria = geometria or obtener_geometria()
+    if cache is None:
+        return _modos_cacheados(geometria, num_modos, puntos,
+                                agujeros_abiertos, velocidad, grosor)
+
+    if not isinstance(cache, CacheDisco):
+        cache = CacheDisco(cache)
+    configuracion = {
+        'modelo': 'modal',
+        'num_modos': num_modos,
+        'puntos': puntos,
+        'agujeros_abiertos': agujeros_abiertos,
+        'velocidad': velocidad,
+        'grosor': grosor,
+        'radio_base': geometria.radio_base,
+        'diametros_scad': geometria.diametros_scad.tolist(),
+    }
+    claves = [huella_parametros(dict(configuracion, salida=salida))
+              for salida in ('frecuencias', 'formas')]
+    try:
+        frecuencias, formas = (cache.cargar(clave) for clave in claves)
+    except KeyError:
+        modos = _modos_cacheados(geometria, num_modos, puntos,
+                                 agujeros_abiertos, velocidad, grosor)
+        cache.guardar(claves[0], modos.frecuencias)
+        cache.guardar(claves[1], modos.formas)
+        return modos
+    _, nodos, cuellos, _, _ = mallar_cavidad(puntos, grosor, geometria)
+    return ModosCavidad(frecuencias, formas, nodos, cuellos)
@@ -0,0 +1,274 @@
+"""Monte Carlo de las correspondencias agujero-instrumento
+
+Dos análisis: la incertidumbre de medida (cada muestra perturba los 12
+diámetros con ruido gaussiano) y una prueba de significancia frente a
+modelos nulos aleatorios. Las muestras se evalúan por lotes sin bucles de
+Python. Cada bloque fijo de muestras tiene su propio generador derivado de
+la semilla, así que el resultado es el mismo con uno o varios procesos y
+con cualquier tamaño de lote.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .afinacion import DODECAHEDRON_HOLES
+from .calibracion import DIAMETROS_AGUJEROS
+from .catalogo import es_catalogo
+from .registro import obtener_registro
+
+# Muestras por generador; los lotes agrupan bloques enteros de este tamaño
+_MUESTRAS_POR_SEMILLA = 10_000
+
+
+def _error_mas_cercano(diametros, ordenados):
+    """Distancia de cada diámetro al instrumento más cercano (búsqueda binaria)"""
+    derecha = np.searchsorted(ordenados, diametros)
+    izquierda = np.clip(derecha - 1, 0, len(ordenados) - 1)
+    derecha = np.clip(derecha, 0, len(ordenados) - 1)
+    return np.minimum(np.abs(diametros - ordenados[izquierda]),
+                      np.abs(diametros - ordenados[derecha]))
+
+
+def _sortear(semillas, tamanos, sorteo):
+    """Concatena ``sorteo(generador, n)`` de cada bloque de un lote"""
+    return np.concatenate([sorteo(np.random.default_rng(semilla), n)
+                           for semilla, n in zip(semillas, tamanos)])
+
+
+def _lote_montecarlo(semillas, tamanos, diametros, sigma, ordenados,
+                     tolerancia):
+    """Evalúa un lote de muestras; función de nivel superior para los procesos"""
+    perturbados = diametros + sigma * _sortear(
+        semillas, tamanos,
+        lambda generador, n: generador.standard_normal((n, len(diametros))))
+
+    errores = _error_mas_cercano(perturbados, ordenados)
+    coinciden = errores <= tolerancia
+    coincidencias = coinciden.sum(axis=1)
+    # Error medio de los agujeros que coinciden (NaN si ninguno)
+    suma_errores = np.where(coinciden, errores, 0.0).sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        error_medio = suma_errores / coincidencias
+
+    return (coincidencias.astype(np.int16), error_medio.astype(np.float32),
+            coinciden.sum(axis=0))
+
+
+def _ejecutar_lotes(funcion, num_muestras, tamano_lote, semilla, procesos,
+                    *argumentos):
+    """Reparte ``num_muestras`` en lotes con semillas independientes
+
+    Las muestras se dividen en bloques de ``_MUESTRAS_POR_SEMILLA``, cada uno
+    con su hijo de ``SeedSequence(semilla)``, y cada lote agrupa los bloques
+    consecutivos que caben en ``tamano_lote`` (al menos uno). Así las muestras
+    dependen solo de ``num_muestras`` y ``semilla``, no del tamaño de lote ni
+    del número de procesos. Llama a ``funcion(semillas, tamanos,
+    *argumentos)`` con las semillas y tamaños de los bloques de cada lote y
+    devuelve la lista de resultados en orden.
+    """
+    tamanos = [min(_MUESTRAS_POR_SEMILLA, num_muestras - inicio)
+               for inicio in range(0, num_muestras, _MUESTRAS_POR_SEMILLA)]
+    semillas = np.random.SeedSequence(semilla).spawn(len(tamanos))
+    por_lote = max(1, tamano_lote // _MUESTRAS_POR_SEMILLA)
+    lotes = [(semillas[inicio:inicio + por_lote],
+              tamanos[inicio:inicio + por_lote])
+             for inicio in range(0, len(tamanos), por_lote)]
+
+    if procesos == 1:
+        return [funcion(s, n, *argumentos) for s, n in lotes]
+    repetidos = [[valor] * len(lotes) for valor in argumentos]
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        return list(pool.map(funcion, *zip(*lotes), *repetidos))
+
+
+def simular_tolerancias(num_muestras=1_000_000, sigma=None, diametros=None,
+                        instrumentos='calibracion', tolerancia=0.5, semilla=0,
+                        tamano_lote=100_000, procesos=1):
+    """Distribución de coincidencias con diámetros medidos con incertidumbre
+
+    - ``diametros``: por defecto ``DIAMETROS_AGUJEROS``; también un catálogo
+      de un artefacto, cuya columna ``incertidumbre`` se usa como ``sigma``.
+    - ``sigma``: desviación típica en mm, escalar o una por agujero (0.2 mm
+      si no se indica ni viene en el catálogo).
+    - ``instrumentos``: nombre de una tabla del registro o array de diámetros.
+    - ``procesos``: con más de uno (o ``None``, uno por núcleo) los lotes se
+      reparten en un pool de procesos.
+
+    Devuelve un diccionario con las coincidencias y el error medio de cada
+    muestra, la fracción de muestras en que coincide cada agujero y el
+    resultado sin perturbar.
+    """
+    if diametros is None:
+        diametros = DIAMETROS_AGUJEROS
+    elif es_catalogo(diametros):
+        if sigma is None and np.any(diametros['incertidumbre'] > 0):
+            sigma = diametros['incertidumbre']
+        diametros = diametros['diametro']
+    diametros = np.asarray(diametros, dtype=float)
+    sigma = np.broadcast_to(
+        np.asarray(0.2 if sigma is None else sigma, dtype=float), diametros.shape)
+
+    if isinstance(instrumentos, str):
+        registro = obtener_registro()
+        instrumentos = registro.diametros[registro.filas(instrumentos)]
+    ordenados = np.sort(np.asarray(instrumentos, dtype=float))
+
+    lotes = _ejecutar_lotes(_lote_montecarlo, num_muestras, tamano_lote,
+                            semilla, procesos, diametros, sigma, ordenados,
+                            tolerancia)
+
+    coincidencias = np.concatenate([lote[0] for lote in lotes])
+    nominal = _error_mas_cercano(diametros, ordenados) <= tolerancia
+    return {
+        'coincidencias': coincidencias,
+        'error_medio': np.concatenate([lote[1] for lote in lotes]),
+        'fraccion_por_agujero': sum(lote[2] for lote in lotes) / num_muestras,
+        'distribucion': np.bincount(coincidencias,
+                                    minlength=len(diametros) + 1) / num_muestras,
+        'coincidencias_nominales': int(nominal.sum()),
+        'num_agujeros': len(diametros),
+        'sigma': sigma,
+        'tolerancia': tolerancia,
+    }
+
+
+def resumen_montecarlo(resultado):
+    """Imprime la distribución de coincidencias de ``simular_tolerancias``"""
+    coincidencias = resultado['coincidencias']
+    total = resultado['num_agujeros']
+    nominal = resultado['coincidencias_nominales']
+
+    print(f"🎲 MONTE CARLO: {len(coincidencias):,} muestras, "
+          f"tolerancia ±{resultado['tolerancia']}mm")
+    print(f"Medida puntual: {nominal}/{total} agujeros coinciden")
+    print(f"Coincidencias: media {coincidencias.mean():.2f}, "
+          f"percentiles 5-95: {np.percentile(coincidencias, 5):.0f}-"
+          f"{np.percentile(coincidencias, 95):.0f}")
+    print(f"P(≥ {nominal}/{total}): "
+          f"{resultado['distribucion'][nominal:].sum():.3f}")
+    print(f"Error medio de los agujeros que coinciden: "
+          f"{np.nanmean(resultado['error_medio']):.3f}mm")
+    print("Agujero | Fracción de muestras con coincidencia")
+    for i, fraccion in enumerate(resultado['fraccion_por_agujero']):
+        print(f"{i:7} | {fraccion:6.1%}")
+
+
+# --- PRUEBA DE SIGNIFICANCIA ---
+
+
+def _puntuar(agujeros, instrumentos, tolerancia, estadistico):
+    """Estadístico de cada conjunto comparando todos los pares a la vez
+
+    ``agujeros`` es (..., A) e ``instrumentos`` (..., I). ``'pares'`` cuenta
+    pares agujero-instrumento a ``tolerancia`` o menos (las filas de
+    ``analyze_precision``); ``'agujeros'``, agujeros con alguna coincidencia.
+    """
+    coinciden = (np.abs(agujeros[..., :, None] - instrumentos[..., None, :])
+                 <= tolerancia)
+    if estadistico == 'pares':
+        return coinciden.sum(axis=(-2, -1))
+    return coinciden.any(axis=-1).sum(axis=-1)
+
+
+def _lote_nulo(semillas, tamanos, agujeros, instrumentos, tolerancia,
+               estadistico, modelo, resolucion, observado):
+    """Cuenta cuántos conjuntos nulos de un lote igualan o superan lo observado"""
+    if modelo == 'uniforme':
+        # Instrumentos al azar en el rango de los reales, a la misma resolución
+        aleatorios = _sortear(
+            semillas, tamanos,
+            lambda generador, n: generador.uniform(
+                instrumentos.min(), instrumentos.max(),
+                (n, len(instrumentos))))
+        if resolucion:
+            aleatorios = np.round(aleatorios / resolucion) * resolucion
+        puntuaciones = _puntuar(agujeros, aleatorios, tolerancia, estadistico)
+    else:
+        # Permutación: mezclar agujeros e instrumentos y volver a repartirlos
+        conjunto = np.concatenate([agujeros, instrumentos])
+        mezcla = _sortear(
+            semillas, tamanos,
+            lambda generador, n: generador.permuted(
+                np.broadcast_to(conjunto, (n, len(conjunto))), axis=1))
+        puntuaciones = _puntuar(mezcla[:, :len(agujeros)],
+                                mezcla[:, len(agujeros):], tolerancia,
+                                estadistico)
+    return (int(np.count_nonzero(puntuaciones >= observado)),
+            np.bincount(puntuaciones, minlength=observado + 1))
+
+
+def prueba_significancia(num_permutaciones=10_000_000, modelo='uniforme',
+                         estadistico='pares', agujeros=None,
+                         instrumentos='afinacion', tolerancia=0.5,
+                         resolucion=0.5, confianza=0.95, semilla=0,
+                         tamano_lote=100_000, procesos=1):
+    """Valor p de las coincidencias observadas frente a un modelo nulo
+
+    Modelos nulos:
+
+    - ``'uniforme'``: conjuntos de instrumentos del mismo tamaño con
+      diámetros uniformes en el rango de los reales, redondeados a
+      ``resolucion`` mm (los datos publicados van de 0.5 en 0.5 mm).
+    - ``'permutacion'``: se juntan los diámetros de agujeros e instrumentos y
+      se reparten al azar en dos grupos de los mismos tamaños.
+
+    ``agujeros`` son por defecto ``DODECAHEDRON_HOLES`` e ``instrumentos`` una
+    tabla del registro o un array de diámetros. El valor p es
+    ``(k + 1) / (n + 1)``, con ``k`` los conjuntos nulos que igualan o superan
+    lo observado; el intervalo es el de Clopper-Pearson para ``k / n``.
+    """
+    from scipy import stats
+
+    if modelo not in ('uniforme', 'permutacion'):
+        raise ValueError(f"Modelo nulo desconocido: {modelo}")
+    if estadistico not in ('pares', 'agujeros'):
+        raise ValueError(f"Estadístico desconocido: {estadistico}")
+
+    agujeros = np.asarray(DODECAHEDRON_HOLES if agujeros is None else agujeros,
+                          dtype=float)
+    if isinstance(instrumentos, str):
+        registro = obtener_registro()
+        instrumentos = registro.diametros[registro.filas(instrumentos)]
+    instrumentos = np.asarray(instrumentos, dtype=float)
+
+    observado = int(_puntuar(agujeros, instrumentos, tolerancia, estadistico))
+    lotes = _ejecutar_lotes(_lote_nulo, num_permutaciones, tamano_lote,
+                            semilla, procesos, agujeros, instrumentos,
+                            tolerancia, estadistico, modelo, resolucion,
+                            observado)
+
+    k = sum(lote[0] for lote in lotes)
+    n = num_permutaciones
+    maximo = max(len(lote[1]) for lote in lotes)
+    distribucion = sum(np.pad(lote[1], (0, maximo - len(lote[1])))
+                       for lote in lotes) / n
+    alfa = 1 - confianza
+    inferior = stats.beta.ppf(alfa / 2, k, n - k + 1) if k > 0 else 0.0
+    superior = stats.beta.ppf(1 - alfa / 2, k + 1, n - k) if k < n else 1.0
+
+    return {
+        'observado': observado,
+        'valor_p': (k + 1) / (n + 1),
+        'intervalo': (float(inferior), float(superior)),
+        'excedencias': k,
+        'num_permutaciones': n,
+        'distribucion_nula': distribucion,
+        'modelo': modelo,
+        'estadistico': estadistico,
+    }
+
+
+def resumen_significancia(resultado):
+    """Imprime el resultado de ``prueba_significancia``"""
+    inferior, superior = resultado['intervalo']
+    distribucion = resultado['distribucion_nula']
+    media_nula = np.dot(np.arange(len(distribucion)), distribucion)
+    print(f"📊 PRUEBA DE SIGNIFICANCIA ({resultado['modelo']}, "
+          f"{resultado['estadistico']})")
+    print(f"Observado: {resultado['observado']} | "
+          f"Conjuntos nulos: {resultado['num_permutaciones']:,}")
+    print(f"Media nula: {media_nula:.2f} | "
+          f"Excedencias: {resultado['excedencias']:,}")
+    print(f"Valor p: {resultado['valor_p']:.2e} "
+          f"(IC Clopper-Pearson: {inferior:.2e} - {superior:.2e})")
@@ -0,0 +1,70 @@
+"""Propagación de ondas en el dodecaedro simplificado (unidades en cm)"""
+
+import numpy as np
+
+from .geometria import NUM_AGUJEROS, RADIO_ESFERA, _tablas_agujeros
+
+# --- SIMULAR PROPAGACIÓN DE ONDAS ---
+
+
+def barrido_propagacion_onda(agujeros_entrada, frecuencias, tipo_onda='sonido',
+                             tamano_bloque=64):
+    """Simula la propagación para varios agujeros de entrada y frecuencias a la vez
+
+    Devuelve el patrón interior con forma (entradas, frecuencias, muestras) y los
+    patrones de salida con forma (entradas, frecuencias, agujeros, muestras).
+    Usa sin(ωt - φ) = sin(ωt)cos(φ) - cos(ωt)sin(φ), de modo que los senos se
+    evalúan una sola vez por frecuencia y muestra. Las frecuencias se procesan
+    en bloques de ``tamano_bloque`` para acotar los temporales.
+    """
+
+    posiciones, distancias = _tablas_agujeros(RADIO_ESFERA)
+    entradas = np.atleast_1d(np.asarray(agujeros_entrada, dtype=int))
+    frecuencias = np.atleast_1d(np.asarray(frecuencias, dtype=float))
+
+    # Configurar onda de entrada
+    if tipo_onda == 'sonido':
+        velocidad = 34300  # cm/s (sonido en aire)
+    else:  # luz
+        velocidad = 3e10   # cm/s (luz)
+
+    # Distancias y atenuaciones entre cada entrada y todos los agujeros
+    dist = distancias[entradas]
+    atenuacion = 1 / (1 + dist**2 / RADIO_ESFERA**2)
+    # El agujero de entrada no emite salida
+    atenuacion[np.arange(len(entradas)), entradas] = 0.0
+
+    t = np.linspace(0, 0.01, 1000)
+    patron_interior = np.empty((len(entradas), len(frecuencias), len(t)))
+    patron_salida = np.empty(
+        (len(entradas), len(frecuencias), NUM_AGUJEROS, len(t)))
+
+    for inicio in range(0, len(frecuencias), tamano_bloque):
+        bloque = slice(inicio, inicio + tamano_bloque)
+        f = frecuencias[bloque]
+        omega_t = 2 * np.pi * f[:, None] * t                    # (F, T)
+        seno, coseno = np.sin(omega_t), np.cos(omega_t)
+
+        # Retardo de fase por distancia: (entradas, F, agujeros)
+        fase = 2 * np.pi * dist[:, None, :] / (velocidad / f[:, None])
+        a = atenuacion[:, None, :] * np.cos(fase)
+        b = atenuacion[:, None, :] * np.sin(fase)
+
+        salida = patron_salida[:, bloque]
+        np.multiply(a[..., None], seno[None, :, None, :], out=salida)
+        salida -= b[..., None] * coseno[None, :, None, :]
+
+        # Contribución al patrón interior
+        patron_interior[:, bloque] = 0.3 * (
+            a.sum(axis=2)[..., None] * seno - b.sum(axis=2)[..., None] * coseno)
+
+    return patron_interior, patron_salida, posiciones
+
+
+def simular_propagacion_onda(agujero_entrada, frecuencia, tipo_onda='sonido'):
+    """Simula la propagación de ondas dentro del dodecaedro"""
+
+    patron_interior, patron_salida, posiciones = barrido_propagacion_onda(
+        [agujero_entrada], [frecuencia], tipo_onda)
+
+    return patron_interior[0, 0], patron_salida[0, 0], posiciones
@@ -0,0 +1,169 @@
+"""Registro único de instrumentos y frecuencias en columnas de NumPy
+
+Reúne ``ANCIENT_INSTRUMENTS``, ``INSTRUMENTOS_ANTIGUOS``,
+``FRECUENCIAS_TIBETANAS`` y la tabla de ``analizar_frecuencias_mantricas``
+en arrays paralelos (una fila por entrada), de modo que los análisis operan
+sobre columnas en lugar de recorrer diccionarios.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from .geometria import _solo_lectura
+from .indice import IndiceOrdenado
+
+# Claves equivalentes en las distintas tablas del proyecto
+_CLAVES_DIAMETRO = ('diametro_tubo', 'diameter')
+_CLAVES_FUNDAMENTAL = ('frecuencia_base', 'frecuencia', 'frequency')
+_CLAVES_CULTURA = ('cultura', 'culture')
+
+# Grafías de las tablas en inglés -> nombre canónico de la cultura
+_CULTURAS_CANONICAS = {
+    'Celtic': 'Celta',
+    'Egyptian': 'Egipcia',
+    'Etruscan': 'Etrusca',
+    'Greek': 'Griega',
+    'Hebrew': 'Hebreo',
+    'Hindu': 'Hindú',
+    'Roman': 'Romana',
+    'Tibetan': 'Tibet',
+}
+
+
+def _primer_valor(datos, claves, defecto=None):
+    """Valor de la primera clave presente en ``datos``"""
+    for clave in claves:
+        if clave in datos:
+            return datos[clave]
+    return defecto
+
+
+class RegistroInstrumentos:
+    """Tablas de instrumentos y frecuencias como estructura de arrays
+
+    ``tablas`` es una lista de ``(nombre_tabla, diccionario, cultura)``;
+    ``cultura`` se usa cuando las entradas no la traen. Las filas de cada
+    tabla son contiguas y conservan el orden del diccionario. Columnas:
+
+    - ``nombres`` y ``tablas``: nombre de la entrada y código de su tabla
+      (índice en ``nombres_tablas``).
+    - ``diametros``, ``fundamentales`` y ``longitudes``; NaN si la tabla no
+      tiene el dato.
+    - ``armonicos``: matriz (filas, máximo de armónicos) rellena con NaN.
+    - ``culturas``: código en ``nombres_culturas``, o -1 si se desconoce. Las
+      grafías de cada tabla se unifican antes (``'Celtic'`` y ``'Celta'``
+      tienen el mismo código).
+    """
+
+    def __init__(self, tablas):
+        nombres, codigos_tabla, entradas = [], [], []
+        self.nombres_tablas = []
+        self._rangos = {}
+        for codigo, (nombre_tabla, tabla, cultura) in enumerate(tablas):
+            inicio = len(nombres)
+            for nombre, datos in tabla.items():
+                nombres.append(nombre)
+                codigos_tabla.append(codigo)
+                entradas.append((datos, cultura))
+            self.nombres_tablas.append(nombre_tabla)
+            self._rangos[nombre_tabla] = slice(inicio, len(nombres))
+
+        self.nombres = np.array(nombres)
+        self.tablas = np.array(codigos_tabla, dtype=np.int8)
+        self.diametros = np.array([_primer_valor(d, _CLAVES_DIAMETRO, np.nan)
+                                   for d, _ in entradas], dtype=float)
+        self.fundamentales = np.array(
+            [_primer_valor(d, _CLAVES_FUNDAMENTAL, np.nan) for d, _ in entradas],
+            dtype=float)
+        self.longitudes = np.array([d.get('longitud', np.nan)
+                                    for d, _ in entradas], dtype=float)
+
+        num_armonicos = max((len(d.get('armonicos', [])) for d, _ in entradas),
+                            default=0)
+        self.armonicos = np.full((len(entradas), num_armonicos), np.nan)
+        for fila, (datos, _) in enumerate(entradas):
+            armonicos = datos.get('armonicos', [])
+            self.armonicos[fila, :len(armonicos)] = armonicos
+
+        culturas = [_primer_valor(d, _CLAVES_CULTURA, cultura)
+                    for d, cultura in entradas]
+        culturas = [_CULTURAS_CANONICAS.get(c, c) for c in culturas]
+        self.nombres_culturas = sorted({c for c in culturas if c is not None})
+        codigo_cultura = {c: i for i, c in enumerate(self.nombres_culturas)}
+        self.culturas = np.array([codigo_cultura.get(c, -1) for c in culturas],
+                                 dtype=np.int16)
+
+        # Búsqueda nombre -> fila en O(1); un nombre puede estar en varias tablas
+        self._filas = {(self.nombres_tablas[t], n): fila
+                       for fila, (t, n) in enumerate(zip(codigos_tabla, nombres))}
+        self._filas_por_nombre = {}
+        for fila, nombre in enumerate(nombres):
+            self._filas_por_nombre.setdefault(nombre, []).append(fila)
+
+        self._indices_diametro = {}
+        _solo_lectura(self.nombres, self.tablas, self.diametros,
+                      self.fundamentales, self.longitudes, self.armonicos,
+                      self.culturas)
+
+    def __len__(self):
+        return len(self.nombres)
+
+    def fila(self, nombre, tabla=None):
+        """Fila de ``nombre``; hace falta ``tabla`` si el nombre está en varias"""
+        if tabla is not None:
+            return self._filas[(tabla, nombre)]
+        filas = self._filas_por_nombre[nombre]
+        if len(filas) > 1:
+            tablas = ', '.join(self.nombres_tablas[self.tablas[f]] for f in filas)
+            raise KeyError(f"'{nombre}' aparece en varias tablas ({tablas}); indica la tabla")
+        return filas[0]
+
+    def filas(self, tabla):
+        """``slice`` con las filas de una tabla"""
+        return self._rangos[tabla]
+
+    def frecuencias(self, filas=slice(None), armonicos=True):
+        """Matriz (filas, 1 + armónicos) con la fundamental y sus armónicos"""
+        if not armonicos:
+            return self.fundamentales[filas, None]
+        return np.concatenate([self.fundamentales[filas, None],
+                               self.armonicos[filas]], axis=1)
+
+    def cultura(self, fila):
+        """Nombre de la cultura de una fila, o ``None`` si se desconoce"""
+        codigo = self.culturas[fila]
+        return self.nombres_culturas[codigo] if codigo >= 0 else None
+
+    def indice_diametros(self, tabla):
+        """``IndiceOrdenado`` de los diámetros de una tabla, construido una vez
+
+        Los índices que devuelve son posiciones dentro de la tabla, es decir,
+        relativos a ``filas(tabla).start``.
+        """
+        if tabla not in self._indices_diametro:
+            self._indices_diametro[tabla] = IndiceOrdenado(
+                self.diametros[self.filas(tabla)])
+        return self._indices_diametro[tabla]
+
+
+@lru_cache(maxsize=None)
+def obtener_registro():
+    """Registro compartido con las cuatro tablas del proyecto, creado una vez
+
+    Tablas: ``'afinacion'`` (``ANCIENT_INSTRUMENTS``), ``'calibracion'``
+    (``INSTRUMENTOS_ANTIGUOS``), ``'tibetano'`` (``FRECUENCIAS_TIBETANAS``) y
+    ``'mantras'``.
+    """
+    # Importación diferida: esos módulos usan el registro a su vez
+    from .afinacion import ANCIENT_INSTRUMENTS
+    from .calibracion import INSTRUMENTOS_ANTIGUOS
+    from .mantras import analizar_frecuencias_mantricas
+    from .tibetano import FRECUENCIAS_TIBETANAS
+
+    return RegistroInstrumentos([
+        ('afinacion', ANCIENT_INSTRUMENTS, None),
+        ('calibracion', INSTRUMENTOS_ANTIGUOS, None),
+        ('tibetano', FRECUENCIAS_TIBETANAS, 'Tibet'),
+        ('mantras', analizar_frecuencias_mantricas(), None),
+    ])
@@ -0,0 +1,88 @@
+"""Renderizado de figuras sin pantalla y en paralelo
+
+Cada escenario es un diccionario con la clave ``'tipo'`` (una de las claves de
+``VISUALIZACIONES``) y los argumentos de la función de visualización
+correspondiente. Los trabajadores usan el backend no interactivo ``Agg`` y
+escriben cada figura directamente a disco.
+"""
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from . import visualizacion
+from .calibracion import encontrar_correspondencias
+
+# Tipo de escenario -> nombre de la función en ``visualizacion``
+VISUALIZACIONES = {
+    'patrones': 'visualizar_patrones',
+    'difraccion': 'visualizar_difraccion_real',
+    'cimatica': 'visualizar_cimatica',
+    'correspondencias': 'visualizar_correspondencias',
+    'mantricas': 'visualizar_frecuencias_mantricas',
+}
+
+
+def _usar_backend_sin_pantalla():
+    """Selecciona el backend Agg antes de que se dibuje ninguna figura"""
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def nombre_escenario(escenario):
+    """Nombre de archivo PNG derivado del tipo y los parámetros del escenario"""
+    partes = [escenario['tipo']]
+    for clave in sorted(escenario):
+        if clave in ('tipo', 'nombre'):
+            continue
+        valor = escenario[clave]
+        if isinstance(valor, (list, tuple)):
+            valor = '-'.join(str(v) for v in valor)
+        partes.append(f'{clave}_{valor}')
+    return '_'.join(partes).replace(os.sep, '-') + '.png'
+
+
+def combinar_escenarios(tipo, **parametros):
+    """Genera el producto cartesiano de los valores de cada parámetro
+
+    Ejemplo: ``combinar_escenarios('difraccion', agujero_entrada=range(12),
+    frecuencia=[110, 432])`` produce 24 escenarios.
+    """
+    claves = list(parametros)
+    return [dict(zip(claves, valores), tipo=tipo)
+            for valores in itertools.product(*parametros.values())]
+
+
+def renderizar(escenario, directorio='.'):
+    """Dibuja un escenario y guarda la figura en ``directorio``; devuelve la ruta"""
+    _usar_backend_sin_pantalla()
+
+    argumentos = {clave: valor for clave, valor in escenario.items()
+                  if clave not in ('tipo', 'nombre')}
+    tipo = escenario['tipo']
+    if tipo == 'correspondencias' and 'correspondencias' not in argumentos:
+        argumentos['correspondencias'] = encontrar_correspondencias()
+    if tipo == 'cimatica':
+        argumentos.setdefault('dodecaedro', None)
+
+    ruta = os.path.join(
+        directorio, escenario.get('nombre') or nombre_escenario(escenario))
+    funcion = getattr(visualizacion, VISUALIZACIONES[tipo])
+    funcion(**argumentos, ruta_salida=ruta)
+    return ruta
+
+
+def renderizar_escenarios(escenarios, directorio='.', procesos=None):
+    """Renderiza una lista de escenarios en un pool de procesos
+
+    ``procesos`` es el número de trabajadores (por defecto, uno por núcleo).
+    Devuelve las rutas de las figuras en el mismo orden que ``escenarios``.
+    """
+    os.makedirs(directorio, exist_ok=True)
+    escenarios = list(escenarios)
+
+    with ProcessPoolExecutor(max_workers=procesos,
+                             initializer=_usar_backend_sin_pantalla) as pool:
+        futuros = [pool.submit(renderizar, escenario, directorio)
+                   for escenario in escenarios]
+        return [futuro.result() for futuro in futuros]
@@ -0,0 +1,252 @@
+"""Síntesis de instrumentos tibetanos y filtrado por los agujeros"""
+
+import time
+from collections import deque
+from functools import lru_cache
+
+import numpy as np
+
+# --- FRECUENCIAS REALES DE INSTRUMENTOS TIBETANOS ---
+FRECUENCIAS_TIBETANAS = {
+    'DUNG_CHEN_LARGO': {  # Tubo largo ceremonial (3-4 metros)
+        'frecuencia_base': 55.0,  # Hz - Fundamental muy grave
+        'armonicos': [110.0, 165.0, 220.0],
+        'longitud': 3.5,  # metros
+        'uso': 'ceremonias grandes, exteriores'
+    },
+    'DUNG_CHEN_MEDIO': {  # Tubo medio (2-2.5 metros)
+        'frecuencia_base': 73.3,  # Hz - Re bemol
+        'armonicos': [146.6, 219.9, 293.2],
+        'longitud': 2.2,
+        'uso': 'templos, ceremonias interiores'
+    },
+    'RAG_DUNG': {  # Trompeta corta tibetana
+        'frecuencia_base': 110.0,  # Hz - La grave
+        'armonicos': [220.0, 330.0, 440.0],
+        'longitud': 1.5,
+        'uso': 'ritos específicos, sanación'
+    },
+    'KANG_DUNG': {  # Cuerno de pierna humana (ritual chamánico)
+        'frecuencia_base': 146.6,  # Hz - Re
+        'armonicos': [293.2, 439.8, 586.4],
+        'longitud': 0.8,
+        'uso': 'chamanismo, trance'
+    }
+}
+
+# --- PARÁMETROS DEL DODECAEDRO ---
+DIAMETROS_AGUJEROS = [26, 21.5, 16.5, 21, 11.5, 17, 25.5, 10.5, 15.5, 22, 17, 22]  # mm
+FRECUENCIA_MUESTREO = 44100  # Hz
+DURACION = 2.0  # segundos
+
+
+# --- GENERAR SONIDO DE TUBO TIBETANO ---
+def _sintetizar_tibetano(t, freq_base):
+    """Sonido tibetano evaluado en los instantes ``t``"""
+    # Sonido característico: fundamental fuerte + armónicos suaves
+    sonido = (
+        0.8 * np.sin(2*np.pi*freq_base*t) +
+        0.3 * np.sin(2*np.pi*2*freq_base*t) +
+        0.2 * np.sin(2*np.pi*3*freq_base*t) +
+        0.1 * np.sin(2*np.pi*4*freq_base*t)
+    )
+
+    # Añadir vibrato natural (pequeña modulación de frecuencia)
+    vibrato = 0.005 * np.sin(2*np.pi*6*t)  # 6 Hz de vibrato
+    sonido *= (1 + vibrato)
+
+    # Ataque y decaimiento natural
+    envolvente = np.exp(-0.5*t) * (1 - np.exp(-10*t))
+    sonido *= envolvente
+
+    return sonido
+
+
+def generar_sonido_tibetano(tipo_instrumento='DUNG_CHEN_MEDIO', duracion=2.0):
+    """Genera sonido auténtico de instrumento tibetano"""
+    t = np.linspace(0, duracion, int(FRECUENCIA_MUESTREO * duracion))
+
+    datos = FRECUENCIAS_TIBETANAS[tipo_instrumento]
+    sonido = _sintetizar_tibetano(t, datos['frecuencia_base'])
+
+    return t, sonido, datos
+
+
+def generar_sonido_tibetano_bloques(tipo_instrumento='DUNG_CHEN_MEDIO',
+                                    duracion=2.0, tamano_bloque=65536):
+    """Genera el sonido tibetano en bloques de ``tamano_bloque`` muestras
+
+    Cada muestra se evalúa a partir de su índice absoluto, con la misma rejilla
+    temporal que ``generar_sonido_tibetano``, así que la fase es continua entre
+    bloques y la concatenación coincide con la versión de una sola pasada. La
+    memoria usada es constante para cualquier duración; el último bloque
+    puede ser más corto.
+    """
+    num_muestras = int(FRECUENCIA_MUESTREO * duracion)
+    paso = duracion / (num_muestras - 1) if num_muestras > 1 else 0.0
+    freq_base = FRECUENCIAS_TIBETANAS[tipo_instrumento]['frecuencia_base']
+
+    for inicio in range(0, num_muestras, tamano_bloque):
+        fin = min(inicio + tamano_bloque, num_muestras)
+        t = np.arange(inicio, fin) * paso
+        yield _sintetizar_tibetano(t, freq_base)
+
+
+# --- FILTRADO POR AGUJEROS ---
+@lru_cache(maxsize=None)
+def _disenar_sos(diametro, ancho_banda, fs, orden):
+    """Pasa-banda Butterworth en secciones de segundo orden para un agujero
+
+    Devuelve ``None`` si la frecuencia natural no cabe bajo Nyquist.
+    """
+    from scipy import signal
+
+    # Frecuencia natural del agujero (en Hz)
+    freq_corte = 343000 / (2 * diametro)
+    if freq_corte + ancho_banda >= fs/2:
+        return None
+
+    # Compartido entre bancos: no modificar (sosfilt lo exige escribible)
+    return signal.butter(orden, [freq_corte-ancho_banda, freq_corte+ancho_banda],
+                         btype='bandpass', fs=fs, output='sos')
+
+
+class BancoFiltrosAgujeros:
+    """Banco de filtros pasa-banda, uno por agujero del dodecaedro
+
+    Los diseños SOS se cachean por (diámetro, ancho de banda, fs, orden), así
+    que construir el banco de nuevo no vuelve a diseñar filtros. ``filtrar``
+    devuelve una salida multicanal (agujeros, muestras); los agujeros con el
+    mismo diseño se filtran juntos en una sola llamada a ``sosfilt``.
+    """
+
+    def __init__(self, diametros=DIAMETROS_AGUJEROS, ancho_banda=30,
+                 fs=FRECUENCIA_MUESTREO, orden=2):
+        self.diametros = np.asarray(diametros, dtype=float)
+        self.ancho_banda = ancho_banda
+        self.fs = fs
+        self.frecuencias_corte = 343000 / (2 * self.diametros)
+        self.sos = [_disenar_sos(float(d), ancho_banda, fs, orden)
+                    for d in self.diametros]
+
+        # Agrupar canales que comparten diseño
+        grupos = {}
+        for canal, diametro in enumerate(self.diametros):
+            grupos.setdefault(float(diametro), []).append(canal)
+        self.grupos = [(self.sos[canales[0]], np.array(canales))
+                       for canales in grupos.values()]
+
+    def filtrar(self, senal):
+        """Filtra una señal mono y devuelve una salida (agujeros, muestras)"""
+        from scipy import signal
+
+        senal = np.asarray(senal, dtype=float)
+        salida = np.empty((len(self.diametros), len(senal)))
+        for sos, canales in self.grupos:
+            if sos is None:
+                # Para frecuencias muy altas, usar solo el sonido original
+                salida[canales] = senal
+            else:
+                salida[canales] = signal.sosfilt(sos, senal)
+        return salida
+
+
+class ProcesadorAgujerosTiempoReal:
+    """Filtrado por bloques del banco de agujeros conservando el estado
+
+    El estado de cada filtro (``zi``) se arrastra entre llamadas, de modo que
+    procesar una señal en bloques de cualquier tamaño da el mismo resultado
+    que filtrarla de una vez. Se guarda la latencia de cada bloque en
+    ``latencias`` (segundos, últimos ``historial`` bloques).
+    """
+
+    def __init__(self, banco=None, historial=100000):
+        self.banco = banco or BancoFiltrosAgujeros()
+        self.latencias = deque(maxlen=historial)
+        self.duraciones = deque(maxlen=historial)
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Pone a cero el estado de los filtros y el historial de latencias"""
+        self.estados = [None if sos is None else np.zeros((len(sos), 2))
+                        for sos, _ in self.banco.grupos]
+        self.latencias.clear()
+        self.duraciones.clear()
+
+    def procesar(self, bloque):
+        """Filtra un bloque mono y devuelve la salida (agujeros, muestras)"""
+        from scipy import signal
+
+        inicio = time.perf_counter()
+        bloque = np.asarray(bloque, dtype=float)
+        salida = np.empty((len(self.banco.diametros), len(bloque)))
+
+        for g, (sos, canales) in enumerate(self.banco.grupos):
+            if sos is None:
+                salida[canales] = bloque
+            else:
+                salida[canales], self.estados[g] = signal.sosfilt(
+                    sos, bloque, zi=self.estados[g])
+
+        self.latencias.append(time.perf_counter() - inicio)
+        self.duraciones.append(len(bloque) / self.banco.fs)
+        return salida
+
+    def estadisticas_latencia(self):
+        """Resumen de latencias por bloque frente al tiempo real disponible
+
+        Sin bloques procesados (por ejemplo tras ``reiniciar``) todas las
+        medidas son NaN.
+        """
+        latencias = np.array(self.latencias)
+        duraciones = np.array(self.duraciones)
+        if len(latencias) == 0:
+            return {'bloques': 0, 'media': np.nan, 'p50': np.nan,
+                    'p99': np.nan, 'maxima': np.nan, 'presupuesto': np.nan,
+                    'factor_tiempo_real': np.nan}
+        return {
+            'bloques': len(latencias),
+            'media': latencias.mean(),
+            'p50': np.percentile(latencias, 50),
+            'p99': np.percentile(latencias, 99),
+            'maxima': latencias.max(),
+            'presupuesto': duraciones.mean(),
+            'factor_tiempo_real': duraciones.sum() / latencias.sum(),
+        }
+
+
+def benchmark_tiempo_real(tamano_bloque=64, duracion=10.0,
+                          tipo_instrumento='DUNG_CHEN_MEDIO'):
+    """Mide si el procesador sigue el ritmo de FRECUENCIA_MUESTREO en los 12 agujeros"""
+    procesador = ProcesadorAgujerosTiempoReal()
+
+    for bloque in generar_sonido_tibetano_bloques(tipo_instrumento, duracion,
+                                                  tamano_bloque):
+        procesador.procesar(bloque)
+
+    stats = procesador.estadisticas_latencia()
+    print(f"⏱️  BENCHMARK TIEMPO REAL: {len(procesador.banco.diametros)} agujeros, "
+          f"bloques de {tamano_bloque} muestras a {procesador.banco.fs} Hz")
+    print(f"• Bloques procesados: {stats['bloques']}")
+    print(f"• Presupuesto por bloque: {stats['presupuesto']*1e6:.1f} µs")
+    print(f"• Latencia media: {stats['media']*1e6:.1f} µs | "
+          f"p99: {stats['p99']*1e6:.1f} µs | máxima: {stats['maxima']*1e6:.1f} µs")
+    print(f"• Factor de tiempo real: {stats['factor_tiempo_real']:.1f}x")
+    if stats['p99'] < stats['presupuesto']:
+        print("🎯 Sigue el ritmo en tiempo real")
+    else:
+        print("❌ No sigue el ritmo en tiempo real")
+
+    return stats
+
+
+def filtrar_agujeros(sonido, agujeros=None):
+    """Filtra el sonido con un pasa-banda centrado en la frecuencia de cada agujero"""
+    banco = BancoFiltrosAgujeros()
+    agujeros = range(len(banco.diametros)) if agujeros is None else list(agujeros)
+
+    salida = banco.filtrar(sonido)
+    sonidos_filtrados = [salida[i] for i in agujeros]
+    frecuencias_corte = [banco.frecuencias_corte[i] for i in agujeros]
+
+    return sonidos_filtrados, frecuencias_corte
@@ -0,0 +1,609 @@
+"""Visualizaciones de las simulaciones del dodecaedro
+
+matplotlib se importa de forma perezosa la primera vez que se dibuja algo,
+de modo que importar este módulo no carga el backend gráfico.
+"""
+
+import time
+
+import numpy as np
+
+from .calibracion import DIAMETROS_AGUJEROS as DIAMETROS_CALIBRACION
+from .cimatica import simular_patrones_cimaticos
+from .difraccion import simular_difraccion_real
+from .espectro import espectro_real
+from .geometria import NUM_AGUJEROS
+from .levitacion import (simular_instrumentos_antiguos,
+                         simular_levitacion_acustica, sistemas_amplificacion)
+from .mantras import analisis_espectral_om, analizar_frecuencias_mantricas
+from .propagacion import simular_propagacion_onda
+from .tibetano import (DIAMETROS_AGUJEROS, DURACION, FRECUENCIA_MUESTREO,
+                       filtrar_agujeros, generar_sonido_tibetano)
+
+
+def _pyplot(tres_d=False):
+    """Importa matplotlib.pyplot bajo demanda"""
+    import matplotlib.pyplot as plt
+    if tres_d:
+        from mpl_toolkits.mplot3d import Axes3D  # noqa: F401 (registra '3d')
+    return plt
+
+
+def _mostrar_o_guardar(plt, fig, ruta_salida):
+    """Muestra la figura o, si se indica una ruta, la guarda a 300 dpi y la cierra"""
+    if ruta_salida is None:
+        plt.show()
+    else:
+        fig.savefig(ruta_salida, dpi=300)
+        plt.close(fig)
+
+# --- VISUALIZAR PROPAGACIÓN ---
+
+
+def visualizar_patrones(agujero_entrada=0, frecuencia=1000, tipo_onda='sonido',
+                        ruta_salida=None):
+    """Genera visualización completa"""
+    plt = _pyplot(tres_d=True)
+
+    patron_int, patron_sal, posiciones = simular_propagacion_onda(
+        agujero_entrada, frecuencia, tipo_onda)
+
+    # Crear figura 3D
+    fig = plt.figure(figsize=(15, 10))
+
+    # 1. Visualización 3D de agujeros
+    ax1 = fig.add_subplot(221, projection='3d')
+    ax1.scatter(posiciones[:, 0], posiciones[:, 1],
+                posiciones[:, 2], s=100, c='blue')
+    ax1.scatter(posiciones[agujero_entrada, 0],
+                posiciones[agujero_entrada, 1],
+                posiciones[agujero_entrada, 2], s=200, c='red', marker='X')
+    ax1.set_title('Posiciones de agujeros (Rojo: entrada)')
+
+    # 2. Patrón interior
+    ax2 = fig.add_subplot(222)
+    t = np.linspace(0, 0.01, 1000)
+    ax2.plot(t, patron_int)
+    ax2.set_title('Patrón de interferencia INTERIOR')
+    ax2.set_xlabel('Tiempo (s)')
+    ax2.set_ylabel('Amplitud')
+
+    # 3. Patrones de salida
+    ax3 = fig.add_subplot(212)
+    for i in range(NUM_AGUJEROS):
+        if i != agujero_entrada:
+            ax3.plot(t, patron_sal[i] + i*2, label=f'Agujero {i}')
+    ax3.set_title('PATRONES DE SALIDA por cada agujero')
+    ax3.set_xlabel('Tiempo (s)')
+    ax3.set_ylabel('Amplitud (desplazada)')
+    ax3.legend()
+
+    plt.tight_layout()
+    if ruta_salida is None:
+        plt.savefig(
+            f'dodecaedro_entrada_{agujero_entrada}_freq_{frecuencia}_{tipo_onda}.png', dpi=300)
+    _mostrar_o_guardar(plt, fig, ruta_salida)
+
+    return patron_int, patron_sal
+
+
+# --- VISUALIZACIÓN DIFRACCIÓN REAL ---
+
+
+def visualizar_difraccion_real(agujero_entrada=0, frecuencia=1000, tipo_onda='sonido',
+                               ruta_salida=None):
+    """Visualización con geometría real y efectos de difracción"""
+    plt = _pyplot(tres_d=True)
+
+    patron_int, patron_sal, centros, diametros, vertices = simular_difraccion_real(
+        agujero_entrada, frecuencia, tipo_onda)
+
+    fig = plt.figure(figsize=(18, 12))
+
+    # 1. Visualización 3D con tamaños reales de agujeros
+    ax1 = fig.add_subplot(231, projection='3d')
+    # Dibujar vértices (esferas)
+    ax1.scatter(vertices[:, 0], vertices[:, 1],
+                vertices[:, 2], s=20, c='gray', alpha=0.3)
+
+    # Dibujar agujeros con tamaños proporcionales
+    for i, (centro, diametro) in enumerate(zip(centros, diametros)):
+        color = 'red' if i == agujero_entrada else 'blue'
+        ax1.scatter(centro[0], centro[1], centro[2],
+                    s=diametro*10, c=color, alpha=0.7)
+        ax1.text(centro[0], centro[1], centro[2], f'{i}', fontsize=8)
+
+    ax1.set_title('Geometría real con agujeros de diferentes tamaños')
+
+    # 2. Mapa de amplitudes de salida
+    ax2 = fig.add_subplot(232)
+    amplitudes = np.max(np.abs(patron_sal), axis=1)
+    colores = amplitudes / np.max(amplitudes)
+    scatter = ax2.scatter(
+        centros[:, 0], centros[:, 1], c=amplitudes, s=diametros*20, cmap='viridis')
+    ax2.scatter(centros[agujero_entrada, 0],
+                centros[agujero_entrada, 1], s=200, marker='X', c='red')
+    plt.colorbar(scatter, ax=ax2, label='Amplitud máxima')
+    ax2.set_title('Amplitudes de salida por agujero')
+    ax2.set_aspect('equal')
+
+    # 3. Espectro de frecuencias de salida
+    ax3 = fig.add_subplot(233)
+    freqs, espectros = espectro_real(patron_sal, 1000/0.01)
+    for i in range(len(patron_sal)):
+        if i != agujero_entrada:
+            ax3.plot(freqs[:500], espectros[i, :500] +
+                     i*0.1, label=f'Agujero {i}')
+    ax3.set_xlim(0, frecuencia*3)
+    ax3.set_title('Espectros de frecuencia de salida')
+    ax3.set_xlabel('Frecuencia (Hz)')
+    ax3.set_ylabel('Amplitud (desplazada)')
+
+    # 4. Comparación de patrones temporales
+    ax4 = fig.add_subplot(212)
+    t = np.linspace(0, 0.01, 1000)
+    for i in range(len(patron_sal)):
+        if i != agujero_entrada:
+            ax4.plot(t, patron_sal[i] + i*1.5,
+                     label=f'Agujero {i} (Ø{diametros[i]:.1f}mm)')
+    ax4.set_title('Señales temporales de salida (con difracción)')
+    ax4.set_xlabel('Tiempo (s)')
+    ax4.set_ylabel('Amplitud (desplazada)')
+    ax4.legend()
+
+    plt.tight_layout()
+    _mostrar_o_guardar(plt, fig, ruta_salida)
+
+    # Análisis cuantitativo
+    print(f"\n📊 ANÁLISIS DE DIFRACCIÓN - {tipo_onda.upper()} {frecuencia}Hz")
+    print("=" * 50)
+
+    amplitudes_max = []
+    for i in range(len(patron_sal)):
+        if i != agujero_entrada:
+            amp_max = np.max(np.abs(patron_sal[i]))
+            amplitudes_max.append(amp_max)
+            print(
+                f"Agujero {i}: Ø{diametros[i]:.1f}mm → Amplitud: {amp_max:.4f}")
+
+    print(
+        f"\nRango amplitudes: {np.min(amplitudes_max):.4f} - {np.max(amplitudes_max):.4f}")
+    print(
+        f"Variación: {(np.max(amplitudes_max)-np.min(amplitudes_max))/np.mean(amplitudes_max)*100:.1f}%")
+
+
+# --- VISUALIZACIÓN PATRONES CIMÁTICOS ---
+
+
+def visualizar_cimatica(dodecaedro, frecuencias, medio='arena', ruta_salida=None):
+    """Visualiza patrones cimáticos para diferentes frecuencias"""
+    plt = _pyplot()
+
+    fig, axes = plt.subplots(2, 3, figsize=(15, 10))
+    axes = axes.flatten()
+
+    for i, freq in enumerate(frecuencias):
+        X, Y, patron = simular_patrones_cimaticos(dodecaedro, freq, medio)
+
+        im = axes[i].contourf(X, Y, patron, levels=50, cmap='viridis')
+        axes[i].set_title(f'Frecuencia: {freq} Hz\nMedio: {medio}')
+        axes[i].set_aspect('equal')
+
+        # Dibujar silueta del dodecaedro
+        circle = plt.Circle((0, 0), 1.0, fill=False,
+                            color='red', linestyle='--')
+        axes[i].add_patch(circle)
+
+    plt.colorbar(im, ax=axes, shrink=0.8)
+    plt.suptitle(
+        f'PATRONES CIMÁTICOS DEL DODECAEDRO EN {medio.upper()}', fontsize=16)
+    plt.tight_layout()
+    _mostrar_o_guardar(plt, fig, ruta_salida)
+
+
+# --- VISUALIZACIÓN CORRESPONDENCIAS ---
+
+
+def visualizar_correspondencias(correspondencias, ruta_salida=None):
+    """Visualiza las correspondencias agujero-instrumento"""
+    plt = _pyplot()
+
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 12))
+
+    # 1. Diagrama de correspondencias
+    diametros_agujeros = [c[1] for c in correspondencias]
+    mejores_ajustes = []
+
+    for i, (agujero_idx, diametro, instrumentos) in enumerate(correspondencias):
+        if instrumentos:
+            mejor_instr = instrumentos[0]
+            frecuencia = mejor_instr[1]['frecuencia']
+            cultura = mejor_instr[1]['cultura']
+            mejores_ajustes.append((diametro, frecuencia, cultura))
+
+            ax1.scatter(diametro, frecuencia, s=100, label=f'Agujero {agujero_idx}: {mejor_instr[0]}')
+            ax1.annotate(f'Ag.{agujero_idx}\n{mejor_instr[0][:10]}',
+                        (diametro, frecuencia), xytext=(5, 5),
+                        textcoords='offset points', fontsize=8)
+        else:
+            mejores_ajustes.append((diametro, 0, 'Sin correspondencia'))
+
+    ax1.set_title('CORRESPONDENCIA: DIÁMETRO vs FRECUENCIA INSTRUMENTAL')
+    ax1.set_xlabel('Diámetro (mm)')
+    ax1.set_ylabel('Frecuencia (Hz)')
+    ax1.grid(True, alpha=0.3)
+
+    # 2. Distribución por culturas
+    culturas = {}
+    for _, _, instrumentos in correspondencias:
+        if instrumentos:
+            cultura = instrumentos[0][1]['cultura']
+            culturas[cultura] = culturas.get(cultura, 0) + 1
+
+    colores = plt.cm.Set3(np.linspace(0, 1, len(culturas)))
+    ax2.pie(culturas.values(), labels=culturas.keys(), autopct='%1.1f%%',
+            colors=colores, startangle=90)
+    ax2.set_title('DISTRIBUCIÓN POR CULTURAS')
+
+    plt.tight_layout()
+    _mostrar_o_guardar(plt, fig, ruta_salida)
+
+    return mejores_ajustes
+
+
+def simulacion_calibracion():
+    """Simula el proceso de calibración"""
+    plt = _pyplot()
+
+    print(f"\n🎛️  SIMULACIÓN DE CALIBRACIÓN:")
+
+    # Tomar ejemplo: Dung Chen Medio (21.5mm) → Agujero 1
+    diametro_instr = 21.5
+    agujero_correspondiente = 1
+    diametro_agujero = DIAMETROS_CALIBRACION[agujero_correspondiente]
+
+    print(f"Instrumento: Dung Chen Medio (Ø{diametro_instr}mm)")
+    print(f"Agujero correspondiente: {agujero_correspondiente} (Ø{diametro_agujero}mm)")
+    print(f"Diferencia: {abs(diametro_instr - diametro_agujero):.2f}mm")
+
+    # Simular efecto de calibración
+    frecuencia_antes = 70.0  # Hz (desafinado)
+    frecuencia_despues = 73.3  # Hz (calibrado)
+
+    print(f"\n🎵 EFECTO DE CALIBRACIÓN:")
+    print(f"Frecuencia antes: {frecuencia_antes}Hz (desafinado)")
+    print(f"Frecuencia después: {frecuencia_despues}Hz (calibrado)")
+    print(f"Mejora: {abs(frecuencia_despues - frecuencia_antes):.1f}Hz de precisión")
+
+    # Visualizar mejora
+    fig, ax = plt.subplots(figsize=(10, 4))
+    frecuencias = [frecuencia_antes, frecuencia_despues]
+    etiquetas = ['Antes (desafinado)', 'Después (calibrado)']
+    colores = ['red', 'green']
+
+    bars = ax.bar(etiquetas, frecuencias, color=colores)
+    ax.set_ylabel('Frecuencia (Hz)')
+    ax.set_title('EFECTO DE CALIBRACIÓN CON DODECAEDRO')
+    ax.grid(True, alpha=0.3)
+
+    for bar, freq in zip(bars, frecuencias):
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height + 1,
+                f'{freq}Hz', ha='center', va='bottom')
+
+    plt.show()
+
+
+# --- SIMULACIÓN TIBETANA ---
+
+
+def simulacion_tibetana():
+    """Simulación con frecuencias realistas de instrumentos tibetanos"""
+    plt = _pyplot()
+
+    start_time = time.time()
+
+    # Generar sonido de Dung Chen medio (73.3 Hz)
+    t, sonido, datos_instrumento = generar_sonido_tibetano('DUNG_CHEN_MEDIO', DURACION)
+    frecuencia_base = datos_instrumento['frecuencia_base']
+
+    print(f"🎺 Instrumento: Dung Chen Medio")
+    print(f"📏 Longitud: {datos_instrumento['longitud']}m")
+    print(f"🎵 Frecuencia base: {frecuencia_base} Hz")
+    print(f"🔊 Armónicos: {datos_instrumento['armonicos']}")
+
+    # Procesar through agujeros seleccionados (los más relevantes)
+    agujeros_relevantes = [0, 2, 5, 7, 10]  # Agujeros con frecuencias de corte bajas
+    diametros_relevantes = [DIAMETROS_AGUJEROS[i] for i in agujeros_relevantes]
+
+    sonidos_filtrados, frecuencias_corte = filtrar_agujeros(
+        sonido, agujeros_relevantes)
+
+    # --- VISUALIZACIÓN ---
+    fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+
+    # 1. Sonido original vs filtrado (primeros 3 agujeros)
+    axes[0,0].plot(t[:1000], sonido[:1000], 'b-', label='Original', alpha=0.7, linewidth=2)
+    for i in range(min(3, len(sonidos_filtrados))):
+        axes[0,0].plot(t[:1000], sonidos_filtrados[i][:1000] + (i+1)*0.4,
+                      label=f'Agujero {agujeros_relevantes[i]} (Ø{diametros_relevantes[i]}mm)')
+    axes[0,0].set_title('SONIDO TIBETANO ORIGINAL vs FILTRADO')
+    axes[0,0].set_xlabel('Tiempo (s)')
+    axes[0,0].set_ylabel('Amplitud')
+    axes[0,0].legend()
+    axes[0,0].grid(True, alpha=0.3)
+
+    # 2. Espectro de frecuencias
+    freqs, fft_original = espectro_real(sonido, FRECUENCIA_MUESTREO)
+    positive_idx = (freqs > 0) & (freqs < 1000)  # Solo hasta 1000 Hz
+
+    axes[0,1].plot(freqs[positive_idx], fft_original[positive_idx], 'b-',
+                  label='Original', alpha=0.7, linewidth=2)
+
+    # Marcar frecuencia base y armónicos
+    colors = ['red', 'green', 'purple', 'orange']
+    for i, armonico in enumerate([frecuencia_base] + datos_instrumento['armonicos'][:3]):
+        if armonico < 1000:
+            axes[0,1].axvline(armonico, color=colors[i], linestyle='--',
+                             label=f'{armonico} Hz' if i == 0 else f'Armónico {i}: {armonico} Hz')
+
+    axes[0,1].set_title('ESPECTRO DEL SONIDO TIBETANO')
+    axes[0,1].set_xlabel('Frecuencia (Hz)')
+    axes[0,1].set_ylabel('Amplitud')
+    axes[0,1].legend()
+    axes[0,1].grid(True, alpha=0.3)
+
+    # 3. Frecuencias de corte de agujeros vs frecuencia del instrumento
+    axes[1,0].bar(range(len(frecuencias_corte)), frecuencias_corte,
+                 color=['skyblue' if fc > 1000 else 'lightcoral' for fc in frecuencias_corte])
+
+    # Marcar frecuencia del instrumento
+    axes[1,0].axhline(y=frecuencia_base, color='red', linestyle='-',
+                     label=f'Dung Chen: {frecuencia_base} Hz', linewidth=2)
+
+    for i, (freq, diametro) in enumerate(zip(frecuencias_corte, diametros_relevantes)):
+        axes[1,0].text(i, freq + 50, f'Ø{diametro}mm\n{freq:.0f}Hz',
+                      ha='center', va='bottom', fontsize=8)
+
+    axes[1,0].set_title('FRECUENCIAS NATURALES DE AGUJEROS vs INSTRUMENTO')
+    axes[1,0].set_ylabel('Frecuencia (Hz)')
+    axes[1,0].set_xticks(range(len(agujeros_relevantes)))
+    axes[1,0].set_xticklabels([f'Agujero {i}' for i in agujeros_relevantes])
+    axes[1,0].legend()
+    axes[1,0].grid(True, alpha=0.3)
+
+    # 4. Análisis de resonancia
+    diferencias_resonancia = [abs(fc - frecuencia_base) for fc in frecuencias_corte]
+    mejores_agujeros = np.argsort(diferencias_resonancia)[:3]  # Top 3 más cercanos
+
+    axes[1,1].bar(range(len(diferencias_resonancia)), diferencias_resonancia,
+                 color=['green' if i in mejores_agujeros else 'gray'
+                        for i in range(len(diferencias_resonancia))])
+
+    for i, diff in enumerate(diferencias_resonancia):
+        axes[1,1].text(i, diff + 5, f'{diff:.0f}Hz', ha='center', va='bottom')
+
+    axes[1,1].set_title('DIFERENCIA CON FRECUENCIA DEL INSTRUMENTO')
+    axes[1,1].set_ylabel('Diferencia (Hz)')
+    axes[1,1].set_xticks(range(len(agujeros_relevantes)))
+    axes[1,1].set_xticklabels([f'Agujero {i}' for i in agujeros_relevantes])
+    axes[1,1].grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    plt.show()
+
+    # --- RESULTADOS ---
+    print(f"\n⏱️  Tiempo de simulación: {time.time() - start_time:.2f} segundos")
+
+    print(f"\n🎯 AGUJEROS CON MEJOR RESONANCIA:")
+    for idx in mejores_agujeros:
+        agujero = agujeros_relevantes[idx]
+        diametro = diametros_relevantes[idx]
+        freq_corte = frecuencias_corte[idx]
+        diferencia = diferencias_resonancia[idx]
+
+        print(f"• Agujero {agujero} (Ø{diametro}mm): {freq_corte:.0f}Hz → Diferencia: {diferencia:.0f}Hz")
+
+    return sonidos_filtrados, frecuencias_corte
+
+
+# --- VISUALIZACIÓN ESPECTROGRAMA ---
+
+
+def visualizar_espectrograma(frecuencias, tiempos, espectrograma,
+                             frecuencia_maxima=1000, max_tramas=2000,
+                             titulo='ESPECTROGRAMA', ruta_salida=None):
+    """Dibuja en dB un espectrograma ``(tramas, frecuencias)`` de ``espectrograma``
+
+    Solo se leen las frecuencias hasta ``frecuencia_maxima`` y como mucho
+    ``max_tramas`` tramas equiespaciadas, así que un archivo mapeado en memoria
+    de horas de grabación no se carga entero.
+    """
+    plt = _pyplot()
+
+    columnas = frecuencias <= frecuencia_maxima
+    paso = max(1, -(-len(tiempos) // max_tramas))
+    potencia = np.asarray(espectrograma[::paso, :columnas.sum()])
+    potencia_db = 10 * np.log10(np.maximum(potencia, 1e-20))
+
+    fig, ax = plt.subplots(figsize=(12, 6))
+    malla = ax.pcolormesh(tiempos[::paso], frecuencias[columnas], potencia_db.T,
+                          shading='nearest', cmap='magma',
+                          vmin=potencia_db.max() - 100)
+    fig.colorbar(malla, ax=ax, label='Densidad espectral (dB)')
+    ax.set_title(titulo)
+    ax.set_xlabel('Tiempo (s)')
+    ax.set_ylabel('Frecuencia (Hz)')
+
+    plt.tight_layout()
+    _mostrar_o_guardar(plt, fig, ruta_salida)
+
+# --- VISUALIZACIÓN FRECUENCIAS MANTRICAS ---
+
+
+def visualizar_frecuencias_mantricas(ruta_salida=None):
+    """Visualiza las frecuencias de los mantras principales"""
+    plt = _pyplot()
+
+    frecuencias = analizar_frecuencias_mantricas()
+
+    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+
+    # 1. Frecuencias base comparativas
+    mantras = list(frecuencias.keys())
+    freq_bases = [f['frecuencia_base'] for f in frecuencias.values()]
+    colores = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#C9A0DC']
+
+    bars = ax1.bar(mantras, freq_bases, color=colores)
+    ax1.set_title('FRECUENCIAS BASE DE MANTRAS PRINCIPALES')
+    ax1.set_ylabel('Frecuencia (Hz)')
+    ax1.tick_params(axis='x', rotation=45)
+
+    for bar, mantra in zip(bars, mantras):
+        height = bar.get_height()
+        ax1.text(bar.get_x() + bar.get_width()/2., height + 5,
+                f'{frecuencias[mantra]["frecuencia_base"]} Hz',
+                ha='center', va='bottom')
+
+    # 2. Análisis espectral del OM
+    t, om_sound, freqs, fft = analisis_espectral_om()
+
+    ax2.plot(freqs[:2000], fft[:2000], 'b-', linewidth=1)
+    ax2.set_title('ESPECTRO DEL SONIDO OM (AUM)')
+    ax2.set_xlabel('Frecuencia (Hz)')
+    ax2.set_ylabel('Amplitud')
+    ax2.set_xlim(0, 1000)
+    ax2.grid(True, alpha=0.3)
+
+    # Marcar armónicos importantes
+    for harmonic in [136.1, 272.2, 408.3, 544.4]:
+        ax2.axvline(harmonic, color='red', linestyle='--', alpha=0.7)
+        ax2.text(harmonic, np.max(fft[:2000])*0.8, f'{harmonic} Hz',
+                rotation=90, va='top', ha='right')
+
+    # 3. Relación entre frecuencias mantricas
+    # Mostrar cómo se relacionan matemáticamente
+    frecuencias_especiales = [108, 136.1, 144, 432]
+    nombres = ['SO-HAM', 'OM', 'GAYATRI', 'OM 432Hz']
+    relaciones = []
+
+    for i in range(len(frecuencias_especiales)):
+        for j in range(i+1, len(frecuencias_especiales)):
+            ratio = frecuencias_especiales[i] / frecuencias_especiales[j]
+            relaciones.append((nombres[i], nombres[j], ratio))
+
+    ax3.axis('off')
+    ax3.set_title('RELACIONES MATEMÁTICAS ENTRE FRECUENCIAS')
+    y_pos = 0.9
+    for rel in relaciones:
+        ax3.text(0.1, y_pos, f"{rel[0]} / {rel[1]} = {rel[2]:.3f}",
+                fontsize=10, transform=ax3.transAxes)
+        y_pos -= 0.1
+
+    # 4. Efectos por chakra
+    chakras = ['Raíz', 'Sacral', 'Plexo', 'Corazón', 'Garganta', 'Tercer Ojo', 'Coronilla']
+    frecuencias_chakras = [256, 288, 320, 341.3, 384, 432, 480]
+    colores_chakras = ['red', 'orange', 'yellow', 'green', 'blue', 'indigo', 'violet']
+
+    ax4.scatter(frecuencias_chakras, range(7), s=100, c=colores_chakras)
+    ax4.set_yticks(range(7))
+    ax4.set_yticklabels(chakras)
+    ax4.set_xlabel('Frecuencia (Hz)')
+    ax4.set_title('FRECUENCIAS ASOCIADAS A CHAKRAS')
+    ax4.grid(True, alpha=0.3)
+
+    for i, (freq, chakra) in enumerate(zip(frecuencias_chakras, chakras)):
+        ax4.text(freq + 10, i, f'{freq} Hz', va='center')
+
+    plt.tight_layout()
+    _mostrar_o_guardar(plt, fig, ruta_salida)
+
+    return frecuencias
+
+
+def simular_estado_meditativo():
+    """Simula el efecto del OM en ondas cerebrales"""
+    plt = _pyplot()
+
+    # Parámetros de ondas cerebrales
+    tiempo = np.linspace(0, 10, 1000)
+
+    # Ondas normales (beta)
+    beta_waves = np.sin(2*np.pi*20*tiempo) + 0.5*np.sin(2*np.pi*40*tiempo)
+
+    # Ondas bajo influencia del OM (alpha/theta)
+    alpha_theta = (np.sin(2*np.pi*10*tiempo) +
+                  0.7*np.sin(2*np.pi*8*tiempo) +
+                  0.3*np.sin(2*np.pi*136.1/10*tiempo))  # OM influye en frecuencias más bajas
+
+    plt.figure(figsize=(12, 6))
+    plt.plot(tiempo, beta_waves, 'r-', alpha=0.7, label='Estado normal (Beta 20-40Hz)')
+    plt.plot(tiempo, alpha_theta, 'b-', alpha=0.7, label='Estado meditativo (Alpha/Theta 8-12Hz)')
+    plt.title('TRANSICIÓN DE ONDAS CEREBRALES POR EFECTO DEL OM')
+    plt.xlabel('Tiempo (segundos)')
+    plt.ylabel('Amplitud')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    plt.show()
+
+
+# --- VISUALIZACIÓN SONIDO ANTIGUO ---
+
+
+def visualizar_sonido_antiguo():
+    """Visualiza capacidades de sonido antiguo"""
+    plt = _pyplot()
+
+    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+
+    # 1. Instrumentos antiguos
+    instrumentos = simular_instrumentos_antiguos()
+    names = list(instrumentos.keys())
+    duraciones = [inst['duracion'] for inst in instrumentos.values()]
+    frec_medias = [np.mean(inst['frecuencia_range'])
+                   for inst in instrumentos.values()]
+
+    bars = ax1.bar(names, duraciones, color='skyblue')
+    ax1.set_title('DURACIÓN DE SONIDO POR INSTRUMENTO ANTIGUO')
+    ax1.set_ylabel('Duración (segundos)')
+    ax1.tick_params(axis='x', rotation=45)
+
+    # 2. Frecuencias de levitación
+    frecuencias, fuerza = simular_levitacion_acustica()
+    ax2.plot(frecuencias, fuerza, 'r-o', linewidth=2, markersize=8)
+    ax2.fill_between(frecuencias, fuerza, alpha=0.3, color='red')
+    ax2.set_title('EFICIENCIA LEVITACIÓN ACÚSTICA vs FRECUENCIA')
+    ax2.set_xlabel('Frecuencia (Hz)')
+    ax2.set_ylabel('Fuerza relativa de levitación')
+    ax2.grid(True, alpha=0.3)
+    ax2.axvspan(20, 40, alpha=0.2, color='green', label='Óptimo levitación')
+    ax2.legend()
+
+    # 3. Amplificación por sistemas
+    sistemas = sistemas_amplificacion()
+    sist_names = list(sistemas.keys())
+    amplificaciones = [sist['amplificacion'] for sist in sistemas.values()]
+
+    ax3.bar(sist_names, amplificaciones, color='lightgreen')
+    ax3.set_title('AMPLIFICACIÓN POR SISTEMAS ANTIGUOS')
+    ax3.set_ylabel('Factor de amplificación')
+    ax3.tick_params(axis='x', rotation=45)
+
+    # 4. Combinación óptima
+    # Mostrar cómo se podían combinar sistemas
+    frec_optimas = np.array([20, 25, 30, 35, 40, 45, 50])
+    fuerza_combinada = np.array([0.4, 0.7, 0.9, 0.95, 0.9, 0.7, 0.5])
+
+    ax4.plot(frec_optimas, fuerza_combinada, 's-', color='purple', linewidth=3)
+    ax4.set_title('EFECTO COMBINADO: INSTRUMENTO + AMPLIFICACIÓN + CÁMARA')
+    ax4.set_xlabel('Frecuencia (Hz)')
+    ax4.set_ylabel('Fuerza levitación efectiva')
+    ax4.grid(True, alpha=0.3)
+    ax4.axhline(0.8, linestyle='--', color='gray',
+                label='Umbral levitación práctica')
+    ax4.legend()
+
+    plt.tight_layout()
+    plt.show()
+
+    return instrumentos, sistemas
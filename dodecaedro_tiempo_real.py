@@ -0,0 +1,21 @@
+"""Benchmark del filtrado en tiempo real por los 12 agujeros del dodecaedro
+
+Las funciones de cálculo viven en el paquete ``dodecaedro_romano``; este script
+solo ejecuta la medición.
+"""
+
+from dodecaedro_romano.tibetano import benchmark_tiempo_real
+
+
+# --- EJECUTAR BENCHMARK ---
+def main():
+    print("🎵 FILTRADO EN TIEMPO REAL A TRAVÉS DEL DODECAEDRO")
+    print("🔊 Dung Chen medio por bloques, estado de filtros conservado")
+
+    for tamano_bloque in [64, 256, 1024]:
+        print()
+        benchmark_tiempo_real(tamano_bloque=tamano_bloque)
+
+
+if __name__ == '__main__':
+    main()
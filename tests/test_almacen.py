@@ -0,0 +1,51 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from dodecaedro_romano.almacen import AlmacenResultados
+
+
+def test_guardar_y_cargar(tmp_path):
+    almacen = AlmacenResultados(tmp_path)
+    huella = almacen.guardar({'frecuencia': 440}, datos=np.arange(5))
+    assert {'frecuencia': 440.0} in almacen
+    assert np.array_equal(almacen.cargar(huella)['datos'], np.arange(5))
+    assert [e.huella for e in almacen.buscar(frecuencia=440)] == [huella]
+
+
+def test_sobrescribir_sustituye_la_ejecucion(tmp_path):
+    almacen = AlmacenResultados(tmp_path)
+    huella = almacen.guardar({'f': 1}, datos=np.zeros(3))
+    almacen.guardar({'f': 1}, sobrescribir=True, datos=np.ones(3))
+    assert np.array_equal(almacen.cargar(huella)['datos'], np.ones(3))
+    # No quedan carpetas temporales ni apartadas
+    assert os.listdir(os.path.dirname(almacen.ruta(huella))) == [huella]
+
+
+def test_escritores_concurrentes_con_la_misma_huella(tmp_path):
+    def escribir(i):
+        return AlmacenResultados(tmp_path).guardar(
+            {'f': 1}, sobrescribir=True, datos=np.full(1000, i))
+
+    with ThreadPoolExecutor(8) as pool:
+        huellas = set(pool.map(escribir, range(32)))
+    almacen = AlmacenResultados(tmp_path)
+    (huella,) = huellas
+    datos = almacen.cargar(huella)['datos']
+    assert len(set(datos.tolist())) == 1
+    assert os.listdir(os.path.dirname(almacen.ruta(huella))) == [huella]
+
+
+def test_indice_reconstruido_por_otro_proceso(tmp_path):
+    escritor = AlmacenResultados(tmp_path)
+    for f in range(5):
+        escritor.guardar({'f': f}, datos=np.zeros(1))
+    escritor.guardar({'f': 0}, sobrescribir=True, datos=np.ones(1))
+
+    lector = AlmacenResultados(tmp_path)
+    assert len(lector) == 5
+    AlmacenResultados(tmp_path).reconstruir_indice()  # índice más corto
+    escritor.guardar({'f': 9}, datos=np.zeros(1))
+    assert len(lector) == 6
+    assert {'f': 9} in lector
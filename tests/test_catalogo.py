@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from dodecaedro_romano.catalogo import cargar_catalogo, diametros_por_artefacto
+
+
+def _escribir(ruta, texto):
+    ruta.write_text(texto, encoding='utf-8')
+    return ruta
+
+
+def test_csv_con_celdas_vacias(tmp_path):
+    ruta = _escribir(tmp_path / 'catalogo.csv',
+                     "artefacto, agujero, diametro, incertidumbre\n"
+                     "Tongeren, 0, 21.5, 0.2\n"
+                     "Tongeren, 1, 18.0,\n"
+                     "Tongeren, 2, , 0.3\n"
+                     "Kiel, 0, 20.1, 0.1\n")
+    catalogo = cargar_catalogo(ruta)
+    assert len(catalogo) == 3
+    assert catalogo['incertidumbre'].tolist() == [0.2, 0.0, 0.1]
+
+    artefactos, diametros = diametros_por_artefacto(catalogo)
+    assert artefactos.tolist() == ['Tongeren', 'Kiel']
+    assert diametros[0, :2].tolist() == [21.5, 18.0]
+    assert np.isnan(diametros[0, 2])
+
+
+def test_csv_rechaza_artefacto_demasiado_largo(tmp_path):
+    ruta = _escribir(tmp_path / 'catalogo.csv',
+                     "artefacto,agujero,diametro\n"
+                     "corto,0,20.0\n"
+                     f"{'x' * 30},1,20.0\n")
+    with pytest.raises(ValueError, match=r'catalogo\.csv, línea 3'):
+        cargar_catalogo(ruta)
+
+
+def test_csv_indica_la_linea_de_un_valor_invalido(tmp_path):
+    ruta = _escribir(tmp_path / 'catalogo.csv',
+                     "artefacto,agujero,diametro\n"
+                     "a,0,20.0\n"
+                     "a,,20.0\n")
+    with pytest.raises(ValueError, match=r'línea 3'):
+        cargar_catalogo(ruta)
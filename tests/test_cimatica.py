@@ -0,0 +1,56 @@
+import numpy as np
+
+from dodecaedro_romano import cimatica
+from dodecaedro_romano.cimatica import (calcular_tesela_cimatica,
+                                        simular_patrones_cimaticos)
+
+
+def test_patron_coincide_con_teselas_y_devuelve_arrays_modificables():
+    X, Y, patron = simular_patrones_cimaticos(None, 120, 'arena', 64)
+    assert X.flags.writeable and Y.flags.writeable and patron.flags.writeable
+    assert np.array_equal(patron, calcular_tesela_cimatica(120, 'arena', 64))
+    X[0, 0] = 99.0
+    assert simular_patrones_cimaticos(None, 120, 'arena', 64)[0][0, 0] == -2
+
+
+def test_resoluciones_grandes_no_se_cachean(monkeypatch):
+    monkeypatch.setattr(cimatica, '_RESOLUCION_MAXIMA_CACHE', 32)
+    cimatica._campo_cacheado.cache_clear()
+    cimatica._modulacion_cacheada.cache_clear()
+
+    _, _, patron = simular_patrones_cimaticos(None, 300, 'agua', 48)
+    assert cimatica._campo_cacheado.cache_info().currsize == 0
+    assert cimatica._modulacion_cacheada.cache_info().currsize == 0
+    assert np.array_equal(patron, calcular_tesela_cimatica(300, 'agua', 48))
+
+    simular_patrones_cimaticos(None, 300, 'agua', 32)
+    assert cimatica._campo_cacheado.cache_info().currsize == 1
+
+
+def _patron_original(frecuencia, medio, resolucion):
+    """Bucle de ``dodecaedro_cymatics.simular_patrones_cimaticos`` original"""
+    x = np.linspace(-2, 2, resolucion)
+    y = np.linspace(-2, 2, resolucion)
+    X, Y = np.meshgrid(x, y)
+    R = np.sqrt(X**2 + Y**2)
+    Theta = np.arctan2(Y, X)
+    patron = np.zeros_like(X)
+    for n in range(12):
+        angulo = n * np.pi/6
+        patron += np.cos(12*(Theta - angulo)) * np.exp(-R**2/0.5)
+    patron *= np.sin(2*np.pi*frecuencia*R/10)
+    resonancia = cimatica.PROPIEDADES_MEDIOS[medio]['resonancia']
+    if frecuencia > resonancia[0] and frecuencia < resonancia[1]:
+        patron *= 2.0
+    return X, Y, patron
+
+
+def test_patron_identico_al_bucle_original():
+    for frecuencia, medio in ((120, 'arena'), (30, 'arena'), (432, 'agua')):
+        originales = _patron_original(frecuencia, medio, 300)
+        for _ in range(2):
+            obtenidos = simular_patrones_cimaticos(None, frecuencia, medio, 300)
+            for original, obtenido in zip(originales, obtenidos):
+                assert np.array_equal(original, obtenido)
+        assert np.array_equal(originales[2],
+                              calcular_tesela_cimatica(frecuencia, medio, 300))
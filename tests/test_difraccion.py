@@ -0,0 +1,58 @@
+import os
+
+import numpy as np
+import pytest
+
+from dodecaedro_romano.catalogo import cargar_catalogo
+from dodecaedro_romano.difraccion import matriz_transferencia_real
+from dodecaedro_romano.geometria import (DIAMETROS_AGUJEROS_INFERIOR,
+                                         DIAMETROS_AGUJEROS_SUPERIOR)
+
+pytest.importorskip('scipy')
+
+
+def test_agujero_sin_medir_solo_afecta_a_su_fila_y_columna(tmp_path):
+    diametros = np.array([DIAMETROS_AGUJEROS_SUPERIOR
+                          + DIAMETROS_AGUJEROS_INFERIOR] * 2, dtype=float)
+    diametros[1, 3] = np.nan
+    ruta = tmp_path / 'catalogo.npy'
+    np.save(ruta, diametros)
+
+    H = matriz_transferencia_real([440.0, 1000.0],
+                                  diametros=cargar_catalogo(ruta))
+    assert H.shape == (2, 12, 12, 2)
+    assert not np.isnan(H[0]).any()
+
+    nan = np.isnan(H[1]).all(axis=-1)
+    esperado = np.zeros((12, 12), dtype=bool)
+    esperado[3, :] = esperado[:, 3] = True
+    assert np.array_equal(nan, esperado)
+    assert not np.isnan(H[1]).any(axis=-1)[~esperado].any()
+
+
+def test_catalogo_completo_igual_que_sin_catalogo():
+    diametros = np.array(DIAMETROS_AGUJEROS_SUPERIOR
+                         + DIAMETROS_AGUJEROS_INFERIOR, dtype=float)
+    frecuencias = [200.0, 2000.0]
+    assert np.allclose(matriz_transferencia_real(frecuencias, diametros=diametros),
+                       matriz_transferencia_real(frecuencias))
+
+
+def test_barrido_con_cache_reutiliza_y_amplia_la_entrada(tmp_path):
+    from dodecaedro_romano.difraccion import barrido_difraccion
+
+    frecuencias = np.linspace(100, 5000, 50)
+    ajustes = [1.0, 1.5]
+    _, directo = barrido_difraccion(frecuencias, ajustes=ajustes)
+    _, primero = barrido_difraccion(frecuencias, ajustes=ajustes,
+                                    cache=tmp_path)
+    assert np.array_equal(primero, directo)
+    # Una entrada por configuración, no por frecuencia
+    assert sum(len(archivos) for _, _, archivos in os.walk(tmp_path)) == 2
+
+    # Frecuencias solapadas: las viejas salen de la caché y las nuevas se añaden
+    otras = np.concatenate([frecuencias[::2], [6000.0, 7000.0]])
+    _, segundo = barrido_difraccion(otras, ajustes=ajustes, cache=tmp_path)
+    assert np.allclose(segundo, barrido_difraccion(otras, ajustes=ajustes)[1])
+    _, tercero = barrido_difraccion(otras, ajustes=ajustes, cache=tmp_path)
+    assert np.array_equal(tercero, segundo)
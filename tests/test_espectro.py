@@ -0,0 +1,84 @@
+import time
+
+import numpy as np
+import pytest
+
+from dodecaedro_romano.espectro import analizar_bandas, espectrograma
+
+
+def _bloques(senal, tamano):
+    for inicio in range(0, len(senal), tamano):
+        yield senal[inicio:inicio + tamano]
+
+
+def test_espectrograma_coincide_con_scipy(tmp_path):
+    signal = pytest.importorskip('scipy.signal')
+    senal = np.random.default_rng(0).standard_normal(20_000)
+    freqs, tiempos, espectro = espectrograma(
+        senal, 8000, tmp_path / 'e.npy', nperseg=512, tamano_bloque=3000)
+    f, t, sxx = signal.spectrogram(senal, 8000, window='hann', nperseg=512)
+    assert np.allclose(freqs, f) and np.allclose(tiempos, t)
+    assert np.allclose(espectro, sxx.T, rtol=1e-4, atol=1e-9)
+
+
+def test_espectrograma_rechaza_flujo_mas_largo(tmp_path):
+    pytest.importorskip('scipy')
+    senal = np.random.default_rng(0).standard_normal(50_000)
+    with pytest.raises(ValueError):
+        espectrograma(_bloques(senal, 4096), 8000, tmp_path / 'e.npy',
+                      nperseg=512, num_muestras=20_000)
+
+
+def test_espectrograma_rechaza_flujo_mas_corto(tmp_path):
+    pytest.importorskip('scipy')
+    senal = np.random.default_rng(0).standard_normal(10_000)
+    with pytest.raises(ValueError):
+        espectrograma(_bloques(senal, 4096), 8000, tmp_path / 'e.npy',
+                      nperseg=512, num_muestras=20_000)
+
+
+def _senal_bandas(fs=44100, duracion=5.0):
+    t = np.arange(int(fs * duracion)) / fs
+    ruido = np.random.default_rng(1).standard_normal(len(t))
+    return (np.sin(2 * np.pi * 136.13 * t) + 0.3 * np.sin(2 * np.pi * 544.47 * t)
+            + 0.5 * np.sin(2 * np.pi * 3000 * t) + 0.01 * ruido)
+
+
+def _rfft_rellenada(senal, fs, resolucion):
+    from scipy import fft, signal
+    senal = senal * signal.get_window('hann', len(senal))
+    return np.abs(fft.rfft(senal, n=int(round(fs / resolucion))))
+
+
+@pytest.mark.parametrize('resolucion', [0.1, 0.01])
+def test_analizar_bandas_coincide_con_rfft_rellenada(resolucion):
+    pytest.importorskip('scipy')
+    fs, senal = 44100, _senal_bandas()
+    referencia = _rfft_rellenada(senal, fs, resolucion)
+    bandas = analizar_bandas(senal, fs, [136.1, 544.4], ancho=4.0,
+                             resolucion=resolucion, ventana='hann')
+    for centro, pico in ((136.1, 136.13), (544.4, 544.47)):
+        frecuencias, magnitud = bandas[centro]
+        esperada = referencia[np.round(frecuencias / resolucion).astype(int)]
+        assert abs(frecuencias[magnitud.argmax()] - pico) <= resolucion
+        assert magnitud.argmax() == esperada.argmax()
+        assert magnitud.max() == pytest.approx(esperada.max(), rel=1e-3)
+        assert np.allclose(magnitud, esperada, atol=1e-3 * esperada.max())
+
+
+def test_analizar_bandas_mas_barato_que_rfft_rellenada():
+    pytest.importorskip('scipy')
+    fs, senal = 44100, _senal_bandas()
+    centros = [108.0, 136.1, 272.2, 432.0, 544.4]
+
+    def mejor(funcion):
+        tiempos = []
+        for _ in range(5):
+            inicio = time.perf_counter()
+            funcion()
+            tiempos.append(time.perf_counter() - inicio)
+        return min(tiempos)
+
+    zoom = mejor(lambda: analizar_bandas(senal, fs, centros, ventana='hann'))
+    rellenada = mejor(lambda: _rfft_rellenada(senal, fs, 0.1))
+    assert zoom < rellenada
@@ -0,0 +1,65 @@
+import numpy as np
+
+from dodecaedro_romano.fdtd import (SimuladorFDTD, pulso_ricker,
+                                    simular_fdtd_dodecaedro,
+                                    voxelizar_dodecaedro)
+
+
+def _energia(simulador):
+    """Energía discreta del esquema de salto de rana, Σp² + Σu⁻·u⁺/λ²
+
+    Avanza un paso para tener la velocidad en el semipaso siguiente.
+    """
+    presion = simulador.presion.astype(float)
+    anteriores = [u.astype(float) for u in simulador.velocidades]
+    simulador.ejecutar(1, (0, 0, 0), [])
+    cruzada = sum((a * b).sum() for a, b in zip(anteriores,
+                                                 simulador.velocidades))
+    return (presion**2).sum() + cruzada / float(simulador.lambda_)**2
+
+
+def test_hilos_y_planos_dan_el_mismo_resultado():
+    referencia = simular_fdtd_dodecaedro(puntos=40, pasos=200, hilos=1)
+    paralelo = simular_fdtd_dodecaedro(puntos=40, pasos=200, hilos=3)
+    assert np.abs(referencia['sondas']).max() > 0
+    assert np.array_equal(referencia['sondas'], paralelo['sondas'])
+    assert np.array_equal(referencia['presion_final'],
+                          paralelo['presion_final'])
+
+    solido, dx, origen = voxelizar_dodecaedro(40)
+    simuladores = [SimuladorFDTD(solido, dx, origen, hilos=hilos,
+                                 planos=planos)
+                   for hilos, planos in ((1, 2), (2, 3), (4, 1))]
+    for simulador in simuladores:
+        simulador.ejecutar(150, (20, 20, 20),
+                           pulso_ricker(4000, simulador.dt))
+    for simulador in simuladores[1:]:
+        assert np.array_equal(simulador.presion, simuladores[0].presion)
+
+
+def test_caja_rigida_conserva_la_energia():
+    solido = np.ones((24, 24, 24), dtype=bool)
+    solido[2:-2, 2:-2, 2:-2] = False
+    # Capa de un vóxel: solo amortigua la pared, donde todo es cero
+    simulador = SimuladorFDTD(solido, 1.0, capa=1.0)
+    pulso = pulso_ricker(20000, simulador.dt)
+    simulador.ejecutar(len(pulso), (10, 11, 12), pulso)
+
+    energias = []
+    for _ in range(10):
+        simulador.ejecutar(200, (10, 11, 12), [])
+        energias.append(_energia(simulador))
+    assert energias[0] > 0
+    assert np.allclose(energias, energias[0], rtol=1e-5)
+    assert np.all(simulador.presion[solido] == 0)
+
+
+def test_el_dodecaedro_abierto_pierde_energia_por_los_agujeros():
+    solido, dx, origen = voxelizar_dodecaedro(40)
+    simulador = SimuladorFDTD(solido, dx, origen)
+    pulso = pulso_ricker(4000, simulador.dt)
+    simulador.ejecutar(len(pulso), simulador.indice([0, 0, 0]), pulso)
+    inicial = _energia(simulador)
+    simulador.ejecutar(3000, (0, 0, 0), [])
+    final = _energia(simulador)
+    assert np.isfinite(final) and 0 < final < inicial
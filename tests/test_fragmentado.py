@@ -0,0 +1,64 @@
+import os
+
+import numpy as np
+import pytest
+
+from dodecaedro_romano import fragmentado
+from dodecaedro_romano.fragmentado import ArregloFragmentado
+
+
+def _crear(ruta):
+    arreglo = ArregloFragmentado.crear(ruta, (0, 6), (4, 3), dtype=np.float64)
+    referencia = np.arange(60, dtype=float).reshape(10, 6)
+    arreglo.anexar(referencia)
+    arreglo.flush()
+    return arreglo, referencia
+
+
+def test_anexar_y_leer_cortes(tmp_path):
+    arreglo, referencia = _crear(tmp_path / 'a')
+    bloque = np.ones((3, 6))
+    arreglo.anexar(bloque)
+    referencia = np.concatenate([referencia, bloque])
+    arreglo.anexar(np.full((13, 2), 7.0), eje=1)
+    referencia = np.concatenate([referencia, np.full((13, 2), 7.0)], axis=1)
+    arreglo.flush()
+
+    lector = ArregloFragmentado(tmp_path / 'a')
+    for clave in (np.s_[:], np.s_[2:11:3, 1:], np.s_[-1], np.s_[..., 6],
+                  np.s_[::-2, ::2]):
+        assert np.array_equal(lector[clave], referencia[clave])
+
+
+def test_escritura_interrumpida_no_altera_fragmentos_existentes(tmp_path,
+                                                                monkeypatch):
+    arreglo, referencia = _crear(tmp_path / 'a')
+    arreglo[1:9, :] = -1.0  # toca seis fragmentos existentes
+
+    original = fragmentado._escribir_atomico
+    escritos = []
+
+    def fallar_en_el_tercero(ruta, escribir):
+        if len(escritos) == 2:
+            raise KeyboardInterrupt
+        escritos.append(ruta)
+        original(ruta, escribir)
+
+    monkeypatch.setattr(fragmentado, '_escribir_atomico', fallar_en_el_tercero)
+    with pytest.raises(KeyboardInterrupt):
+        arreglo.flush()
+    monkeypatch.undo()
+
+    assert np.array_equal(ArregloFragmentado(tmp_path / 'a')[:], referencia)
+
+
+def test_flush_publica_la_nueva_version_y_borra_la_anterior(tmp_path):
+    arreglo, referencia = _crear(tmp_path / 'a')
+    arreglo[0, 0] = 100.0
+    arreglo.flush()
+    referencia[0, 0] = 100.0
+
+    assert np.array_equal(ArregloFragmentado(tmp_path / 'a')[:], referencia)
+    archivos = os.listdir(tmp_path / 'a' / 'fragmentos')
+    assert sorted(archivos) == sorted(
+        ['0.0~1.npy', '0.1.npy', '1.0.npy', '1.1.npy', '2.0.npy', '2.1.npy'])
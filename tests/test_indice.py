@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from dodecaedro_romano.calibracion import (DIAMETROS_AGUJEROS,
+                                           INSTRUMENTOS_ANTIGUOS,
+                                           encontrar_correspondencias)
+from dodecaedro_romano.catalogo import crear_catalogo
+from dodecaedro_romano.indice import (IndiceOrdenado, IndiceResonancias,
+                                      obtener_indice_resonancias)
+
+
+def _fuerza_bruta(valores, centro, tolerancia, estricto=False):
+    """Bucle directo: posiciones dentro de la tolerancia, por error y posición"""
+    errores = [abs(centro - valor) for valor in valores]
+    dentro = [i for i, error in enumerate(errores)
+              if (error < tolerancia if estricto else error <= tolerancia)]
+    return sorted(dentro, key=lambda i: (errores[i], i))
+
+
+def _valores(n=2000, semilla=0):
+    # Rejilla de 0.5 mm con repetidos, para que haya coincidencias en el borde
+    return np.random.default_rng(semilla).integers(10, 60, n) * 0.5
+
+
+@pytest.mark.parametrize('estricto', [False, True])
+def test_consultar_coincide_con_fuerza_bruta(estricto):
+    valores = _valores()
+    indice = IndiceOrdenado(valores)
+    for centro in (5.0, 12.5, 17.3, 29.5, 40.0):
+        indices, errores = indice.consultar(centro, 0.5, estricto)
+        esperados = _fuerza_bruta(valores, centro, 0.5, estricto)
+        assert indices.tolist() == esperados
+        assert np.allclose(errores, np.abs(centro - valores[esperados]))
+
+
+@pytest.mark.parametrize('estricto', [False, True])
+def test_consultar_lote_coincide_con_fuerza_bruta(estricto):
+    valores = _valores()
+    centros = np.concatenate([_valores(200, semilla=1),
+                              np.random.default_rng(2).uniform(0, 35, 200)])
+    tolerancias = np.random.default_rng(3).choice([0.0, 0.25, 0.5, 1.0],
+                                                  len(centros))
+    indice = IndiceOrdenado(valores)
+    desplazamientos, indices, errores = indice.consultar_lote(
+        centros, tolerancias, estricto)
+
+    assert len(desplazamientos) == len(centros) + 1
+    for q, (centro, tolerancia) in enumerate(zip(centros, tolerancias)):
+        tramo = slice(desplazamientos[q], desplazamientos[q + 1])
+        esperados = _fuerza_bruta(valores, centro, tolerancia, estricto)
+        assert indices[tramo].tolist() == esperados
+        assert np.array_equal(errores[tramo],
+                              np.abs(centro - valores[esperados]))
+
+
+def test_encontrar_correspondencias_coincide_con_bucles():
+    rng = np.random.default_rng(4)
+    instrumentos = {f'I{j}': {'diametro_tubo': float(d)}
+                    for j, d in enumerate(rng.integers(16, 50, 500) * 0.5)}
+    diametros = (rng.integers(16, 50, 100) * 0.5).tolist() + DIAMETROS_AGUJEROS
+
+    for tabla in (None, instrumentos):
+        resultado = encontrar_correspondencias(diametros, tabla)
+        tabla = INSTRUMENTOS_ANTIGUOS if tabla is None else tabla
+        for i, diametro in enumerate(diametros):
+            esperados = sorted(
+                ((nombre, datos, abs(diametro - datos['diametro_tubo']))
+                 for nombre, datos in tabla.items()
+                 if abs(diametro - datos['diametro_tubo']) <= 0.5),
+                key=lambda x: x[2])
+            assert resultado[i] == (i, diametro, esperados)
+
+
+@pytest.mark.parametrize('orden', ['ajuste', 'agujero'])
+def test_indice_resonancias_coincide_con_fuerza_bruta(orden):
+    indice = IndiceResonancias(velocidad=340000)
+    frecuencias = 340000 / (2 * np.array(indice.diametros))
+    objetivos = np.concatenate([np.linspace(5000, 35000, 400), frecuencias])
+    desplazamientos, agujeros, diferencias = indice.consultar(
+        objetivos, 800.0, estricto=True, orden=orden)
+
+    for q, objetivo in enumerate(objetivos):
+        tramo = slice(desplazamientos[q], desplazamientos[q + 1])
+        esperados = _fuerza_bruta(frecuencias, objetivo, 800.0, estricto=True)
+        if orden == 'agujero':
+            esperados = sorted(esperados)
+        assert agujeros[tramo].tolist() == esperados
+        assert np.allclose(diferencias[tramo],
+                           np.abs(objetivo - frecuencias[esperados]))
+
+
+def test_indice_resonancias_acepta_catalogo():
+    catalogo = crear_catalogo('A', [0, 1, 2, 3], [10.0, 20.0, 20.0, 40.0])
+    indice = IndiceResonancias(catalogo)
+    desplazamientos, agujeros, _ = indice.consultar([8575.0, 4287.5], 1.0)
+    assert desplazamientos.tolist() == [0, 2, 3]
+    assert agujeros.tolist() == [1, 2, 3]
+    assert obtener_indice_resonancias() is obtener_indice_resonancias()
@@ -0,0 +1,63 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from dodecaedro_romano import modal
+from dodecaedro_romano.modal import (calcular_modos, ensamblar, obtener_modos,
+                                     resolver_modos)
+
+pytest.importorskip('scipy')
+
+
+def test_amplitud_agujeros_sin_cuello_da_nan():
+    # A 6 elementos de ancho los agujeros 4 y 7 no tienen nodos de cuello
+    modos = calcular_modos(num_modos=4, puntos=6)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        amplitud = modos.amplitud_agujeros()
+    assert amplitud.shape == (4, 12)
+    vacios = np.bincount(modos.cuellos + 1, minlength=13)[1:] == 0
+    assert vacios.any()
+    assert np.isnan(amplitud[:, vacios]).all()
+    assert np.isfinite(amplitud[:, ~vacios]).all()
+
+
+def _malla_caja(n, lado):
+    """Conectividad y nodos de una caja de n³ hexaedros de lado ``lado``"""
+    celdas = np.stack(np.meshgrid(*[np.arange(n)] * 3, indexing='ij'),
+                      axis=-1).reshape(-1, 3)
+    esquinas = np.stack(np.meshgrid([0, 1], [0, 1], [0, 1], indexing='ij'),
+                        axis=-1).reshape(8, 3)
+    conectividad = np.ravel_multi_index(
+        (celdas[:, None, :] + esquinas).reshape(-1, 3).T,
+        (n + 1,) * 3).reshape(-1, 8)
+    return conectividad, (n + 1)**3, lado / n
+
+
+def test_caja_rigida_reproduce_modos_analiticos():
+    velocidad, lado = 343000, 100.0
+    conectividad, num_nodos, h = _malla_caja(14, lado)
+    rigidez, masa = ensamblar(conectividad, num_nodos, h)
+    frecuencias, formas = resolver_modos(rigidez, masa, 11, velocidad)
+
+    # c/2L·√(l² + m² + n²): 0, (1,0,0)×3, (1,1,0)×3, (1,1,1), (2,0,0)×3
+    indices = np.array([0, 1, 1, 1, 2, 2, 2, 3, 4, 4, 4])
+    analiticas = velocidad / (2 * lado) * np.sqrt(indices)
+    assert frecuencias[0] == pytest.approx(0, abs=1e-3)
+    assert np.allclose(frecuencias[1:], analiticas[1:], rtol=1e-2)
+    # Formas M-ortonormales
+    assert np.allclose(formas.T @ masa @ formas, np.eye(11), atol=1e-8)
+
+
+def test_cache_en_disco_devuelve_los_mismos_modos(tmp_path, monkeypatch):
+    primero = obtener_modos(num_modos=6, puntos=12, cache=tmp_path)
+    assert obtener_modos(num_modos=6, puntos=12) is primero
+
+    # Sin la caché en memoria los modos tienen que salir del disco
+    modal._modos_cacheados.cache_clear()
+    monkeypatch.setattr(modal, 'resolver_modos', None)
+    segundo = obtener_modos(num_modos=6, puntos=12, cache=tmp_path)
+    assert np.array_equal(segundo.frecuencias, primero.frecuencias)
+    assert np.array_equal(segundo.formas, primero.formas)
+    assert np.array_equal(segundo.cuellos, primero.cuellos)
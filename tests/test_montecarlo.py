@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from dodecaedro_romano.montecarlo import (prueba_significancia,
+                                          simular_tolerancias)
+
+
+def _iguales(a, b):
+    for clave in ('coincidencias', 'error_medio', 'fraccion_por_agujero',
+                  'distribucion'):
+        assert np.array_equal(a[clave], b[clave], equal_nan=True)
+
+
+@pytest.mark.parametrize('tamano_lote, procesos', [(5_000, 1), (20_000, 2),
+                                                   (1_000_000, 2)])
+def test_simular_tolerancias_no_depende_de_lotes_ni_procesos(tamano_lote,
+                                                             procesos):
+    referencia = simular_tolerancias(45_000, semilla=7, tamano_lote=10_000)
+    resultado = simular_tolerancias(45_000, semilla=7,
+                                    tamano_lote=tamano_lote, procesos=procesos)
+    _iguales(referencia, resultado)
+
+
+def test_simular_tolerancias_semilla_y_prefijo():
+    base = simular_tolerancias(25_000, semilla=3)
+    mas_largo = simular_tolerancias(40_000, semilla=3)
+    otra = simular_tolerancias(25_000, semilla=4)
+    assert np.array_equal(base['coincidencias'],
+                          mas_largo['coincidencias'][:25_000])
+    assert not np.array_equal(base['coincidencias'], otra['coincidencias'])
+    assert base['distribucion'].sum() == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize('modelo', ['uniforme', 'permutacion'])
+def test_prueba_significancia_no_depende_de_lotes_ni_procesos(modelo):
+    pytest.importorskip('scipy')
+    referencia = prueba_significancia(35_000, modelo, semilla=11,
+                                      tamano_lote=10_000)
+    for tamano_lote, procesos in ((3_000, 1), (20_000, 2), (100_000, 2)):
+        resultado = prueba_significancia(35_000, modelo, semilla=11,
+                                         tamano_lote=tamano_lote,
+                                         procesos=procesos)
+        assert resultado['valor_p'] == referencia['valor_p']
+        assert resultado['intervalo'] == referencia['intervalo']
+        assert np.array_equal(resultado['distribucion_nula'],
+                              referencia['distribucion_nula'])
+
+
+def test_prueba_significancia_valor_p():
+    pytest.importorskip('scipy')
+    # Sin coincidencias posibles en los nulos: k = 0
+    resultado = prueba_significancia(1_000, 'uniforme', agujeros=[10.0],
+                                     instrumentos=[10.0, 30.0], tolerancia=0.0,
+                                     resolucion=0)
+    assert resultado['observado'] == 1
+    assert resultado['excedencias'] == 0
+    assert resultado['valor_p'] == 1 / 1_001
+    inferior, superior = resultado['intervalo']
+    assert inferior == 0.0 and 0 < superior < 0.01
+    assert resultado['distribucion_nula'].sum() == pytest.approx(1.0)
@@ -0,0 +1,34 @@
+import numpy as np
+
+from dodecaedro_romano.registro import RegistroInstrumentos, obtener_registro
+
+
+def test_misma_cultura_mismo_codigo_en_todas_las_tablas():
+    registro = obtener_registro()
+    afinacion = registro.filas('afinacion')
+    calibracion = registro.filas('calibracion')
+    tibetano = registro.filas('tibetano')
+
+    codigos = {}
+    for filas in (afinacion, calibracion, tibetano):
+        for fila in range(len(registro))[filas]:
+            codigos.setdefault(registro.cultura(fila), set()).add(
+                int(registro.culturas[fila]))
+    assert all(len(c) == 1 for c in codigos.values())
+
+    # Las dos tablas de instrumentos antiguos cubren las mismas culturas
+    assert (set(registro.culturas[afinacion])
+            == set(registro.culturas[calibracion]))
+    assert len(registro.nombres_culturas) == len(set(registro.nombres_culturas))
+    assert set(registro.culturas[tibetano]) == {
+        registro.nombres_culturas.index('Tibet')}
+
+
+def test_grafias_unificadas():
+    registro = RegistroInstrumentos([
+        ('a', {'x': {'culture': 'Celtic'}, 'y': {'culture': 'Hindu'}}, None),
+        ('b', {'z': {'cultura': 'Celta'}, 'w': {'cultura': 'Hindú'}}, None),
+        ('c', {'v': {}}, None),
+    ])
+    assert registro.nombres_culturas == ['Celta', 'Hindú']
+    assert np.array_equal(registro.culturas, [0, 1, 0, 1, -1])
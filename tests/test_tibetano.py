@@ -0,0 +1,18 @@
+import numpy as np
+import pytest
+
+from dodecaedro_romano.tibetano import ProcesadorAgujerosTiempoReal
+
+pytest.importorskip('scipy')
+
+
+def test_estadisticas_latencia_sin_bloques():
+    procesador = ProcesadorAgujerosTiempoReal()
+    estadisticas = procesador.estadisticas_latencia()
+    assert estadisticas['bloques'] == 0
+    assert np.isnan(estadisticas['p99'])
+
+    procesador.procesar(np.zeros(64))
+    assert procesador.estadisticas_latencia()['bloques'] == 1
+    procesador.reiniciar()
+    assert procesador.estadisticas_latencia()['bloques'] == 0